@@ -6,30 +6,51 @@
 
 #--------------------------------------------------------------------------------------------
 
-from typing import Any
+from typing import Any, Callable
 
-from avl_node import AvlNode
+from avl_node import AvlNode, KeyedAvlNode, KeyedSizedAvlNode, SizedAvlNode
+from bst_tree import BinarySearchTree
+from operation_log import (OP_DELETE, OP_DUPLICATE, OP_INSERT, OP_MISSING, OP_ROTATE_LEFT,
+                           OP_ROTATE_RIGHT, OperationLog)
 
-class AVLTree:
-    """Represents an AVL tree.
+class AVLTree(BinarySearchTree):
+    """Represents an AVL tree used as an ordered key -> payload map.
+
+    Lookups (`get`, `in`, `[]`, `floor`, `ceiling`, `min`, `max`) are inherited from BinarySearchTree,
+    as are `rank`, `select` and `count_range` when the tree keeps order statistics.
 
     Args:
         root (AvlNode): A reference to the optional root node of the AVL tree
+        log_capacity (int): Number of recent operations to keep in the log; 0 disables logging
+        order_statistics (bool): Use SizedAvlNode and keep subtree sizes up to date
+        stats (bool): Collect TreeStats counters (comparisons, rotations, retrace depth, latency)
+        key (callable): Order keys by `key(k)`, computed once per inserted key (see BinarySearchTree)
 
     Attributes:
         root (AvlNode): A reference to the optional root node of the AVL tree
+        size (int): Number of keys stored in the tree
         rotation_count (int): Counter for rotations performed
-        log (list): log of operations performed
+        log (OperationLog): Ring buffer of recent operations, or None when logging is off
+        stats (TreeStats): Hot-path counters, or None when statistics are off
     """
-    def __init__(self, root: AvlNode=None):
+    def __init__(self, root: AvlNode=None, log_capacity: int=0, order_statistics: bool=False,
+                 stats: bool=False, key: Callable[[Any], Any]=None):
         """Initializes an AVL Tree with an optional root node.
 
         Args:
             root: The root node of the AVL tree. Defaults to `None`
+            log_capacity: Number of recent operations to keep in the log. Defaults to 0 (off)
+            order_statistics: Maintain subtree sizes for rank/select. Defaults to False
+            stats: Collect TreeStats counters. Defaults to False
+            key: Function deriving each key's sort key. Defaults to None (keys compare directly)
         """
-        self.root = root
+        super().__init__(root, order_statistics, stats, key)
+        if key is None:
+            self._node_class = SizedAvlNode if order_statistics else AvlNode
+        else:
+            self._node_class = KeyedSizedAvlNode if order_statistics else KeyedAvlNode
         self.rotation_count = 0
-        self.log = []
+        self.log = OperationLog(log_capacity) if log_capacity else None
 
     @staticmethod
     def get_height(node: AvlNode) -> int:
@@ -45,6 +66,11 @@ class AVLTree:
             return -1         # Conventionally -1 for a null node, 0 for a leaf
         return node.height    # Otherwise, return the node's height
 
+    @property
+    def height(self) -> int:
+        """Height of the tree (-1 when empty), read from the root in O(1)."""
+        return self.get_height(self.root)
+
     def update_height(self, node: AvlNode) -> None:
         """Update the height of a node and its ancestors.
 
@@ -82,7 +108,8 @@ class AVLTree:
             AvlNode: The new root of the rotated subtree.
         """
         self.rotation_count += 1
-        self.log.append(f"Left rotation on node {node.value}")
+        if self.log is not None:
+            self.log.record(OP_ROTATE_LEFT, self._reported(node))
         pivot = node.right  # Set the right child of node as new root (pivot)
         node.right = pivot.left  # Set the left child of pivot as node's right child
         if pivot.left:  # If pivot has left child
@@ -96,8 +123,12 @@ class AVLTree:
             node.parent.right = pivot  # pivot replaces node as right child
         pivot.left = node  # Set node as pivot's left child
         node.parent = pivot  # Set node's parent as pivot
-        self.update_height(node)  # Update heights after rotation
-        self.update_height(pivot)
+        # Only node and pivot changed height; the caller retraces the ancestors if needed
+        node.height = 1 + max(self.get_height(node.left), self.get_height(node.right))
+        pivot.height = 1 + max(node.height, self.get_height(pivot.right))
+        if self.order_statistics:  # Sizes are local too: pivot now covers node's old subtree
+            self._pull_size(node)
+            self._pull_size(pivot)
         return pivot
 
     def right_rotate(self, node: AvlNode) -> AvlNode:
@@ -110,7 +141,8 @@ class AVLTree:
             AvlNode: The new root of the rotated subtree.
         """
         self.rotation_count += 1  # Increment rotation counter
-        self.log.append(f"Right rotation on node {node.value}")  # Log the rotation
+        if self.log is not None:  # Log the rotation
+            self.log.record(OP_ROTATE_RIGHT, self._reported(node))
         pivot = node.left  # Set the left child of node as new root (pivot)
         node.left = pivot.right  # Set the right child of pivot as node's left child
         if pivot.right:  # If pivot has right child
@@ -124,54 +156,249 @@ class AVLTree:
             node.parent.left = pivot  # pivot replaces node as left child
         pivot.right = node  # Set node as pivot's right child
         node.parent = pivot  # Set node's parent as pivot
-        self.update_height(node)  # Update heights after rotation
-        self.update_height(pivot)
+        # Only node and pivot changed height; the caller retraces the ancestors if needed
+        node.height = 1 + max(self.get_height(node.left), self.get_height(node.right))
+        pivot.height = 1 + max(self.get_height(pivot.left), node.height)
+        if self.order_statistics:  # Sizes are local too: pivot now covers node's old subtree
+            self._pull_size(node)
+            self._pull_size(pivot)
         return pivot  # Return the new subtree root (pivot)
 
+    def _rebalance(self, node: AvlNode) -> AvlNode:
+        """Rotates `node` if it is unbalanced (single or double rotation).
+
+        Args:
+            node (AvlNode): A node whose children have correct heights.
+
+        Returns:
+            AvlNode: The root of the subtree after rotating (node itself if it was balanced).
+        """
+        balance = self.get_balance(node)  # Get the balance factor
+        if balance > 1:  # Left heavy
+            double = self.get_balance(node.left) < 0
+            if double:  # Left-Right case
+                self.left_rotate(node.left)  # Perform left rotation on the left child
+            if self.stats is not None:
+                self.stats.rotation(double)
+            return self.right_rotate(node)  # Perform right rotation on node
+        if balance < -1:  # Right heavy
+            double = self.get_balance(node.right) > 0
+            if double:  # Right-Left case
+                self.right_rotate(node.right)  # Perform right rotation on right child
+            if self.stats is not None:
+                self.stats.rotation(double)
+            return self.left_rotate(node)  # Perform left rotation on node
+        return node
+
     def update_balance(self, node):
-        """Update balance factors and perform rotations if needed."""
+        """Update heights and balance factors from `node` to the root, rotating where needed.
+
+        This always walks the full path; insert and delete use the early-terminating retrace instead.
+        """
         while node:  # Iterate until reaching the root
-            balance = self.get_balance(node)  # Get the balance factor
-            if balance > 1:  # Left heavy
-                if self.get_balance(node.left) < 0:  # Left-Right case
-                    node.left = self.left_rotate(node.left)  # Perform left rotation on the left child
-                node = self.right_rotate(node)  # Perform right rotation on node
-            elif balance < -1:  # Right heavy
-                if self.get_balance(node.right) > 0:  # Right-Left case
-                    node.right = self.right_rotate(node.right)  # Perform right rotation on right child
-                node = self.left_rotate(node)  # Perform left rotation on node
-            else:
-                node = node.parent  # Move up to the parent node
-
-    def insert(self, value: Any):
+            node.height = 1 + max(self.get_height(node.left), self.get_height(node.right))
+            if self.order_statistics:
+                self._pull_size(node)
+            node = self._rebalance(node).parent  # Move up from the (possibly new) subtree root
+
+    def _new_node(self, value: Any, payload: Any) -> AvlNode:
+        """Creates a detached AVL node for bulk building."""
+        return self._node_class(value, payload=payload)
+
+    def _finish_built_node(self, node: AvlNode, depth: int, max_depth: int) -> None:
+        """Sets a bulk-built node's height (and subtree size) from its children."""
+        node.height = 1 + max(self.get_height(node.left), self.get_height(node.right))
+        if self.order_statistics:
+            self._pull_size(node)
+
+    def _join_roots(self, left: AvlNode, node: AvlNode, right: AvlNode) -> AvlNode:
+        """Joins two detached AVL subtrees under `node` in O(|height difference|).
+
+        `node` is attached on the taller tree's inner spine at the first subtree no more than
+        one level taller than the shorter tree, which grows that subtree's height by exactly
+        one, so the insertion retrace restores balance.
+
+        Args:
+            left (AvlNode): Root of the subtree with the smaller keys (or None).
+            node (AvlNode): Detached node holding the separating key.
+            right (AvlNode): Root of the subtree with the larger keys (or None).
+
+        Returns:
+            AvlNode: The root of the joined subtree.
+        """
+        left_height, right_height = self.get_height(left), self.get_height(right)
+        if left_height > right_height + 1:  # Attach on the right spine of the left tree
+            parent, spine = None, left
+            while self.get_height(spine) > right_height + 1:
+                parent, spine = spine, spine.right
+            parent.right = node
+            node.left, node.right = spine, right
+        elif right_height > left_height + 1:  # Attach on the left spine of the right tree
+            parent, spine = None, right
+            while self.get_height(spine) > left_height + 1:
+                parent, spine = spine, spine.left
+            parent.left = node
+            node.left, node.right = left, spine
+        else:  # Heights within one: node becomes the root
+            parent = None
+            node.left, node.right = left, right
+        node.parent = parent
+        if node.left:
+            node.left.parent = node
+        if node.right:
+            node.right.parent = node
+        node.height = 1 + max(self.get_height(node.left), self.get_height(node.right))
+        if self.order_statistics:  # node and every spine node above it gained keys
+            self._resize_path(node)
+        if not parent:
+            return node
+        self.root = left if parent.right is node else right  # Scratch root for the rotations
+        self._retrace_insert(parent)
+        return self.root
+
+    def _retrace_insert(self, node: AvlNode) -> int:
+        """Walks up from the parent of a new leaf, updating heights and rebalancing.
+
+        After an insertion the walk can stop as soon as a subtree's height is unchanged,
+        and after the first (single or double) rotation, which restores the subtree's
+        pre-insert height.
+
+        Args:
+            node (AvlNode): The parent of the newly inserted node.
+
+        Returns:
+            int: The number of ancestors visited.
+        """
+        visited = 0
+        while node:
+            visited += 1
+            left_height = node.left.height if node.left else -1
+            right_height = node.right.height if node.right else -1
+            if left_height - right_height > 1 or right_height - left_height > 1:
+                self._rebalance(node)  # One rotation fixes the whole insertion
+                break
+            height = 1 + (left_height if left_height > right_height else right_height)
+            if height == node.height:  # Unchanged: nothing above can be affected
+                break
+            node.height = height
+            node = node.parent  # Move up to the parent node
+        return visited
+
+    def insert(self, value: Any, payload: Any=None):
         """Inserts a value into the AVL Tree, maintaining the AVL property.
 
+        Duplicate keys are ignored; use `tree[key] = payload` to replace a payload.
+
         Args:
-            value: The value to insert.
+            value: The value (key) to insert.
+            payload: Optional object mapped to the key.
         """
-        new_node = AvlNode(value)  # Create a new node
+        item = value
+        if self.key is not None:
+            value = self.key(item)  # Derived once; the node caches it
+        new_node = self._node_class(value, payload=payload)  # Create a new node
+        new_node.height = 0  # A leaf has height 0 inside the tree
+        if self.key is not None:
+            new_node.item = item
         if not self.root:  # If the tree is empty
             self.root = new_node  # The new node becomes the root
-            self.log.append(f"Inserted {value}, tree height: {self.get_height(self.root)}")  # Log the insertion
+            self.size += 1
+            if self.log is not None:  # Log the insertion
+                self.log.record(OP_INSERT, item, self.root.height)
             return
-        parent, current = None, self.root  # Start at the root
-        while current:  # Traverse the tree
+        parent, current, candidate = None, self.root, None  # Start at the root
+        while current:  # Traverse the tree, one comparison per level
             parent = current  # keep track of the parent
             if value < current.value:  # Go left
                 current = current.left
-            elif value > current.value:  # Go right
-                current = current.right
-            else:
-                self.log.append(f"Duplicated key {value} ignored.")
-                return  # Duplicate, do nothing
+            else:  # Go right; `candidate` is the largest key <= value seen so far
+                candidate, current = current, current.right
+        if self.stats is not None:
+            self.stats.descent(parent, checked=candidate is not None)  # Count the path before any rotation
+        if candidate is not None and not candidate.value < value:  # Equal to the closest smaller-or-equal key
+            if self.log is not None:
+                self.log.record(OP_DUPLICATE, item)
+            return  # Duplicate, do nothing
         new_node.parent = parent  # Set parent of the new node
-        if value < parent.value:  # Insert as left child
-            parent.left = new_node
-        else:  # Insert as right child
+        if parent is candidate:  # The descent last went right
             parent.right = new_node
-        self.update_height(new_node)  # Update heights after insertion
-        self.update_balance(new_node)  # Update balance factors and rotate if needed
-        self.log.append(f"Inserted {value}, tree height: {self.get_height(self.root)}")  # Log the insertion
+        else:  # Insert as left child
+            parent.left = new_node
+        self.size += 1
+        if self.order_statistics:  # Every ancestor gains one node, even above an early retrace stop
+            ancestor = parent
+            while ancestor:
+                ancestor.size += 1
+                ancestor = ancestor.parent
+        visited = self._retrace_insert(parent)  # Update heights and rotate if needed, stopping early
+        if self.stats is not None:
+            self.stats.retrace(visited)
+        if self.log is not None:  # Log the insertion
+            self.log.record(OP_INSERT, item, self.root.height)
+
+    def delete(self, value: Any) -> bool:
+        """Deletes a value from the AVL Tree, retracing and rebalancing towards the root.
+
+        Args:
+            value: The value (key) to delete.
+
+        Returns:
+            bool: True if the value was removed, False if it was not in the tree.
+        """
+        node = self._find_node(value)  # Locate the node to remove
+        if not node:
+            if self.log is not None:
+                self.log.record(OP_MISSING, value)
+            return False
+        if node.left and node.right:  # Two children: splice out the in-order successor
+            successor = self._min_node(node.right)
+            if successor.parent is not node:  # Successor sits deeper in the right subtree
+                retrace_from = successor.parent  # Its old parent loses a child
+                self._transplant(successor, successor.right)  # Lift successor's right subtree
+                successor.right = node.right  # Successor adopts node's right subtree
+                successor.right.parent = successor
+            else:  # Successor is node's right child
+                retrace_from = successor
+            self._transplant(node, successor)  # Successor takes node's place
+            successor.left = node.left  # Successor adopts node's left subtree
+            successor.left.parent = successor
+            successor.height = node.height
+        else:  # Zero or one child: lift the child into node's place
+            retrace_from = node.parent
+            self._transplant(node, node.left or node.right)
+        node.left = node.right = node.parent = None  # Detach the removed node
+        self.size -= 1
+        if self.order_statistics:  # The path from the splice point up lost one node
+            self._resize_path(retrace_from)
+        visited = self._retrace_delete(retrace_from)  # Rebalance the path back to the root
+        if self.stats is not None:
+            self.stats.retrace(visited)
+        if self.log is not None:  # Log the deletion
+            self.log.record(OP_DELETE, value, self.get_height(self.root))
+        return True
+
+    def _retrace_delete(self, node: AvlNode) -> int:
+        """Walks up from `node` after a deletion, updating heights and rotating unbalanced nodes.
+
+        A deletion can need a rotation at several levels, but the walk still stops as soon
+        as a subtree ends up with the height it had before the deletion.
+
+        Args:
+            node (AvlNode): The lowest node whose subtree lost a node.
+
+        Returns:
+            int: The number of ancestors visited.
+        """
+        visited = 0
+        while node:
+            visited += 1
+            old_height = node.height  # Height before the deletion
+            node.height = 1 + max(self.get_height(node.left), self.get_height(node.right))
+            node = self._rebalance(node)  # node is now the subtree's root
+            if node.height == old_height:  # Unchanged: ancestors are unaffected
+                break
+            node = node.parent  # Move up to the parent node
+        return visited
 
     def print_tree(self, node: AvlNode=None, level: int=0, prefix: str='Root:', visited=None) -> None:
         """Prints the AVL tree in a visually appealing format.
@@ -185,15 +412,19 @@ class AVLTree:
         # Ensure get_balance is called on the correct object (self)
         if node:    # If the current node is not None
             balance = self.get_balance(node)  # Get the balance factor of the node
-            print(' ' * (5 * level) + prefix + f"{node.value} (BF={balance})") # Print node value and balance factor
+            print(' ' * (5 * level) + prefix + f"{self._reported(node)} (BF={balance})") # Print node value and balance factor
             # Recursively call print_tree on left and right, passing self
             self.print_tree(node.left, level + 1, 'L----', visited) # Print left subtree
             self.print_tree(node.right, level + 1, 'R----', visited) # Print right subtree
 
     def print_log(self):
+        """Prints the retained log entries (formatted only now), rotation count and tree height."""
         print("\n--- AVL Tree Log ---")
-        for entry in self.log:  # Print each entry in the log
-            print(entry)
+        if self.log is None:
+            print("(logging disabled)")
+        else:
+            for entry in self.log.messages():  # Print each entry in the log
+                print(entry)
         print(f"Total Rotations: {self.rotation_count}")  # Print total rotations performed
         print(f"Final Tree Height: {self.get_height(self.root)}")  # Print final height of the tree
 
@@ -5,77 +5,260 @@
 # Course: Spr25_CS_034 CRN 39575
 
 #--------------------------------------------------------------------------------------------
-from typing import Any
+from typing import Any, Callable
 
-from red_black_node import RedBlackTreeNode
+from bst_tree import BinarySearchTree
+from operation_log import (DEFAULT_FORMATS, OP_DUPLICATE, OP_MISSING, OP_RECOLOR, OP_ROTATE_LEFT,
+                           OP_ROTATE_RIGHT, OperationLog)
+from red_black_node import (KeyedRedBlackTreeNode, KeyedSizedRedBlackTreeNode, RedBlackTreeNode,
+                            SizedRedBlackTreeNode)
+
+# Log messages specific to the Red-Black Tree
+LOG_FORMATS = {
+    **DEFAULT_FORMATS,
+    OP_DUPLICATE: "value {key} already exists. Insertion skipped.",
+    OP_MISSING: "value {key} not found. Deletion skipped.",
+}
 
 
 # RedBlackTree class - represents the Red-Black Tree structure
-class RedBlackTree:
-    """Represents a Red-Black Tree structure.
+class RedBlackTree(BinarySearchTree):
+    """Represents a Red-Black Tree structure used as an ordered key -> payload map.
+
+    Lookups (`get`, `in`, `[]`, `floor`, `ceiling`, `min`, `max`) are inherited from BinarySearchTree,
+    as are `rank`, `select` and `count_range` when the tree keeps order statistics.
+
+    Node heights are cached and updated incrementally, so `height` and `black_height` are
+    O(1) reads that are safe to poll on large trees.
 
     Attributes:
         root (RedBlackTreeNode): A reference to the optional root node of the Red-Black tree
-        rotation_count
-        log
+        size (int): Number of keys stored in the tree
+        black_height (int): Black nodes on every root-to-leaf path (0 for an empty tree)
+        rotation_count (int): Counter for rotations performed
+        log (OperationLog): Ring buffer of recent operations, or None when logging is off
+        stats (TreeStats): Hot-path counters, or None when statistics are off
     """
-    def __init__(self):
+    def __init__(self, log_capacity: int=0, order_statistics: bool=False, stats: bool=False,
+                 key: Callable[[Any], Any]=None):
         """
         Initializes an empty Red-Black Tree.
+
+        Args:
+            log_capacity (int): Number of recent operations to keep in the log. Defaults to 0 (off).
+            order_statistics (bool): Use SizedRedBlackTreeNode and keep subtree sizes up to date.
+            stats (bool): Collect TreeStats counters (comparisons, rotations, recolors, latency).
+            key (callable): Order keys by `key(k)`, computed once per inserted key (see BinarySearchTree).
         """
         # The root node of the tree, initially None (empty tree)
-        self.root = None
+        super().__init__(order_statistics=order_statistics, stats=stats, key=key)
+        if key is None:
+            self._node_class = SizedRedBlackTreeNode if order_statistics else RedBlackTreeNode
+        else:
+            self._node_class = KeyedSizedRedBlackTreeNode if order_statistics else KeyedRedBlackTreeNode
+        self.black_height = 0
         self.rotation_count = 0
-        self.log = []
+        self.log = OperationLog(log_capacity, LOG_FORMATS) if log_capacity else None
 
-    def insert(self, value: Any) -> None:
+    def insert(self, value: Any, payload: Any=None) -> None:
         """Inserts a new node with the given key into the Red-Black Tree.
 
+        Duplicate keys are ignored; use `tree[key] = payload` to replace a payload.
+
         Args:
-            value (Any): The value to be inserted into the tree.
+            value (Any): The value (key) to be inserted into the tree.
+            payload (Any): Optional object mapped to the key.
         """
         # Step 1: Perform standard BST insertion and color the new node red.
-        new_node = RedBlackTreeNode(value) # New nodes are always initially red
+        item = value
+        if self.key is not None:
+            value = self.key(item) # Derived once; the node caches it
+        new_node = self._node_class(value, payload=payload) # New nodes are always initially red
+        if self.key is not None:
+            new_node.item = item
 
         # Handle the case of an empty tree
         if not self.root:
             # If the tree is empty, the new node becomes the root
             self.root = new_node
-            new_node.color = "B" # Root node is always black
+            self.size += 1
+            new_node.red = False # Root node is always black
+            self.black_height = 1
             return
-        # Find the correct position for the new node using BST logic
+        # Find the correct position for the new node using BST logic, one comparison per level
         current = self.root
-        parent = None
+        parent = candidate = None
         while current:
             parent = current # Keep track of the parent
             if value < current.value:
                 current = current.left # Go left
-            elif value > current.value:
-                current = current.right # Go right
             else:
-                # Optional: Handle duplicate keys (e.g., ignore, update, raise error)
-                # In this version, we simply don't insert duplicates.
-                self.log.append(f"value {value} already exists. Insertion skipped.")
-                return
+                candidate, current = current, current.right # Go right; largest key <= value so far
+        if self.stats is not None:
+            self.stats.descent(parent, checked=candidate is not None) # Count the path before any rotation
+        if candidate is not None and not candidate.value < value:
+            # Optional: Handle duplicate keys (e.g., ignore, update, raise error)
+            # In this version, we simply don't insert duplicates.
+            if self.log is not None:
+                self.log.record(OP_DUPLICATE, item)
+            return
 
         # Link the new node to its parent
         new_node.parent = parent
-        if value < parent.value:
-            parent.left = new_node # Insert as left child
+        if parent is candidate:
+            parent.right = new_node # The descent last went right
         else:
-            parent.right = new_node # Insert as right child
+            parent.left = new_node # Insert as left child
+        self.size += 1
+        if self.order_statistics: # Every ancestor gains one node; rotations below keep sizes local
+            ancestor = parent
+            while ancestor:
+                ancestor.size += 1
+                ancestor = ancestor.parent
+        self._retrace_height(parent) # The new leaf may have made its ancestors taller
 
         # Step 2: Fix any Red-Black Tree violations caused by the insertion.
-        self._fix_insert(new_node)
+        levels = self._fix_insert(new_node)
+        if self.stats is not None:
+            self.stats.retrace(levels)
 
         # Step 3: Ensure the root is always black (final enforcement).
         # This handles the case where the root was initially inserted or
         # became red during balancing.
-        if self.root.is_red():
-             self.root.color = "B"
+        if self.root.red:
+             self.root.red = False
+
+
+    def _new_node(self, value: Any, payload: Any) -> RedBlackTreeNode:
+        """Creates a detached node for bulk building."""
+        return self._node_class(value, payload=payload)
 
+    def _finish_built_node(self, node: RedBlackTreeNode, depth: int, max_depth: int) -> None:
+        """Colors a bulk-built node: red on the deepest level, black elsewhere.
 
-    def _fix_insert(self, node: RedBlackTreeNode) -> None:
+        Every level above the deepest is full, so each path to a leaf crosses exactly
+        `max_depth` black nodes and no red node has a red child.
+        """
+        node.red = 0 < depth == max_depth
+        self._pull_height(node)
+        if self.order_statistics:
+            self._pull_size(node)
+
+    @property
+    def height(self) -> int:
+        """Height of the tree (-1 when empty), read from the cached root height in O(1)."""
+        return self.root.height if self.root else -1
+
+    @staticmethod
+    def _pull_height(node: RedBlackTreeNode) -> None:
+        """Recomputes a node's cached height from its children."""
+        left_height = node.left.height if node.left else -1
+        right_height = node.right.height if node.right else -1
+        node.height = 1 + (left_height if left_height > right_height else right_height)
+
+    def _retrace_height(self, node: RedBlackTreeNode) -> None:
+        """Refreshes cached heights from `node` upwards, stopping at the first unchanged one.
+
+        Everything below `node` must already be correct; above the first unchanged
+        height nothing can have changed.
+        """
+        while node:
+            old_height = node.height
+            self._pull_height(node)
+            if node.height == old_height:
+                break
+            node = node.parent
+
+    @staticmethod
+    def _inherit_cache(successor: RedBlackTreeNode, node: RedBlackTreeNode) -> None:
+        """Gives a successor moved into a deleted node's position that node's cached subtree data."""
+        successor.height = node.height
+
+    def _adopt(self, root: RedBlackTreeNode, size: int) -> None:
+        """Installs a detached subtree and measures its black height along the left spine.
+
+        Split and set-algebra results can be subtrees with a red root; blackening it keeps
+        every path's black count equal and restores the root-is-black property.
+        """
+        super()._adopt(root, size)
+        if root and root.red:
+            root.red = False
+        self.black_height = self._black_height(root)
+
+    @staticmethod
+    def _black_height(node: RedBlackTreeNode) -> int:
+        """Counts the black nodes on the left spine below (and including) `node`."""
+        black = 0
+        while node:
+            if not node.red:
+                black += 1
+            node = node.left
+        return black
+
+    def _join_roots(self, left: RedBlackTreeNode, node: RedBlackTreeNode,
+                    right: RedBlackTreeNode) -> RedBlackTreeNode:
+        """Joins two detached Red-Black subtrees under `node`.
+
+        `node` is attached red on the taller tree's inner spine, next to the first black
+        subtree whose black height equals the shorter tree's, which leaves black heights
+        intact; the insertion fixup then repairs any red-red violation. The black heights
+        are measured along the spines, so a join costs O(log n).
+
+        Args:
+            left (RedBlackTreeNode): Root of the subtree with the smaller keys (or None).
+            node (RedBlackTreeNode): Detached node holding the separating key.
+            right (RedBlackTreeNode): Root of the subtree with the larger keys (or None).
+
+        Returns:
+            RedBlackTreeNode: The root of the joined subtree.
+        """
+        # A red root can always be blackened; afterwards both inputs have black roots
+        if left and left.red:
+            left.red = False
+        if right and right.red:
+            right.red = False
+        left_black, right_black = self._black_height(left), self._black_height(right)
+        parent = None
+        if left_black > right_black:  # Walk down the right spine of the left tree
+            spine, black = left, left_black
+            while spine.red or black > right_black:
+                if not spine.red:
+                    black -= 1
+                parent, spine = spine, spine.right
+                if spine is None:
+                    break
+            parent.right = node
+            node.left, node.right = spine, right
+        elif right_black > left_black:  # Walk down the left spine of the right tree
+            spine, black = right, right_black
+            while spine.red or black > left_black:
+                if not spine.red:
+                    black -= 1
+                parent, spine = spine, spine.left
+                if spine is None:
+                    break
+            parent.left = node
+            node.left, node.right = left, spine
+        else:
+            node.left, node.right = left, right
+        node.parent = parent
+        if node.left:
+            node.left.parent = node
+        if node.right:
+            node.right.parent = node
+        if self.order_statistics:  # node and every spine node above it gained keys
+            self._resize_path(node)
+        self._pull_height(node)
+        self._retrace_height(parent)
+        if not parent:  # Equal black heights: node is a black root over both trees
+            node.red = False
+            return node
+        node.red = True
+        self.root = left if parent.right is node else right  # Scratch root for the fixup
+        self._fix_insert(node)
+        return self.root
+
+    def _fix_insert(self, node: RedBlackTreeNode) -> int:
         """Fixes the Red-Black Tree properties (violations) after insertion.
 
         This method handles the balancing operations (recoloring and rotations)
@@ -83,11 +266,16 @@ class RedBlackTree:
 
         Args:
             node (RedBlackTreeNode): The newly inserted node (which is initially red).
+
+        Returns:
+            int: The number of fixup steps (each recolor moves two levels up).
         """
+        levels = 0
         # Continue fixing as long as the current node is red and has a red parent
         # (violating the "no consecutive red nodes" property).
         # We stop if the node becomes the root (node.parent is None) or its parent is black.
-        while node != self.root and node.parent.is_red():
+        while node != self.root and node.parent.red:
+            levels += 1
             parent = node.parent
             grandparent = node.get_grandparent()
             uncle = node.get_uncle()
@@ -105,16 +293,21 @@ class RedBlackTree:
                 # --- Parent is the LEFT child ---
 
                 # Case 1: Uncle is RED
-                if uncle and uncle.is_red():
+                if uncle and uncle.red:
                     # Recolor parent, uncle, and grandparent
-                    self.log.append(f"Recoloring: {parent.value}, {uncle.value}, {grandparent.value}")
-                    parent.color = "B"
-                    uncle.color = "B"
-                    grandparent.color = "R"
+                    if self.log is not None:
+                        self.log.record(OP_RECOLOR, self._reported(grandparent))
+                    if self.stats is not None:
+                        self.stats.recolor()
+                    parent.red = False
+                    uncle.red = False
+                    grandparent.red = True
                     # Move up the tree: continue checking from the grandparent
                     node = grandparent
                 else:
                     # Case 2: Uncle is BLACK or None - Node is RIGHT child (LR triangle)
+                    if self.stats is not None:
+                        self.stats.rotation(double=node == parent.right)
                     if node == parent.right:
                         # Perform a left rotation at the parent
                         self._rotate_left(parent)
@@ -128,8 +321,8 @@ class RedBlackTree:
                     # Case 3: Uncle is BLACK or None - Node is LEFT child (LL line)
                     # This case also handles the situation after Case 2's rotation
                     # Recolor parent and grandparent
-                    parent.color = "B"
-                    grandparent.color = "R"
+                    parent.red = False
+                    grandparent.red = True
                     # Perform a right rotation at the grandparent
                     self._rotate_right(grandparent)
                     self.rotation_count += 1
@@ -140,15 +333,21 @@ class RedBlackTree:
                 # --- Parent is the RIGHT child (Mirror cases) ---
 
                 # Case 1: Uncle is RED
-                if uncle and uncle.is_red():
+                if uncle and uncle.red:
                     # Recolor parent, uncle, and grandparent
-                    parent.color = "B"
-                    uncle.color = "B"
-                    grandparent.color = "R"
+                    if self.log is not None:
+                        self.log.record(OP_RECOLOR, self._reported(grandparent))
+                    if self.stats is not None:
+                        self.stats.recolor()
+                    parent.red = False
+                    uncle.red = False
+                    grandparent.red = True
                     # Move up the tree: continue checking from the grandparent
                     node = grandparent
                 else:
                     # Case 2: Uncle is BLACK or None - Node is LEFT child (RL triangle)
+                    if self.stats is not None:
+                        self.stats.rotation(double=node == parent.left)
                     if node == parent.left:
                         # Perform a right rotation at the parent
                         self._rotate_right(parent)
@@ -162,8 +361,8 @@ class RedBlackTree:
                     # Case 3: Uncle is BLACK or None - Node is RIGHT child (RR line)
                     # This case also handles the situation after Case 2's rotation
                     # Recolor parent and grandparent
-                    parent.color = "B"
-                    grandparent.color = "R"
+                    parent.red = False
+                    grandparent.red = True
                     # Perform a left rotation at the grandparent
                     self._rotate_left(grandparent)
                     self.rotation_count += 1
@@ -173,8 +372,164 @@ class RedBlackTree:
         # Final check: Ensure the root node is always black after all adjustments.
         # This covers the case where the inserted node was the first node,
         # or if recoloring propagated up to the root.
-        self.root.color = "B"
+        if self.root.red:
+            # Blackening a red root adds one black node to every path
+            self.root.red = False
+            self.black_height += 1
+        return levels
+
+
+    def delete(self, value: Any) -> bool:
+        """Deletes the node with the given key from the Red-Black Tree.
+
+        Args:
+            value (Any): The value (key) to be removed from the tree.
+
+        Returns:
+            bool: True if the value was removed, False if it was not in the tree.
+        """
+        node = self._find_node(value)
+        if not node:
+            if self.log is not None:
+                self.log.record(OP_MISSING, value)
+            return False
+
+        # Step 1: Standard BST removal. `removed_black` records whether a black node
+        # left its position; `child` is the node (possibly None) that took its place.
+        successor = None
+        if not node.left or not node.right:
+            removed_black = not node.red
+            child = node.left or node.right
+            child_parent = node.parent
+            self._transplant(node, child)
+        else:
+            # Two children: the in-order successor takes the node's place and color
+            successor = self._min_node(node.right)
+            removed_black = not successor.red
+            child = successor.right
+            if successor.parent is node:
+                child_parent = successor
+            else:
+                child_parent = successor.parent
+                self._transplant(successor, successor.right) # Lift successor's right subtree
+                successor.right = node.right
+                successor.right.parent = successor
+            self._transplant(node, successor)
+            successor.left = node.left
+            successor.left.parent = successor
+            successor.red = node.red
+            self._inherit_cache(successor, node) # Correct unless the retrace below changes it
+        node.left = node.right = node.parent = None # Detach the removed node
+        self.size -= 1
+        if self.order_statistics: # The path from the splice point up lost one node
+            self._resize_path(child_parent)
+        self._retrace_height(child_parent)
+        if successor:  # The retrace may stop below the successor's new position
+            self._retrace_height(successor)
+        if not self.root:
+            self.black_height = 0
+
+        # Step 2: Removing a black node shortens one path; push the extra black up the tree.
+        if removed_black:
+            levels = self._fix_delete(child, child_parent)
+            if self.stats is not None:
+                self.stats.retrace(levels)
+        return True
+
+    def _fix_delete(self, node: RedBlackTreeNode, parent: RedBlackTreeNode) -> int:
+        """Fixes the Red-Black Tree properties after removing a black node.
+
+        `node` carries an extra ("double") black. Since it may be None, its parent is passed explicitly.
+
+        Args:
+            node (RedBlackTreeNode): The node that replaced the removed node (may be None).
+            parent (RedBlackTreeNode): The parent of `node`.
+
+        Returns:
+            int: The number of fixup steps (levels the extra black climbed, plus the final step).
+        """
+        levels = 0
+        while node is not self.root and (node is None or not node.red):
+            levels += 1
+            if node is parent.left:
+                # --- Node is the LEFT child ---
+                sibling = parent.right
+                # Case 1: Sibling is RED - rotate so the sibling becomes black
+                if sibling.red:
+                    sibling.red = False
+                    parent.red = True
+                    if self.stats is not None:
+                        self.stats.rotation(double=False)
+                    self._rotate_left(parent)
+                    self.rotation_count += 1
+                    sibling = parent.right
+                # Case 2: Sibling's children are both black - recolor and move the extra black up
+                if (not sibling.left or not sibling.left.red) and (not sibling.right or not sibling.right.red):
+                    sibling.red = True
+                    if self.stats is not None:
+                        self.stats.recolor()
+                    node, parent = parent, parent.parent
+                    if parent is None: # The extra black left through the root: every path lost one
+                        self.black_height -= 1
+                else:
+                    # Case 3: Sibling's far child is black - rotate the near red child into place
+                    if self.stats is not None: # Case 3 adds a second rotation to case 4
+                        self.stats.rotation(double=not sibling.right or not sibling.right.red)
+                    if not sibling.right or not sibling.right.red:
+                        sibling.left.red = False
+                        sibling.red = True
+                        self._rotate_right(sibling)
+                        self.rotation_count += 1
+                        sibling = parent.right
+                    # Case 4: Sibling's far child is red - rotate the parent and absorb the extra black
+                    sibling.red = parent.red
+                    parent.red = False
+                    sibling.right.red = False
+                    self._rotate_left(parent)
+                    self.rotation_count += 1
+                    node = self.root
+            else:
+                # --- Node is the RIGHT child (Mirror cases) ---
+                sibling = parent.left
+                # Case 1: Sibling is RED
+                if sibling.red:
+                    sibling.red = False
+                    parent.red = True
+                    if self.stats is not None:
+                        self.stats.rotation(double=False)
+                    self._rotate_right(parent)
+                    self.rotation_count += 1
+                    sibling = parent.left
+                # Case 2: Sibling's children are both black
+                if (not sibling.left or not sibling.left.red) and (not sibling.right or not sibling.right.red):
+                    sibling.red = True
+                    if self.stats is not None:
+                        self.stats.recolor()
+                    node, parent = parent, parent.parent
+                    if parent is None:
+                        self.black_height -= 1
+                else:
+                    # Case 3: Sibling's far child is black
+                    if self.stats is not None: # Case 3 adds a second rotation to case 4
+                        self.stats.rotation(double=not sibling.left or not sibling.left.red)
+                    if not sibling.left or not sibling.left.red:
+                        sibling.right.red = False
+                        sibling.red = True
+                        self._rotate_left(sibling)
+                        self.rotation_count += 1
+                        sibling = parent.left
+                    # Case 4: Sibling's far child is red
+                    sibling.red = parent.red
+                    parent.red = False
+                    sibling.left.red = False
+                    self._rotate_right(parent)
+                    self.rotation_count += 1
+                    node = self.root
 
+        # A red node (or the root) simply absorbs the extra black
+        if node:
+            node.red = False
+        return levels
 
     def _rotate_left(self, node: RedBlackTreeNode) -> None:
         """Performs a left rotation around the given node.
@@ -182,7 +537,8 @@ class RedBlackTree:
         Args:
             node (RedBlackTreeNode): The node around which the rotation is performed (becomes the child).
         """
-        self.log.append(f"Left rotation on node {node.value}")
+        if self.log is not None:
+            self.log.record(OP_ROTATE_LEFT, self._reported(node))
         # Identify the pivot (node's right child) which will move up
         pivot = node.right
         if not pivot: # Cannot rotate left if there's no right child
@@ -211,6 +567,13 @@ class RedBlackTree:
         # The original node becomes the left child of the pivot
         pivot.left = node
         node.parent = pivot # Update the original node's parent pointer
+        if self.order_statistics: # Only node and pivot cover a different set of nodes now
+            self._pull_size(node)
+            self._pull_size(pivot)
+        # Step 4: Refresh cached heights of node and pivot, then of any ancestors that changed
+        self._pull_height(node)
+        self._pull_height(pivot)
+        self._retrace_height(pivot.parent)
 
 
     def _rotate_right(self, node: RedBlackTreeNode) -> None:
@@ -219,7 +582,8 @@ class RedBlackTree:
         Args:
             node: The node around which the rotation is performed (becomes the child).
         """
-        self.log.append(f"Right rotation on node {node.value}")
+        if self.log is not None:
+            self.log.record(OP_ROTATE_RIGHT, self._reported(node))
         # Identify the pivot (node's left child) which will move up
         pivot = node.left
         if not pivot: # Cannot rotate right if there's no left child
@@ -248,45 +612,47 @@ class RedBlackTree:
         # The original node becomes the right child of the pivot
         pivot.right = node
         node.parent = pivot # Update the original node's parent pointer
-
-    def print_tree(self, node=None, level=0, prefix='Root:'):
-        """Print the tree structure."""
+        if self.order_statistics: # Only node and pivot cover a different set of nodes now
+            self._pull_size(node)
+            self._pull_size(pivot)
+        # Step 4: Refresh cached heights of node and pivot, then of any ancestors that changed
+        self._pull_height(node)
+        self._pull_height(pivot)
+        self._retrace_height(pivot.parent)
+
+    def print_tree(self, node=None, level=0, prefix='Root:', visited=None):
+        """Print the tree structure (`visited` is accepted for signature parity with AVLTree)."""
         # node = node or self.root
         if node:
-            print(' ' * (5 * level) + prefix + f"{node.value}({node.color})")
-            self.print_tree(node.left, level + 1, 'L----')
-            self.print_tree(node.right, level + 1, 'R----')
+            print(' ' * (5 * level) + prefix + f"{self._reported(node)}({node.color})")
+            self.print_tree(node.left, level + 1, 'L----', visited)
+            self.print_tree(node.right, level + 1, 'R----', visited)
 
     def print_log(self):
-        """Print the operation log."""
+        """Print the operation log (entries are formatted only now)."""
         print("\n--- Red-Black Tree Log ---")
-        for entry in self.log:
-            print(entry)
+        if self.log is None:
+            print("(logging disabled)")
+        else:
+            for entry in self.log.messages():
+                print(entry)
         print(f"Total Rotations: {self.rotation_count}")
-        print(f"Final Tree Height: {self.root.get_height() if self.root else -1}")
+        print(f"Final Tree Height: {self.height}")
+        print(f"Black Height: {self.black_height}")
 
     # --- Helper methods for traversal/visualization (Optional) ---
     def inorder_traversal(self) -> list:
-        """Performs an inorder traversal and returns a list of values."""
-        result = []
-        self._inorder_recursive(self.root, result)
-        return result
+        """Returns a list of (value, color) pairs in key order, built from the non-recursive iterator."""
+        reported = self._reported
+        return [(reported(node), node.color) for node in self._iter_nodes()] # Include color for verification
 
-    def _inorder_recursive(self, node: RedBlackTreeNode, result: list) -> None:
-        if node:
-            self._inorder_recursive(node.left, result)
-            result.append((node.value, node.color)) # Include color for verification
-            self._inorder_recursive(node.right, result)
-            
     def get_red_black_tree_height(self, node : RedBlackTreeNode):
-        """Returns the height of the Red-Black Tree by calculating it recursively.
+        """Returns the height of the subtree rooted at `node` from its cached height in O(1).
 
         Args:
-            node (RedBlackTreeNode): The node which is used to calculate the height of the Red-Black tree.
+            node (RedBlackTreeNode): The node whose subtree height is returned (-1 for None).
         """
-        if node is None:
-            return -1
-        return 1 + max(self.get_red_black_tree_height(node.left), self.get_red_black_tree_height(node.right))
+        return node.height if node else -1
         
 # --- Example Usage ---
 if __name__ == "__main__":
@@ -0,0 +1,511 @@
+# Created by: Michael Jung (ID:10680322), Timothy Sanders (ID: 01002147), Megan Ng (ID: 00756276)
+
+# Date: 10/18/26
+
+# Course: Spr25_CS_034 CRN 39575
+
+#--------------------------------------------------------------------------------------------
+from array import array
+from operator import itemgetter
+from typing import Any, Iterable, Iterator
+
+from bst_tree import BinarySearchTree
+from operation_log import (OP_DELETE, OP_DUPLICATE, OP_INSERT, OP_MISSING, OP_ROTATE_LEFT,
+                           OP_ROTATE_RIGHT, OperationLog)
+
+NIL = 0  # Handle of the sentinel row; real nodes start at 1 so a handle is falsy only when empty
+
+
+class ArrayAVLTree:
+    """AVL tree stored as parallel `array.array` columns (struct-of-arrays) instead of node objects.
+
+    A node is an integer handle indexing the columns `keys`, `left`, `right`, `parent` and
+    `height`. Row 0 is a sentinel (height -1) so child lookups need no None checks. Rows of
+    deleted nodes go on a free list and are reused by later inserts. Keys must fit the array
+    type code (`'q'`, 64-bit signed integers, by default); payloads live in a plain list that
+    is only allocated once a non-None payload is stored.
+
+    Exposes the same insert/search/delete/iterate API as AVLTree, so InventoryManager can
+    switch to it by configuration.
+
+    Args:
+        key_typecode (str): `array` type code for keys. Defaults to 'q'.
+        log_capacity (int): Number of recent operations to keep in the log; 0 disables logging
+
+    Attributes:
+        root (int): Handle of the root node, NIL when the tree is empty
+        size (int): Number of keys stored in the tree
+        rotation_count (int): Counter for rotations performed
+        log (OperationLog): Ring buffer of recent operations, or None when logging is off
+    """
+    def __init__(self, key_typecode: str='q', log_capacity: int=0):
+        self.key_typecode = key_typecode
+        self.keys = array(key_typecode, [0])  # Row 0 is the NIL sentinel
+        self.left = array('i', [NIL])
+        self.right = array('i', [NIL])
+        self.parent = array('i', [NIL])
+        self.height = array('b', [-1])  # -1 for NIL, 0 for a leaf
+        self.payloads = None  # Allocated on the first non-None payload
+        self.free = array('i')  # Handles of deleted rows available for reuse
+        self.root = NIL
+        self.size = 0
+        self.rotation_count = 0
+        self.log = OperationLog(log_capacity) if log_capacity else None
+
+    @classmethod
+    def from_sorted(cls, iterable: Iterable, items: bool=False, **kwargs) -> 'ArrayAVLTree':
+        """Builds a balanced tree from keys in ascending order in O(n), without rotations.
+
+        Rows are laid out in key order, so the columns are filled with bulk extends and
+        only the links and heights are computed per node.
+
+        Args:
+            iterable: Keys in ascending order, or `(key, payload)` pairs when `items` is True.
+            items: Whether the iterable yields `(key, payload)` pairs.
+            **kwargs: Passed to the constructor (`key_typecode`, `log_capacity`).
+
+        Raises:
+            ValueError: If the keys are not in ascending order.
+        """
+        tree = cls(**kwargs)
+        pairs = BinarySearchTree._sorted_pairs(iterable, items)
+        count = len(pairs)
+        tree.keys.extend(key for key, _ in pairs)
+        tree.left.extend(array('i', [NIL]) * count)
+        tree.right.extend(array('i', [NIL]) * count)
+        tree.parent.extend(array('i', [NIL]) * count)
+        tree.height.extend(array('b', [0]) * count)
+        if items and any(payload is not None for _, payload in pairs):
+            tree.payloads = [None] + [payload for _, payload in pairs]
+        left, right, parent, height = tree.left, tree.right, tree.parent, tree.height
+
+        def link(lo: int, hi: int, up: int) -> int:
+            if lo > hi:
+                return NIL
+            mid = (lo + hi) // 2
+            parent[mid] = up
+            left[mid] = link(lo, mid - 1, mid)
+            right[mid] = link(mid + 1, hi, mid)
+            height[mid] = 1 + max(height[left[mid]], height[right[mid]])
+            return mid
+
+        tree.root = link(1, count, NIL)  # Handles 1..count hold the keys in order
+        tree.size = count
+        return tree
+
+    @classmethod
+    def from_unsorted(cls, iterable: Iterable, items: bool=False, **kwargs) -> 'ArrayAVLTree':
+        """Sorts the keys and builds a balanced tree with `from_sorted`."""
+        ordered = sorted(iterable, key=itemgetter(0)) if items else sorted(iterable)
+        return cls.from_sorted(ordered, items, **kwargs)
+
+    # --- Node storage ---
+    def _new_node(self, value: Any, payload: Any, parent: int) -> int:
+        """Allocates a row (reusing a freed one if possible) and returns its handle."""
+        if self.free:
+            node = self.free.pop()
+            self.keys[node] = value
+            self.left[node] = self.right[node] = NIL
+            self.parent[node] = parent
+            self.height[node] = 0
+        else:
+            node = len(self.keys)
+            self.keys.append(value)
+            self.left.append(NIL)
+            self.right.append(NIL)
+            self.parent.append(parent)
+            self.height.append(0)
+            if self.payloads is not None:
+                self.payloads.append(None)
+        if payload is not None:
+            if self.payloads is None:
+                self.payloads = [None] * len(self.keys)
+            self.payloads[node] = payload
+        return node
+
+    def _payload(self, node: int) -> Any:
+        return self.payloads[node] if self.payloads is not None else None
+
+    def get_height(self, node: int) -> int:
+        """Gets the height of a node handle (-1 for NIL)."""
+        return self.height[node]
+
+    def get_balance(self, node: int) -> int:
+        """Gets the balance factor of a node handle."""
+        return self.height[self.left[node]] - self.height[self.right[node]]
+
+    def _find(self, value: Any) -> int:
+        """Returns the handle holding `value`, or NIL."""
+        keys, left, right = self.keys, self.left, self.right
+        node = self.root
+        while node:
+            key = keys[node]
+            if value < key:
+                node = left[node]
+            elif value > key:
+                node = right[node]
+            else:
+                return node
+        return NIL
+
+    def _transplant(self, old: int, new: int) -> None:
+        """Replaces the subtree rooted at `old` with the one rooted at `new` (which may be NIL)."""
+        up = self.parent[old]
+        if not up:
+            self.root = new
+        elif self.left[up] == old:
+            self.left[up] = new
+        else:
+            self.right[up] = new
+        if new:
+            self.parent[new] = up
+
+    # --- Rotations and rebalancing ---
+    def _rotate_left(self, node: int) -> int:
+        """Performs a left rotation at `node` and returns the new subtree root."""
+        left, right, parent, height = self.left, self.right, self.parent, self.height
+        self.rotation_count += 1
+        if self.log is not None:
+            self.log.record(OP_ROTATE_LEFT, self.keys[node])
+        pivot = right[node]
+        inner = left[pivot]
+        right[node] = inner
+        if inner:
+            parent[inner] = node
+        self._transplant(node, pivot)
+        left[pivot] = node
+        parent[node] = pivot
+        height[node] = 1 + max(height[left[node]], height[inner])
+        height[pivot] = 1 + max(height[node], height[right[pivot]])
+        return pivot
+
+    def _rotate_right(self, node: int) -> int:
+        """Performs a right rotation at `node` and returns the new subtree root."""
+        left, right, parent, height = self.left, self.right, self.parent, self.height
+        self.rotation_count += 1
+        if self.log is not None:
+            self.log.record(OP_ROTATE_RIGHT, self.keys[node])
+        pivot = left[node]
+        inner = right[pivot]
+        left[node] = inner
+        if inner:
+            parent[inner] = node
+        self._transplant(node, pivot)
+        right[pivot] = node
+        parent[node] = pivot
+        height[node] = 1 + max(height[inner], height[right[node]])
+        height[pivot] = 1 + max(height[left[pivot]], height[node])
+        return pivot
+
+    def _rebalance(self, node: int) -> int:
+        """Rotates `node` if it is unbalanced and returns the (possibly new) subtree root."""
+        left, right, height = self.left, self.right, self.height
+        balance = height[left[node]] - height[right[node]]
+        if balance > 1:  # Left heavy
+            child = left[node]
+            if height[left[child]] < height[right[child]]:  # Left-Right case
+                self._rotate_left(child)
+            return self._rotate_right(node)
+        if balance < -1:  # Right heavy
+            child = right[node]
+            if height[right[child]] < height[left[child]]:  # Right-Left case
+                self._rotate_right(child)
+            return self._rotate_left(node)
+        return node
+
+    # --- Updates ---
+    def insert(self, value: Any, payload: Any=None) -> None:
+        """Inserts a value into the tree, maintaining the AVL property.
+
+        Duplicate keys are ignored; use `tree[key] = payload` to replace a payload.
+
+        Args:
+            value: The value (key) to insert.
+            payload: Optional object mapped to the key.
+        """
+        keys, left, right, parent, height = self.keys, self.left, self.right, self.parent, self.height
+        if not self.root:
+            self.root = self._new_node(value, payload, NIL)
+            self.size += 1
+            if self.log is not None:
+                self.log.record(OP_INSERT, value, 0)
+            return
+        node = self.root
+        while True:
+            key = keys[node]
+            if value < key:
+                if not left[node]:
+                    left[node] = self._new_node(value, payload, node)
+                    break
+                node = left[node]
+            elif value > key:
+                if not right[node]:
+                    right[node] = self._new_node(value, payload, node)
+                    break
+                node = right[node]
+            else:
+                if self.log is not None:
+                    self.log.record(OP_DUPLICATE, value)
+                return
+        self.size += 1
+        # Retrace: stop once a height is unchanged or after the single (double) rotation
+        while node:
+            new_height = 1 + max(height[left[node]], height[right[node]])
+            if abs(height[left[node]] - height[right[node]]) > 1:
+                self._rebalance(node)  # Restores the subtree's pre-insert height
+                break
+            if new_height == height[node]:
+                break
+            height[node] = new_height
+            node = parent[node]
+        if self.log is not None:
+            self.log.record(OP_INSERT, value, height[self.root])
+
+    def delete(self, value: Any) -> bool:
+        """Deletes a value from the tree, retracing and rebalancing towards the root.
+
+        Args:
+            value: The value (key) to delete.
+
+        Returns:
+            bool: True if the value was removed, False if it was not in the tree.
+        """
+        left, right, parent, height = self.left, self.right, self.parent, self.height
+        node = self._find(value)
+        if not node:
+            if self.log is not None:
+                self.log.record(OP_MISSING, value)
+            return False
+        if left[node] and right[node]:  # Two children: splice out the in-order successor
+            successor = right[node]
+            while left[successor]:
+                successor = left[successor]
+            if parent[successor] != node:
+                start = parent[successor]
+                self._transplant(successor, right[successor])
+                right[successor] = right[node]
+                parent[right[successor]] = successor
+            else:
+                start = successor
+            self._transplant(node, successor)
+            left[successor] = left[node]
+            parent[left[successor]] = successor
+            height[successor] = height[node]
+        else:
+            start = parent[node]
+            self._transplant(node, left[node] or right[node])
+        if self.payloads is not None:
+            self.payloads[node] = None  # Release the payload object
+        self.free.append(node)
+        self.size -= 1
+        # Retrace: stop once a subtree's height is unchanged
+        while start:
+            old_height = height[start]
+            height[start] = 1 + max(height[left[start]], height[right[start]])
+            top = self._rebalance(start)
+            if height[top] == old_height:
+                break
+            start = parent[top]
+        if self.log is not None:
+            self.log.record(OP_DELETE, value, height[self.root])
+        return True
+
+    # --- Lookups ---
+    def get(self, key: Any, default: Any=None) -> Any:
+        """Returns the payload stored under `key`, or `default` if the key is missing."""
+        node = self._find(key)
+        return self._payload(node) if node else default
+
+    def __contains__(self, key: Any) -> bool:
+        return self._find(key) != NIL
+
+    def __getitem__(self, key: Any) -> Any:
+        node = self._find(key)
+        if not node:
+            raise KeyError(key)
+        return self._payload(node)
+
+    def __setitem__(self, key: Any, payload: Any) -> None:
+        node = self._find(key)
+        if not node:
+            self.insert(key, payload)
+            return
+        if self.payloads is None:
+            self.payloads = [None] * len(self.keys)
+        self.payloads[node] = payload
+
+    def __delitem__(self, key: Any) -> None:
+        if not self.delete(key):
+            raise KeyError(key)
+
+    def __len__(self) -> int:
+        return self.size
+
+    def floor(self, key: Any) -> Any:
+        """Returns the largest key less than or equal to `key`, or None if there is none."""
+        keys, node, best = self.keys, self.root, NIL
+        while node:
+            if key < keys[node]:
+                node = self.left[node]
+            else:
+                best = node
+                node = self.right[node]
+        return keys[best] if best else None
+
+    def ceiling(self, key: Any) -> Any:
+        """Returns the smallest key greater than or equal to `key`, or None if there is none."""
+        keys, node, best = self.keys, self.root, NIL
+        while node:
+            if key > keys[node]:
+                node = self.right[node]
+            else:
+                best = node
+                node = self.left[node]
+        return keys[best] if best else None
+
+    def min(self) -> Any:
+        """Returns the smallest key in the tree, or None if the tree is empty."""
+        node = self.root
+        if not node:
+            return None
+        while self.left[node]:
+            node = self.left[node]
+        return self.keys[node]
+
+    def max(self) -> Any:
+        """Returns the largest key in the tree, or None if the tree is empty."""
+        node = self.root
+        if not node:
+            return None
+        while self.right[node]:
+            node = self.right[node]
+        return self.keys[node]
+
+    # --- Iteration ---
+    def _iter_handles(self) -> Iterator[int]:
+        """Yields node handles in key order by following parent links (no stack)."""
+        left, right, parent = self.left, self.right, self.parent
+        node = self.root
+        if not node:
+            return
+        while left[node]:
+            node = left[node]
+        while node:
+            yield node
+            if right[node]:  # Next is the left-most node of the right subtree
+                node = right[node]
+                while left[node]:
+                    node = left[node]
+            else:  # Climb until we arrive from a left child
+                child, node = node, parent[node]
+                while node and right[node] == child:
+                    child, node = node, parent[node]
+
+    def _step(self, node: int, reverse: bool) -> int:
+        """Returns the handle after `node` in key order (before it when `reverse`), or NIL."""
+        near, far = (self.right, self.left) if reverse else (self.left, self.right)
+        if far[node]:
+            node = far[node]
+            while near[node]:
+                node = near[node]
+            return node
+        child, node = node, self.parent[node]
+        while node and far[node] == child:
+            child, node = node, self.parent[node]
+        return node
+
+    def __iter__(self) -> Iterator[Any]:
+        keys = self.keys
+        return (keys[node] for node in self._iter_handles())
+
+    def __reversed__(self) -> Iterator[Any]:
+        return self.irange(reverse=True)
+
+    def values(self) -> Iterator[Any]:
+        """Yields the payloads in key order."""
+        return (self._payload(node) for node in self._iter_handles())
+
+    def items(self) -> Iterator[tuple]:
+        """Yields `(key, payload)` pairs in key order."""
+        keys = self.keys
+        return ((keys[node], self._payload(node)) for node in self._iter_handles())
+
+    def irange(self, lo: Any=None, hi: Any=None, inclusive: tuple=(True, True),
+               reverse: bool=False) -> Iterator[Any]:
+        """Lazily yields the keys between `lo` and `hi` (see BinarySearchTree.irange)."""
+        keys = self.keys
+        return (keys[node] for node in self._range_handles(lo, hi, inclusive, reverse))
+
+    def irange_items(self, lo: Any=None, hi: Any=None, inclusive: tuple=(True, True),
+                     reverse: bool=False) -> Iterator[tuple]:
+        """Lazily yields the `(key, payload)` pairs between `lo` and `hi` (see `irange`)."""
+        keys = self.keys
+        return ((keys[node], self._payload(node)) for node in self._range_handles(lo, hi, inclusive, reverse))
+
+    def _range_handles(self, lo: Any, hi: Any, inclusive: tuple, reverse: bool) -> Iterator[int]:
+        """Lazily yields the handles of the nodes whose keys lie between `lo` and `hi`."""
+        keys, (lo_inclusive, hi_inclusive) = self.keys, inclusive
+        node, start = self.root, NIL
+        while node:  # Descend to the first key in range (last one when reversed)
+            key = keys[node]
+            if reverse:
+                inside = hi is None or key < hi or (hi_inclusive and not hi < key)
+                node, start = (self.right[node], node) if inside else (self.left[node], start)
+            else:
+                inside = lo is None or lo < key or (lo_inclusive and not key < lo)
+                node, start = (self.left[node], node) if inside else (self.right[node], start)
+        node = start
+        while node:
+            key = keys[node]
+            if reverse:
+                if lo is not None and (key < lo or (not lo_inclusive and not lo < key)):
+                    return
+            elif hi is not None and (hi < key or (not hi_inclusive and not key < hi)):
+                return
+            following = self._step(node, reverse)
+            yield node
+            node = following
+
+    # --- Snapshots ---
+    def snapshot(self) -> 'ArrayAVLTree':
+        """Returns an independent copy of the tree; each column is copied as one buffer."""
+        copy = ArrayAVLTree.__new__(ArrayAVLTree)
+        copy.key_typecode = self.key_typecode
+        copy.keys = self.keys[:]  # Slicing an array is a single memory copy
+        copy.left = self.left[:]
+        copy.right = self.right[:]
+        copy.parent = self.parent[:]
+        copy.height = self.height[:]
+        copy.payloads = list(self.payloads) if self.payloads is not None else None
+        copy.free = self.free[:]
+        copy.root = self.root
+        copy.size = self.size
+        copy.rotation_count = self.rotation_count
+        copy.log = None
+        return copy
+
+    # --- Display ---
+    def print_tree(self, node: int=NIL, level: int=0, prefix: str='Root:', visited=None) -> None:
+        """Prints the tree in the same format as AVLTree.print_tree.
+
+        Args:
+            node: The starting node handle for printing.
+            level: The current level of the tree (used for indentation).
+            prefix: The prefix for indicating the position of the node.
+            visited: Unused; kept for signature compatibility with AVLTree.print_tree.
+        """
+        if node:
+            print(' ' * (5 * level) + prefix + f"{self.keys[node]} (BF={self.get_balance(node)})")
+            self.print_tree(self.left[node], level + 1, 'L----', visited)
+            self.print_tree(self.right[node], level + 1, 'R----', visited)
+
+    def print_log(self):
+        """Prints the retained log entries, rotation count and tree height."""
+        print("\n--- Array AVL Tree Log ---")
+        if self.log is None:
+            print("(logging disabled)")
+        else:
+            for entry in self.log.messages():
+                print(entry)
+        print(f"Total Rotations: {self.rotation_count}")
+        print(f"Final Tree Height: {self.height[self.root]}")
@@ -6,28 +6,158 @@
 
 #--------------------------------------------------------------------------------------------
 import random
-from AVLTree import AVLTree
+from backends import create_backend, delete_key, insert_batch, insert_key
+from generate_data import CHUNK_SIZE, iter_key_chunks, load_inventory_from_file
+from tree_snapshot import load_snapshot, save_snapshot
 
 
 class InventoryManager:
     """
     Manages an inventory of items using an AVL tree for efficient storage and retrieval.
     """
-    def __init__(self):
+    def __init__(self, log_capacity=1000, backend="avl", **backend_options):
         """
         Initializes an empty inventory by creating an AVL tree to store items.
+
+        Args:
+            log_capacity: Number of recent tree operations kept for `show_log`; 0 disables logging.
+            backend: Name of a registered container (see backends.backend_names(), e.g. "avl", "rbt",
+                "array", "bplus" or "persistent").
+            **backend_options: Extra constructor arguments for the backend (e.g. `fanout` for "bplus").
+
+        Raises:
+            ValueError: If `backend` is not registered.
+        """
+        self.avl_tree = create_backend(backend, log_capacity, **backend_options)  # Create the tree that stores inventory items
+        self.backend = backend
+        self.log_capacity = log_capacity
+        self.backend_options = backend_options
+
+    @classmethod
+    def from_file(cls, filename, **kwargs):
+        """
+        Creates an inventory from a JSON list of item IDs (as written by generate_data).
+
+        Args:
+            filename: Path of the dataset file.
+            **kwargs: Passed to the InventoryManager constructor (e.g. `backend`).
+        """
+        manager = cls(**kwargs)
+        manager.load_items(load_inventory_from_file(filename))
+        return manager
+
+    @classmethod
+    def from_snapshot(cls, filename, **kwargs):
+        """
+        Creates an inventory from a binary snapshot written by `save_snapshot`.
+
+        The file is memory-mapped and, for the "avl" and "rbt" backends, the saved tree shape is relinked
+        directly; other backends get an O(n) balanced build. Either way no rotations run.
+
+        Args:
+            filename: Path of the snapshot file.
+            **kwargs: Passed to the InventoryManager constructor (e.g. `backend`).
         """
-        self.avl_tree = AVLTree()  # Create an instance of the AVLTree class to store inventory items
+        manager = cls(**kwargs)
+        manager.avl_tree = load_snapshot(filename, type(manager.avl_tree), log_capacity=manager.log_capacity,
+                                         **manager.backend_options)
+        print(f"Loaded {len(manager.avl_tree)} items")
+        return manager
 
-    def add_item(self, item_id):
+    def save_snapshot(self, filename):
+        """
+        Writes the item IDs (and, for node-based backends, the tree shape) to a binary snapshot.
+
+        Args:
+            filename: Path of the snapshot file.
+
+        Returns:
+            The number of items written.
+        """
+        return save_snapshot(self.avl_tree, filename)
+
+    def load_items(self, item_ids, presorted=False):
+        """
+        Replaces the inventory with the given items using an O(n) balanced bulk build.
+
+        Args:
+            item_ids: The item IDs to stock; duplicates are stored once.
+            presorted: Skip the sort when the IDs are already in ascending order.
+        """
+        tree_class = type(self.avl_tree)
+        build = tree_class.from_sorted if presorted else tree_class.from_unsorted
+        self.avl_tree = build(item_ids, log_capacity=self.log_capacity, **self.backend_options)
+        print(f"Loaded {len(self.avl_tree)} items")
+
+    def ingest_file(self, filename, chunk_size=CHUNK_SIZE):
+        """
+        Adds every item ID of a streamed dataset (NDJSON or fixed-width binary) to the inventory.
+
+        The file is read `chunk_size` IDs at a time, so memory beyond the tree itself stays
+        bounded. Each chunk is added as one batch (see backends.insert_batch).
+
+        Args:
+            filename: A .ndjson/.jsonl or .bin dataset (see generate_data.iter_key_chunks).
+            chunk_size: Item IDs read and merged per batch.
+
+        Returns:
+            The number of items in the inventory afterwards.
+        """
+        for chunk in iter_key_chunks(filename, chunk_size):
+            self.avl_tree = insert_batch(self.avl_tree, chunk)
+        print(f"Loaded {len(self.avl_tree)} items")
+        return len(self.avl_tree)
+
+    def add_item(self, item_id, details=None):
         """
         Adds an item to the inventory.
 
         Args:
             item_id: The ID of the item to add.
+            details: Optional data stored with the item (e.g. quantity, location).
         """
         print(f"Adding item ID: {item_id}")  # Print a message indicating the item being added
-        self.avl_tree.insert(item_id)  # Insert the item ID into the AVL tree
+        self.avl_tree = insert_key(self.avl_tree, item_id, details)  # Persistent backends return a new version
+
+    def add_items(self, item_ids, items=False):
+        """
+        Adds a batch of items in one call (AVLTree.insert_many picks the cheaper of sorted
+        inserts or a split/merge/join of the batch's ID range).
+
+        Args:
+            item_ids: The IDs to add, in any order, or `(item_id, details)` pairs when `items` is True.
+            items: Whether `item_ids` yields `(item_id, details)` pairs.
+
+        Returns:
+            The number of items that were not already stocked.
+        """
+        before = len(self.avl_tree)
+        self.avl_tree = insert_batch(self.avl_tree, list(item_ids), items)
+        added = len(self.avl_tree) - before
+        print(f"Added {added} items")
+        return added
+
+    def has_item(self, item_id):
+        """
+        Checks whether an item is in the inventory.
+
+        Args:
+            item_id: The ID of the item to look up.
+
+        Returns:
+            True if the item is stocked, False otherwise.
+        """
+        return item_id in self.avl_tree
+
+    def get_item(self, item_id, default=None):
+        """
+        Returns the details stored with an item.
+
+        Args:
+            item_id: The ID of the item to look up.
+            default: Returned when the item is not in the inventory.
+        """
+        return self.avl_tree.get(item_id, default)
 
     def remove_item(self, item_id):
         """
@@ -35,10 +165,29 @@ class InventoryManager:
 
         Args:
             item_id: The ID of the item to remove.
+
+        Returns:
+            True if the item was in the inventory, False otherwise.
+        """
+        print(f"Removing item ID: {item_id}")  # Print a message indicating the item being removed
+        self.avl_tree, removed = delete_key(self.avl_tree, item_id)  # Delete the item ID from the tree
+        return removed
+
+    def snapshot(self):
+        """
+        Returns a read-only view of the inventory as it is now, for reports.
+
+        With the "persistent" backend this is O(1): the current tree version is shared and
+        later adds and removes create new versions without touching it. The "array" backend
+        copies its columns (O(n)); the "avl" backend cannot take snapshots.
+
+        Raises:
+            TypeError: If the backend does not support snapshots.
         """
-        pass
-        #print(f"Removing item ID: {item_id}")  # Print a message indicating the item being removed
-        #self.avl_tree.delete(item_id)  # Delete the item ID from the AVL tree
+        if not hasattr(self.avl_tree, "snapshot"):
+            raise TypeError(f"{type(self.avl_tree).__name__} does not support snapshots; "
+                            "use backend='persistent'")
+        return self.avl_tree.snapshot()
 
     def show_inventory(self, node=None, level=0, prefix='Root:', visited=None):
         """
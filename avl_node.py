@@ -13,10 +13,11 @@ class AvlNode(BstNode): # Inherit from BstNode class
     Node for AVL tree, inheriting from BstNode.
     Adds a 'height' attribute for balancing.
     """
-    def __init__(self, value, debug=False):
-        super().__init__(value)  # Call BstNode constructor to initialize basic node properties
-        self.debug = debug
-        if self.debug:
+    __slots__ = ('height',)
+
+    def __init__(self, value, debug=False, payload=None):
+        super().__init__(value, payload=payload)  # Call BstNode constructor to initialize basic node properties
+        if debug or AvlNode.debug:
             print(f"DEBUG: AvlNode.__init__({value}) calling super()") # Added for demo
         self.height = 1        # Initialize the height of the AVL node to 1
 
@@ -26,6 +27,31 @@ class AvlNode(BstNode): # Inherit from BstNode class
         """
         return f"{str(self.value)} (height: {self.height})"
 
+
+class SizedAvlNode(AvlNode):
+    """
+    AVL node that also counts the nodes in its subtree, for order-statistic queries.
+    Only used by trees created with `order_statistics=True`, so plain trees do not pay for the slot.
+    """
+    __slots__ = ('size',)
+
+    def __init__(self, value, debug=False, payload=None):
+        super().__init__(value, debug, payload)
+        self.size = 1          # A new node is a subtree of one
+
+
+class KeyedAvlNode(AvlNode):
+    """
+    AVL node of a tree created with `key=`: `value` holds the derived sort key, computed once
+    on insertion, and `item` the original key that the tree reports back.
+    """
+    __slots__ = ('item',)
+
+
+class KeyedSizedAvlNode(SizedAvlNode):
+    """SizedAvlNode for trees created with both `key=` and `order_statistics=True`."""
+    __slots__ = ('item',)
+
 # --------- Example Use ---------
 # Demonstrate instantiation calls __init__ chain
 if __name__ == "__main__":
@@ -0,0 +1,164 @@
+# Created by: Michael Jung (ID:10680322), Timothy Sanders (ID: 01002147), Megan Ng (ID: 00756276)
+
+# Date: 10/18/26
+
+# Course: Spr25_CS_034 CRN 39575
+
+#--------------------------------------------------------------------------------------------
+"""Ordered-container protocol and the registry of backends the managers are built from.
+
+InventoryManager and FlightManager store their data in any class that satisfies
+`OrderedContainer` and create it by name with `create_backend`, so a workload can switch
+trees through a constructor argument (or a config value passed to it) with no code changes.
+New implementations are added with `register_backend`.
+
+Persistent backends return a new version from `insert`/`delete` instead of changing the
+tree in place; `insert_key`, `delete_key` and `insert_batch` hide that difference and
+always return the container to keep using.
+"""
+from operator import itemgetter
+from typing import Any, Iterable, Iterator, Optional, Protocol, Tuple, runtime_checkable
+
+from AVLTree import AVLTree
+from RedBlackTree import RedBlackTree
+from avl_array_tree import ArrayAVLTree
+from bplus_tree import BPlusTree
+from persistent_tree import PersistentAVLTree, PersistentRedBlackTree, PersistentTree
+
+
+@runtime_checkable
+class OrderedContainer(Protocol):
+    """The sorted-map interface the managers rely on.
+
+    Constructors take `log_capacity` (plus backend-specific keyword options).
+    """
+    root: Any
+
+    @classmethod
+    def from_sorted(cls, iterable: Iterable, items: bool=False, **kwargs) -> 'OrderedContainer': ...
+    @classmethod
+    def from_unsorted(cls, iterable: Iterable, items: bool=False, **kwargs) -> 'OrderedContainer': ...
+    def insert(self, key: Any, payload: Any=None) -> Any: ...
+    def delete(self, key: Any) -> Any: ...
+    def get(self, key: Any, default: Any=None) -> Any: ...
+    def __contains__(self, key: Any) -> bool: ...
+    def __len__(self) -> int: ...
+    def __iter__(self) -> Iterator[Any]: ...
+    def items(self) -> Iterator[Tuple[Any, Any]]: ...
+    def irange(self, lo: Any=None, hi: Any=None, inclusive: Tuple[bool, bool]=(True, True),
+               reverse: bool=False) -> Iterator[Any]: ...
+    def irange_items(self, lo: Any=None, hi: Any=None, inclusive: Tuple[bool, bool]=(True, True),
+                     reverse: bool=False) -> Iterator[Tuple[Any, Any]]: ...
+    def floor(self, key: Any) -> Any: ...
+    def ceiling(self, key: Any) -> Any: ...
+    def min(self) -> Any: ...
+    def max(self) -> Any: ...
+    def print_tree(self, node=None, level: int=0, prefix: str='Root:', visited=None) -> None: ...
+    def print_log(self) -> None: ...
+
+
+# Methods a backend class must define (`root` is set per instance, so it is not checked here)
+REQUIRED_METHODS = ("from_sorted", "from_unsorted", "insert", "delete", "get", "__contains__", "__len__",
+                    "__iter__", "items", "irange", "irange_items", "floor", "ceiling", "min", "max", "print_tree",
+                    "print_log")
+
+# Backend name -> container class
+BACKENDS = {}
+
+
+def register_backend(name: str, backend_class: type, replace: bool=False) -> type:
+    """Makes a container class available to the managers under `name`.
+
+    Args:
+        name: The name passed as `backend=` to a manager.
+        backend_class: A class implementing OrderedContainer.
+        replace: Allow overriding an existing registration.
+
+    Returns:
+        `backend_class`, unchanged.
+
+    Raises:
+        ValueError: If `name` is already registered and `replace` is False.
+        TypeError: If `backend_class` lacks part of the OrderedContainer interface.
+    """
+    if name in BACKENDS and not replace:
+        raise ValueError(f"Backend {name!r} is already registered")
+    missing = [method for method in REQUIRED_METHODS if not callable(getattr(backend_class, method, None))]
+    if missing:
+        raise TypeError(f"{backend_class.__name__} is not an ordered container; missing {', '.join(missing)}")
+    BACKENDS[name] = backend_class
+    return backend_class
+
+
+def get_backend(name: str) -> type:
+    """Returns the container class registered as `name`.
+
+    Raises:
+        ValueError: If no backend has that name.
+    """
+    try:
+        return BACKENDS[name]
+    except KeyError:
+        raise ValueError(f"Unknown backend {name!r}; expected one of {backend_names()}") from None
+
+
+def create_backend(name: str, log_capacity: int=0, **options) -> OrderedContainer:
+    """Creates an empty container of the backend registered as `name`.
+
+    Args:
+        name: A registered backend name (see `backend_names`).
+        log_capacity: Number of recent operations the container logs; 0 disables logging.
+        **options: Backend-specific constructor arguments (e.g. `fanout` for "bplus").
+    """
+    return get_backend(name)(log_capacity=log_capacity, **options)
+
+
+def backend_names() -> list:
+    """Returns the registered backend names in sorted order."""
+    return sorted(BACKENDS)
+
+
+def backend_name(container: Any) -> Optional[str]:
+    """Returns the name a container's exact class is registered under, or None."""
+    return next((name for name, cls in BACKENDS.items() if type(container) is cls), None)
+
+
+def insert_key(container: OrderedContainer, key: Any, payload: Any=None) -> OrderedContainer:
+    """Inserts `key` (an existing key keeps its payload) and returns the container to use from now on."""
+    if isinstance(container, PersistentTree):
+        return container.insert(key, payload)
+    container.insert(key, payload)
+    return container
+
+
+def delete_key(container: OrderedContainer, key: Any) -> Tuple[OrderedContainer, bool]:
+    """Deletes `key`; returns the container to use from now on and whether the key was present."""
+    if isinstance(container, PersistentTree):
+        updated = container.delete(key)
+        return updated, updated is not container  # Unchanged version: the key was missing
+    return container, container.delete(key)
+
+
+def insert_batch(container: OrderedContainer, keys: Iterable, items: bool=False) -> OrderedContainer:
+    """
+    Adds a batch of keys (or `(key, payload)` pairs when `items` is True) and returns the
+    container holding them.
+
+    Trees with `insert_many` use it; other backends insert the sorted batch key by key, which
+    keeps consecutive descents on nearly the same path. Existing keys keep their payloads, as
+    with `insert`.
+    """
+    if hasattr(container, "insert_many"):
+        container.insert_many(keys, items)
+        return container
+    for key, payload in (sorted(keys, key=itemgetter(0)) if items else ((key, None) for key in sorted(keys))):
+        container = insert_key(container, key, payload)
+    return container
+
+
+register_backend("avl", AVLTree)                    # Node-object AVL tree (any comparable keys)
+register_backend("rbt", RedBlackTree)               # Node-object Red-Black tree (fewer rotations on writes)
+register_backend("array", ArrayAVLTree)             # Struct-of-arrays AVL tree (integer keys, much smaller per key)
+register_backend("bplus", BPlusTree)                # B+ tree of wide list nodes (fewest hops per lookup; `fanout`)
+register_backend("persistent", PersistentAVLTree)   # Path-copying AVL tree (O(1) snapshots for report jobs)
+register_backend("persistent-rbt", PersistentRedBlackTree)  # Path-copying Red-Black tree
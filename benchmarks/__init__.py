@@ -0,0 +1,2 @@
+# Benchmarks for the balanced tree implementations.
+# Run from the repository root, e.g.: python -m benchmarks.node_memory
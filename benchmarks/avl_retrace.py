@@ -0,0 +1,123 @@
+# Created by: Michael Jung (ID:10680322), Timothy Sanders (ID: 01002147), Megan Ng (ID: 00756276)
+
+# Date: 10/18/26
+
+# Course: Spr25_CS_034 CRN 39575
+
+#--------------------------------------------------------------------------------------------
+"""Counts ancestors visited per AVLTree insert: full-path retracing vs. early termination.
+
+The legacy variant reproduces the original insert, where `update_height` walked to the root
+after the insert and twice per rotation, and `update_balance` walked to the root again.
+
+Usage (from the repository root):
+    python -m benchmarks.avl_retrace [--count N] [--seed S]
+"""
+import argparse
+import random
+import time
+
+from AVLTree import AVLTree
+from avl_node import AvlNode
+
+
+class CountingAVLTree(AVLTree):
+    """AVLTree that accumulates the ancestors visited by the early-terminating retrace."""
+    def __init__(self):
+        super().__init__()
+        self.visits = 0
+
+    def _retrace_insert(self, node):
+        visited = super()._retrace_insert(node)
+        self.visits += visited
+        return visited
+
+
+class LegacyAVLTree(AVLTree):
+    """AVLTree with the original full-path retracing, counting every node it visits."""
+    def __init__(self):
+        super().__init__()
+        self.visits = 0
+
+    def update_height(self, node):
+        while node:
+            self.visits += 1
+            node.height = 1 + max(self.get_height(node.left), self.get_height(node.right))
+            node = node.parent
+
+    def left_rotate(self, node):
+        pivot = super().left_rotate(node)
+        self.update_height(node)  # The original rotations walked to the root twice
+        self.update_height(pivot)
+        return pivot
+
+    def right_rotate(self, node):
+        pivot = super().right_rotate(node)
+        self.update_height(node)
+        self.update_height(pivot)
+        return pivot
+
+    def insert(self, value, payload=None):
+        new_node = AvlNode(value, payload=payload)
+        if not self.root:
+            self.root = new_node
+            self.size += 1
+            return
+        parent, current = None, self.root
+        while current:
+            parent = current
+            if value < current.value:
+                current = current.left
+            elif value > current.value:
+                current = current.right
+            else:
+                return
+        new_node.parent = parent
+        if value < parent.value:
+            parent.left = new_node
+        else:
+            parent.right = new_node
+        self.size += 1
+        self.update_height(new_node)  # Original: walk to the root updating heights ...
+        node = new_node
+        while node:  # ... then walk to the root again checking balance
+            self.visits += 1
+            balance = self.get_balance(node)
+            if balance > 1:
+                if self.get_balance(node.left) < 0:
+                    self.left_rotate(node.left)
+                node = self.right_rotate(node)
+            elif balance < -1:
+                if self.get_balance(node.right) > 0:
+                    self.right_rotate(node.right)
+                node = self.left_rotate(node)
+            else:
+                node = node.parent
+
+
+def run(tree_class, keys):
+    tree = tree_class()
+    start = time.perf_counter()
+    for key in keys:
+        tree.insert(key)
+    elapsed = time.perf_counter() - start
+    return tree.visits / len(keys), len(keys) / elapsed, tree.get_height(tree.root)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=10**6, help="number of keys inserted")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    keys = list(range(args.count))
+    random.Random(args.seed).shuffle(keys)
+    print(f"{args.count} random inserts")
+    print(f"{'retracing':<18}{'visits/insert':>15}{'inserts/s':>12}{'height':>8}")
+    for name, tree_class in (("full path", LegacyAVLTree), ("early exit", CountingAVLTree)):
+        visits, rate, height = run(tree_class, keys)
+        print(f"{name:<18}{visits:>15.2f}{rate:>12.0f}{height:>8}")
+
+
+if __name__ == "__main__":
+    main()
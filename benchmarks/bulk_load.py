@@ -0,0 +1,54 @@
+# Created by: Michael Jung (ID:10680322), Timothy Sanders (ID: 01002147), Megan Ng (ID: 00756276)
+
+# Date: 10/18/26
+
+# Course: Spr25_CS_034 CRN 39575
+
+#--------------------------------------------------------------------------------------------
+"""Cold-start time: n individual inserts vs. the O(n) from_sorted / from_unsorted bulk builds.
+
+Usage (from the repository root):
+    python -m benchmarks.bulk_load [--count N]
+"""
+import argparse
+import gc
+import random
+import time
+
+from AVLTree import AVLTree
+from RedBlackTree import RedBlackTree
+from avl_array_tree import ArrayAVLTree
+
+
+def timed(build):
+    gc.collect()  # Free the previous tree's reference cycles outside the timed region
+    start = time.perf_counter()
+    tree = build()
+    return time.perf_counter() - start, tree
+
+
+def insert_all(tree_class, keys):
+    tree = tree_class()
+    for key in keys:
+        tree.insert(key)
+    return tree
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=10**6, help="number of keys loaded")
+    args = parser.parse_args()
+
+    keys = random.Random(1).sample(range(10 * args.count), args.count)
+    print(f"{args.count} keys, seconds")
+    print(f"{'tree':<16}{'inserts':>10}{'unsorted':>10}{'sorted':>10}")
+    ordered = sorted(keys)
+    for tree_class in (AVLTree, RedBlackTree, ArrayAVLTree):
+        inserts, _ = timed(lambda: insert_all(tree_class, keys))
+        unsorted, _ = timed(lambda: tree_class.from_unsorted(keys))
+        presorted, _ = timed(lambda: tree_class.from_sorted(ordered))
+        print(f"{tree_class.__name__:<16}{inserts:>10.2f}{unsorted:>10.2f}{presorted:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+# Created by: Michael Jung (ID:10680322), Timothy Sanders (ID: 01002147), Megan Ng (ID: 00756276)
+
+# Date: 10/18/26
+
+# Course: Spr25_CS_034 CRN 39575
+
+#--------------------------------------------------------------------------------------------
+"""Read throughput under a concurrent writer: one manager-wide mutex vs. ConcurrentFlightManager.
+
+A thread pool runs range scans while one writer thread keeps scheduling and cancelling
+flights. Each scan can "send" its result while still holding the lock (`--io-ms`, a sleep
+standing in for a socket write); that is where shared read locking pays off under the GIL.
+Pure in-memory scans (`--io-ms 0`) are CPU-bound and cannot run in parallel on a GIL build.
+
+Usage (from the repository root):
+    python -m benchmarks.concurrent_reads [--flights N] [--threads 1,2,4,8] [--io-ms 1.0]
+"""
+import argparse
+import io
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager, redirect_stdout
+
+from concurrent_flight_manager import ConcurrentFlightManager
+from generate_data import generate_key_set
+
+
+class ExclusiveLock:
+    """One mutex for readers and writers alike (the manager-wide lock being replaced)."""
+    def __init__(self):
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def read_locked(self):
+        with self._lock:
+            yield
+
+    write_locked = read_locked
+
+
+def make_manager(flight_ids, exclusive):
+    manager = ConcurrentFlightManager(log_capacity=0)
+    with redirect_stdout(io.StringIO()):  # Silence the "Loaded ..." message
+        manager.load_flights(sorted(flight_ids), presorted=True)
+    if exclusive:
+        manager.lock = ExclusiveLock()
+    return manager
+
+
+def measure(manager, threads, scans_per_thread, width, io_seconds, spread):
+    """Returns reader scans per second while a writer thread churns the schedule."""
+    stop = threading.Event()
+
+    def writer():
+        rng = random.Random(0)
+        while not stop.is_set():
+            flight_id = rng.randrange(spread)
+            manager.queue_schedule(flight_id)
+            manager.queue_cancel(flight_id)
+            time.sleep(0.0005)  # A steady, modest write rate
+
+    def reader(seed):
+        rng = random.Random(seed)
+        sink = []
+        for _ in range(scans_per_thread):
+            lo = rng.randrange(spread)
+            with manager.lock.read_locked():
+                sink.extend(manager.tree.irange(lo, lo + width))
+                if io_seconds:
+                    time.sleep(io_seconds)  # Stream the scan to a socket while holding the lock
+            sink.clear()
+
+    write_thread = threading.Thread(target=writer)
+    write_thread.start()
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        list(pool.map(reader, range(threads)))
+    elapsed = time.perf_counter() - start
+    stop.set()
+    write_thread.join()
+    manager.flush()
+    return threads * scans_per_thread / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--flights", type=int, default=100_000, help="flights in the schedule")
+    parser.add_argument("--threads", default="1,2,4,8", help="comma-separated reader thread counts")
+    parser.add_argument("--scans", type=int, default=200, help="range scans per reader thread")
+    parser.add_argument("--width", type=int, default=2000, help="flight-ID span of each scan")
+    parser.add_argument("--io-ms", type=float, default=1.0, help="simulated send time per scan")
+    args = parser.parse_args()
+
+    flight_ids = generate_key_set(args.flights)
+    spread = max(flight_ids)
+    print(f"{args.flights} flights, {args.io_ms} ms simulated I/O per scan, scans/sec")
+    print(f"{'threads':>8}{'mutex':>12}{'rw lock':>12}{'speedup':>10}")
+    for threads in (int(t) for t in args.threads.split(",")):
+        rates = [measure(make_manager(flight_ids, exclusive), threads, args.scans, args.width,
+                         args.io_ms / 1000, spread)
+                 for exclusive in (True, False)]
+        print(f"{threads:>8}{rates[0]:>12.0f}{rates[1]:>12.0f}{rates[1] / rates[0]:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
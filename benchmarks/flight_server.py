@@ -0,0 +1,67 @@
+# Created by: Michael Jung (ID:10680322), Timothy Sanders (ID: 01002147), Megan Ng (ID: 00756276)
+
+# Date: 10/18/26
+
+# Course: Spr25_CS_034 CRN 39575
+
+#--------------------------------------------------------------------------------------------
+"""Write throughput of the flight server: one tree update per request vs. coalesced batches.
+
+`--clients` connections each pipeline `--writes` schedule requests (in windows of
+`--window` outstanding requests) against a FlightServer on localhost that already holds
+`--count` flights. `batch_size=1` applies every write on its own, as a one-request-at-a-time
+front end would; the default applies whatever has queued up as one batched merge.
+
+Usage (from the repository root):
+    python -m benchmarks.flight_server [--count N] [--clients N] [--writes N] [--window N]
+"""
+import argparse
+import asyncio
+import random
+import time
+
+from flight_server import FlightClient, FlightServer
+from rbt_flight_manager import FlightManager
+
+
+async def measure(manager, batch_size, clients, flight_ids, window):
+    server = FlightServer(manager, batch_size=batch_size)
+    await server.start(port=0)
+    connections = [await FlightClient.connect(port=server.port) for _ in range(clients)]
+
+    async def drive(client, own):
+        for start in range(0, len(own), window):
+            await asyncio.gather(*(client.request("schedule", flight=flight_id)
+                                   for flight_id in own[start:start + window]))
+
+    started = time.perf_counter()
+    await asyncio.gather(*(drive(client, flight_ids[number::clients]) for number, client in enumerate(connections)))
+    seconds = time.perf_counter() - started
+    for client in connections:
+        await client.close()
+    await server.close()
+    return len(flight_ids) / seconds, server.writes / max(server.batches, 1)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=200_000, help="flights scheduled before the run")
+    parser.add_argument("--clients", type=int, default=8, help="concurrent connections")
+    parser.add_argument("--writes", type=int, default=5_000, help="schedule requests per connection")
+    parser.add_argument("--window", type=int, default=64, help="outstanding requests per connection")
+    args = parser.parse_args()
+
+    rng = random.Random(25)
+    existing = [f"F{number:07d}" for number in rng.sample(range(10_000_000), args.count)]
+    print(f"{args.count} flights, {args.clients} clients x {args.writes} writes, window {args.window}")
+    print(f"{'batching':<12}{'writes/s':>10}{'per batch':>11}")
+    for label, batch_size in (("off", 1), ("coalesced", 1024)):
+        manager = FlightManager(log_capacity=0, verbose=False)
+        manager.load_flights(existing)
+        new = [f"F{number:07d}" for number in rng.sample(range(10_000_000), args.clients * args.writes)]
+        throughput, per_batch = asyncio.run(measure(manager, batch_size, args.clients, new, args.window))
+        print(f"{label:<12}{throughput:>10.0f}{per_batch:>11.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+# Created by: Michael Jung (ID:10680322), Timothy Sanders (ID: 01002147), Megan Ng (ID: 00756276)
+
+# Date: 10/18/26
+
+# Course: Spr25_CS_034 CRN 39575
+
+#--------------------------------------------------------------------------------------------
+"""Batch inserts: an insert loop vs. insert_many's two strategies and its automatic choice.
+
+Batches of several sizes are added to a tree of `--count` random keys, either spread over
+the whole key range ("spread") or as one run of new IDs above the current maximum ("append").
+Forcing each strategy is done by overriding REBUILD_COST on the tree instance.
+
+Usage (from the repository root):
+    python -m benchmarks.insert_many [--count N] [--batches 100,1000,10000,100000]
+"""
+import argparse
+import random
+
+from AVLTree import AVLTree
+from RedBlackTree import RedBlackTree
+from benchmarks.bulk_load import timed
+from generate_data import generate_key_set
+
+STRATEGIES = {
+    "auto": None,
+    "merge": 1e-9,           # Merge at any range size
+    "sorted": float("inf"),  # Never merge
+}
+
+
+def batch_keys(layout, size, count, rng):
+    top = 1000 + 10 * count  # generate_key_set draws from range(1000, top)
+    if layout == "append":
+        return list(range(top, top + size))
+    return rng.sample(range(1000, top), size)  # Interleaved with the tree's keys
+
+
+def run(tree_class, keys, batch, strategy):
+    tree = tree_class.from_unsorted(keys)
+    if strategy == "loop":
+        def add():
+            for key in batch:
+                tree.insert(key)
+    else:
+        if STRATEGIES[strategy] is not None:
+            tree.REBUILD_COST = STRATEGIES[strategy]
+        def add():
+            tree.insert_many(batch)
+    seconds, _ = timed(add)
+    return seconds
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=100_000, help="keys in the tree before the batch")
+    parser.add_argument("--batches", default="100,1000,10000,100000", help="comma-separated batch sizes")
+    args = parser.parse_args()
+
+    keys = [key * 2 for key in generate_key_set(args.count)]  # Even keys leave room for odd batch keys
+    rng = random.Random(18)
+    columns = ["loop", *STRATEGIES]
+    print(f"{args.count} keys in the tree, milliseconds per batch")
+    print(f"{'tree':<14}{'layout':<8}{'batch':>8}" + "".join(f"{column:>10}" for column in columns))
+    for tree_class in (AVLTree, RedBlackTree):
+        for layout in ("spread", "append"):
+            for size in (int(size) for size in args.batches.split(",")):
+                batch = [key * 2 + 1 for key in batch_keys(layout, size, args.count, rng)]
+                times = [run(tree_class, keys, batch, column) * 1000 for column in columns]
+                print(f"{tree_class.__name__:<14}{layout:<8}{size:>8}" + "".join(f"{ms:>10.1f}" for ms in times))
+
+
+if __name__ == "__main__":
+    main()
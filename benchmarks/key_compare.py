@@ -0,0 +1,111 @@
+# Created by: Michael Jung (ID:10680322), Timothy Sanders (ID: 01002147), Megan Ng (ID: 00756276)
+
+# Date: 10/18/26
+
+# Course: Spr25_CS_034 CRN 39575
+
+#--------------------------------------------------------------------------------------------
+"""Key comparisons: descent styles and cached `key=` sort keys on flight-number strings.
+
+Part one times lookups (hits and misses) with the previous descent, which tested `<` and
+then `>` at every level, against the current one-comparison descent (`_find_node`).
+Part two orders flight numbers naturally ("AA99" before "AA100") three ways: as plain
+strings (lexicographic, for reference), with `key=` (the derived key is computed once per
+inserted key and cached on the node) and with a wrapper object that derives the key inside
+every `__lt__`, which is what ordering by key costs without the cache.
+
+Usage (from the repository root):
+    python -m benchmarks.key_compare [--count N] [--lookups N]
+"""
+import argparse
+import random
+
+from AVLTree import AVLTree
+from RedBlackTree import RedBlackTree
+from benchmarks.bulk_load import timed
+from generate_data import AIRLINE_CODES
+
+
+def flight_numbers(count, rng):
+    """Returns `count` distinct IDs shaped like generate_flight_numbers', with wider numbers."""
+    flights = set()
+    while len(flights) < count:
+        flights.add(f"{rng.choice(AIRLINE_CODES)}{rng.randint(1, 99_999)}")
+    return list(flights)
+
+
+def natural_key(flight_id):
+    """("AA", 99) sorts before ("AA", 100), unlike the strings themselves."""
+    return flight_id[:2], int(flight_id[2:])
+
+
+class PerCompareKey:
+    """Orders flight IDs by natural_key, deriving both keys on every comparison."""
+    __slots__ = ("flight_id",)
+
+    def __init__(self, flight_id):
+        self.flight_id = flight_id
+
+    def __lt__(self, other):
+        return natural_key(self.flight_id) < natural_key(other.flight_id)
+
+    def __gt__(self, other):
+        return natural_key(self.flight_id) > natural_key(other.flight_id)
+
+
+def two_comparison_find(tree, key):
+    """The descent `_find_node` used before: `<`, then `>`, then equality by elimination."""
+    current = tree.root
+    while current:
+        if key < current.value:
+            current = current.left
+        elif key > current.value:
+            current = current.right
+        else:
+            return current
+    return None
+
+
+def time_lookups(find, tree, probes):
+    seconds, _ = timed(lambda: [find(tree, key) for key in probes])
+    return seconds / len(probes) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=100_000, help="flight IDs in each tree")
+    parser.add_argument("--lookups", type=int, default=200_000, help="lookups per measurement")
+    args = parser.parse_args()
+
+    rng = random.Random(23)
+    flights = flight_numbers(args.count, rng)
+    hits = [rng.choice(flights) for _ in range(args.lookups)]
+    misses = [f"{rng.choice(AIRLINE_CODES)}{rng.randint(100_000, 999_999)}" for _ in range(args.lookups)]
+
+    print(f"{args.count} flight IDs, microseconds per lookup")
+    print(f"{'tree':<14}{'probes':<8}{'< and >':>10}{'< only':>10}")
+    for tree_class in (AVLTree, RedBlackTree):
+        tree = tree_class.from_unsorted(flights)
+        for label, probes in (("hits", hits), ("misses", misses)):
+            before = time_lookups(two_comparison_find, tree, probes)
+            after = time_lookups(tree_class._find_node, tree, probes)
+            print(f"{tree_class.__name__:<14}{label:<8}{before:>10.2f}{after:>10.2f}")
+
+    print("\nNatural flight-number order, microseconds per operation")
+    print(f"{'tree':<14}{'operation':<10}{'strings':>10}{'key=':>10}{'per-compare':>13}")
+    wrapped_flights = [PerCompareKey(flight_id) for flight_id in flights]
+    wrapped_hits = [PerCompareKey(flight_id) for flight_id in hits]
+    for tree_class in (AVLTree, RedBlackTree):
+        plain, keyed, wrapped = tree_class(), tree_class(key=natural_key), tree_class()
+        columns = []
+        for tree, keys in ((plain, flights), (keyed, flights), (wrapped, wrapped_flights)):
+            seconds, _ = timed(lambda: [tree.insert(key) for key in keys])
+            columns.append(seconds / len(keys) * 1e6)
+        print(f"{tree_class.__name__:<14}{'insert':<10}{columns[0]:>10.2f}{columns[1]:>10.2f}{columns[2]:>13.2f}")
+        columns = [time_lookups(type(tree).__contains__, tree, probes)
+                   for tree, probes in ((plain, hits), (keyed, hits), (wrapped, wrapped_hits))]
+        print(f"{tree_class.__name__:<14}{'lookup':<10}{columns[0]:>10.2f}{columns[1]:>10.2f}{columns[2]:>13.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+# Created by: Michael Jung (ID:10680322), Timothy Sanders (ID: 01002147), Megan Ng (ID: 00756276)
+
+# Date: 10/18/26
+
+# Course: Spr25_CS_034 CRN 39575
+
+#--------------------------------------------------------------------------------------------
+"""Measures bytes per node for the slotted node classes against the original dict-based layout.
+
+Also compares whole trees: AVLTree (node objects) against ArrayAVLTree (parallel arrays).
+
+Usage (from the repository root):
+    python -m benchmarks.node_memory [--count N]
+"""
+import argparse
+import tracemalloc
+
+from AVLTree import AVLTree
+from avl_array_tree import ArrayAVLTree
+from avl_node import AvlNode
+from bst_node import BstNode
+from red_black_node import RedBlackTreeNode
+
+
+# --- Original node layout (per-instance __dict__, per-node debug flag, string color) ---
+class LegacyBstNode:
+    def __init__(self, value, parent=None, debug=False):
+        self.debug = debug
+        self.value = value
+        self.left = None
+        self.right = None
+        self.parent = parent
+
+
+class LegacyAvlNode(LegacyBstNode):
+    def __init__(self, value, debug=False):
+        super().__init__(value)
+        self.debug = debug
+        self.height = 1
+
+
+class LegacyRedBlackTreeNode(LegacyBstNode):
+    def __init__(self, value, parent=None, is_red=True, debug=False):
+        super().__init__(value)
+        self.color = 'R' if is_red else 'B'
+        self.debug = debug
+
+
+def bytes_per_node(node_class, count: int) -> float:
+    """Allocates `count` nodes with shared integer keys and returns the traced bytes per node."""
+    keys = list(range(count))  # Allocated up front so only the nodes are measured
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    nodes = [node_class(key) for key in keys]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    list_overhead = 8 * count  # The list holding the nodes (one pointer per node)
+    del nodes
+    return (after - before - list_overhead) / count
+
+
+def bytes_per_entry(tree_class, count: int, include_keys: bool) -> float:
+    """Builds a tree of `count` integer keys and returns the traced bytes per entry.
+
+    With `include_keys`, the int objects are created inside the measurement, which is what a
+    node-object tree pays per key; the array tree stores keys unboxed either way.
+    """
+    keys = None if include_keys else list(range(10**6, 10**6 + count))
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    tree = tree_class()
+    for key in (keys if keys is not None else range(10**6, 10**6 + count)):
+        tree.insert(key)
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del tree
+    return (after - before) / count
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=200_000, help="nodes allocated per measurement")
+    args = parser.parse_args()
+
+    pairs = [
+        ("BstNode", LegacyBstNode, BstNode),
+        ("AvlNode", LegacyAvlNode, AvlNode),
+        ("RedBlackTreeNode", LegacyRedBlackTreeNode, RedBlackTreeNode),
+    ]
+    print(f"{'node class':<18}{'before (B)':>12}{'after (B)':>12}{'saved':>8}")
+    for name, legacy, current in pairs:
+        old = bytes_per_node(legacy, args.count)
+        new = bytes_per_node(current, args.count)
+        print(f"{name:<18}{old:>12.1f}{new:>12.1f}{1 - new / old:>8.0%}")
+
+    count = min(args.count, 100_000)
+    print(f"\n{'tree (bytes/entry)':<24}{'nodes only':>12}{'with keys':>12}")
+    for tree_class in (AVLTree, ArrayAVLTree):
+        print(f"{tree_class.__name__:<24}{bytes_per_entry(tree_class, count, False):>12.1f}"
+              f"{bytes_per_entry(tree_class, count, True):>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+# Created by: Michael Jung (ID:10680322), Timothy Sanders (ID: 01002147), Megan Ng (ID: 00756276)
+
+# Date: 10/18/26
+
+# Course: Spr25_CS_034 CRN 39575
+
+#--------------------------------------------------------------------------------------------
+"""Merging a small delta into a large tree: join-based union vs. key-by-key inserts.
+
+Usage (from the repository root):
+    python -m benchmarks.set_algebra [--count N] [--delta M]
+"""
+import argparse
+import gc
+import random
+import time
+
+from AVLTree import AVLTree
+from RedBlackTree import RedBlackTree
+
+
+def timed(operation):
+    gc.collect()
+    start = time.perf_counter()
+    operation()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=10**6, help="keys in the large tree")
+    parser.add_argument("--delta", type=int, default=1000, help="keys in the delta")
+    args = parser.parse_args()
+
+    rng = random.Random(2)
+    base = range(0, 2 * args.count, 2)
+    delta = sorted(rng.sample(range(2 * args.count), args.delta))
+    print(f"merge {args.delta} keys into {args.count}, milliseconds")
+    print(f"{'tree':<16}{'inserts':>10}{'union':>10}{'difference':>12}")
+    for tree_class in (AVLTree, RedBlackTree):
+        tree = tree_class.from_sorted(base)
+        inserts = timed(lambda: [tree.insert(key) for key in delta])
+        tree = tree_class.from_sorted(base)
+        union = timed(lambda: tree.union(tree_class.from_sorted(delta)))
+        difference = timed(lambda: tree.difference(tree_class.from_sorted(delta)))
+        print(f"{tree_class.__name__:<16}{inserts * 1e3:>10.1f}{union * 1e3:>10.1f}{difference * 1e3:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+# Created by: Michael Jung (ID:10680322), Timothy Sanders (ID: 01002147), Megan Ng (ID: 00756276)
+
+# Date: 10/18/26
+
+# Course: Spr25_CS_034 CRN 39575
+
+#--------------------------------------------------------------------------------------------
+"""Parallel ingest and range scans: one in-process AVLTree vs. ShardedTree worker processes.
+
+Each configuration bulk-loads `--count` random keys, merges `--batches` batches of
+`--batch` new keys, then runs wide range scans (each covering about a tenth of the keys).
+Shards only run in parallel on separate cores, and every key crosses a pipe twice
+(pickled), so the speedup is bounded by the core count and eaten into by that transfer.
+
+Usage (from the repository root):
+    python -m benchmarks.sharded_ingest [--count N] [--shards 1,2,4] [--batch N] [--batches N]
+"""
+import argparse
+import os
+import random
+
+from AVLTree import AVLTree
+from benchmarks.bulk_load import timed
+from generate_data import generate_key_set
+from sharded_tree import ShardedTree
+
+
+def workload(tree, load, keys, batches, scans):
+    load_seconds, _ = timed(lambda: load(keys))
+    merge_seconds, _ = timed(lambda: [tree.insert_many(batch) for batch in batches])
+    scan_seconds, _ = timed(lambda: [sum(1 for _ in tree.irange(lo, hi)) for lo, hi in scans])
+    return load_seconds, merge_seconds, scan_seconds
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=500_000, help="keys bulk-loaded before the batches")
+    parser.add_argument("--shards", default="1,2,4", help="comma-separated shard counts")
+    parser.add_argument("--batch", type=int, default=50_000, help="keys per merged batch")
+    parser.add_argument("--batches", type=int, default=4, help="number of merged batches")
+    parser.add_argument("--scans", type=int, default=10, help="number of range scans")
+    args = parser.parse_args()
+
+    keys = [key * 2 for key in generate_key_set(args.count)]  # Even keys; batches add odd ones
+    rng = random.Random(24)
+    top = max(keys)
+    batches = [[rng.randrange(top) | 1 for _ in range(args.batch)] for _ in range(args.batches)]
+    scans = [(lo, lo + top // 10) for lo in (rng.randrange(top - top // 10) for _ in range(args.scans))]
+
+    print(f"{os.cpu_count()} CPUs, {args.count} keys, {args.batches} x {args.batch}-key batches, "
+          f"{args.scans} scans; seconds")
+    print(f"{'structure':<18}{'load':>8}{'merge':>8}{'scans':>8}")
+    holder = {}
+
+    def load_single(data):
+        holder["tree"] = AVLTree.from_unsorted(data)
+
+    class Single:  # Forwards to the tree built inside the timed load
+        def __getattr__(self, name):
+            return getattr(holder["tree"], name)
+
+    times = workload(Single(), load_single, keys, batches, scans)
+    print(f"{'AVLTree':<18}" + "".join(f"{seconds:>8.2f}" for seconds in times))
+    for shards in (int(count) for count in args.shards.split(",")):
+        with ShardedTree(shards=shards, max_skew=None) as tree:
+            times = workload(tree, tree.load, keys, batches, scans)
+            print(f"{f'ShardedTree x{shards}':<18}" + "".join(f"{seconds:>8.2f}" for seconds in times))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+# Created by: Michael Jung (ID:10680322), Timothy Sanders (ID: 01002147), Megan Ng (ID: 00756276)
+
+# Date: 10/18/26
+
+# Course: Spr25_CS_034 CRN 39575
+
+#--------------------------------------------------------------------------------------------
+"""Reload time: JSON list + inserts vs. binary snapshot (relinked tree or mapped index).
+
+Usage (from the repository root):
+    python -m benchmarks.snapshot_load [--count N]
+"""
+import argparse
+import os
+import tempfile
+
+from AVLTree import AVLTree
+from RedBlackTree import RedBlackTree
+from benchmarks.bulk_load import insert_all, timed
+from generate_data import generate_key_set, load_from_file, save_to_file
+from tree_snapshot import MappedIndex, load_snapshot, save_snapshot
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=10**6, help="number of keys saved and reloaded")
+    args = parser.parse_args()
+
+    keys = generate_key_set(args.count)
+    print(f"{args.count} keys, seconds")
+    print(f"{'tree':<14}{'json+insert':>12}{'snapshot':>10}{'mapped':>10}{'json MB':>9}{'snap MB':>9}")
+    with tempfile.TemporaryDirectory() as scratch:
+        json_path = os.path.join(scratch, "keys.json")
+        snapshot_path = os.path.join(scratch, "keys.bin")
+        for tree_class in (AVLTree, RedBlackTree):
+            tree = tree_class.from_unsorted(keys)
+            save_to_file(list(tree), json_path)
+            save_snapshot(tree, snapshot_path)
+            json_load, _ = timed(lambda: insert_all(tree_class, load_from_file(json_path)))
+            snapshot_load, _ = timed(lambda: load_snapshot(snapshot_path, tree_class))
+            mapped, index = timed(lambda: MappedIndex(snapshot_path))
+            index.close()
+            sizes = [os.path.getsize(path) / 2**20 for path in (json_path, snapshot_path)]
+            print(f"{tree_class.__name__:<14}{json_load:>12.2f}{snapshot_load:>10.2f}{mapped:>10.3f}"
+                  f"{sizes[0]:>9.1f}{sizes[1]:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
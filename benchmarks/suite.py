@@ -0,0 +1,207 @@
+# Created by: Michael Jung (ID:10680322), Timothy Sanders (ID: 01002147), Megan Ng (ID: 00756276)
+
+# Date: 10/18/26
+
+# Course: Spr25_CS_034 CRN 39575
+
+#--------------------------------------------------------------------------------------------
+"""Comparative benchmark: AVLTree, RedBlackTree and BPlusTree against bisect-list and dict baselines.
+
+Each structure runs bulk-load, insert, lookup, range-scan and delete workloads on the same
+key set (generate_data.generate_key_set). The report is JSON with ops/sec per workload,
+peak traced memory of a key-by-key build and rotation counts.
+
+Pure-Python trees take minutes per workload at 10^7 keys; pick the sizes accordingly.
+
+Usage (from the repository root):
+    python -m benchmarks.suite [--sizes 1000,10000,100000] [--output results.json] [--no-memory]
+"""
+import argparse
+import bisect
+import gc
+import json
+import platform
+import random
+import sys
+import time
+import tracemalloc
+
+from AVLTree import AVLTree
+from RedBlackTree import RedBlackTree
+from bplus_tree import BPlusTree
+from generate_data import generate_key_set
+
+
+# --- Baselines exposing the same methods as the trees ---
+class SortedListBaseline:
+    """Sorted key list maintained with bisect; inserts and deletes shift the list (O(n))."""
+    def __init__(self):
+        self.keys = []
+        self.payloads = []
+
+    @classmethod
+    def from_sorted(cls, keys):
+        baseline = cls()
+        baseline.keys = list(keys)
+        baseline.payloads = [None] * len(baseline.keys)
+        return baseline
+
+    def insert(self, key, payload=None):
+        index = bisect.bisect_left(self.keys, key)
+        if index < len(self.keys) and self.keys[index] == key:
+            return
+        self.keys.insert(index, key)
+        self.payloads.insert(index, payload)
+
+    def get(self, key, default=None):
+        index = bisect.bisect_left(self.keys, key)
+        if index < len(self.keys) and self.keys[index] == key:
+            return self.payloads[index]
+        return default
+
+    def delete(self, key):
+        index = bisect.bisect_left(self.keys, key)
+        if index < len(self.keys) and self.keys[index] == key:
+            del self.keys[index]
+            del self.payloads[index]
+            return True
+        return False
+
+    def irange(self, lo, hi):
+        keys = self.keys
+        return (keys[i] for i in range(bisect.bisect_left(keys, lo), bisect.bisect_right(keys, hi)))
+
+
+class DictBaseline:
+    """Hash map: O(1) point operations, but a range scan has to filter every key."""
+    def __init__(self):
+        self.data = {}
+
+    @classmethod
+    def from_sorted(cls, keys):
+        baseline = cls()
+        baseline.data = dict.fromkeys(keys)
+        return baseline
+
+    def insert(self, key, payload=None):
+        self.data.setdefault(key, payload)
+
+    def get(self, key, default=None):
+        return self.data.get(key, default)
+
+    def delete(self, key):
+        return self.data.pop(key, self) is not self
+
+    def irange(self, lo, hi):
+        return (key for key in self.data if lo <= key <= hi)
+
+
+STRUCTURES = {
+    "avl": AVLTree,
+    "rbt": RedBlackTree,
+    "bplus": BPlusTree,
+    "bisect": SortedListBaseline,
+    "dict": DictBaseline,
+}
+
+
+def timed(work):
+    """Runs `work()` after a collection and returns (seconds, result)."""
+    gc.collect()  # Free the previous structure's reference cycles outside the timed region
+    start = time.perf_counter()
+    result = work()
+    return time.perf_counter() - start, result
+
+
+def insert_all(structure, keys):
+    container = structure()
+    for key in keys:
+        container.insert(key)
+    return container
+
+
+def peak_memory(work):
+    """Returns the peak traced bytes while running `work()`."""
+    gc.collect()
+    tracemalloc.start()
+    result = work()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    del result
+    return peak
+
+
+def run_structure(name, keys, scans, width, measure_memory):
+    """Runs every workload for one structure and returns its result record."""
+    structure = STRUCTURES[name]
+    count = len(keys)
+    ordered = sorted(keys)
+    rng = random.Random(count)
+    probes = rng.sample(keys, count)
+    starts = [ordered[rng.randrange(max(1, count - width))] for _ in range(scans)]
+    spacing = (ordered[-1] - ordered[0]) / count if count > 1 else 1  # Mean gap between keys
+    span = int(width * spacing)  # Key range covering about `width` keys
+
+    seconds = {}
+    seconds["bulk_load"], _ = timed(lambda: structure.from_sorted(ordered))
+    seconds["insert"], container = timed(lambda: insert_all(structure, keys))
+    insert_rotations = getattr(container, "rotation_count", None)
+    seconds["lookup"], _ = timed(lambda: [container.get(key) for key in probes])
+    seconds["range_scan"], scanned = timed(
+        lambda: sum(sum(1 for _ in container.irange(lo, lo + span)) for lo in starts))
+    seconds["delete"], _ = timed(lambda: [container.delete(key) for key in probes])
+    operations = {"bulk_load": count, "insert": count, "lookup": count,
+                  "range_scan": scanned, "delete": count}  # Range scans count keys yielded
+
+    record = {
+        "structure": name,
+        "keys": count,
+        "ops_per_sec": {workload: operations[workload] / seconds[workload] if seconds[workload] else None
+                        for workload in seconds},
+        "seconds": seconds,
+        "rotations": None if insert_rotations is None else {
+            "insert": insert_rotations,
+            "delete": container.rotation_count - insert_rotations,
+        },
+    }
+    if measure_memory:
+        peak = peak_memory(lambda: insert_all(structure, keys))
+        record["peak_memory_bytes"] = peak
+        record["peak_bytes_per_key"] = peak / count
+    return record
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default="1000,10000,100000",
+                        help="comma-separated key counts (10^3 to 10^7)")
+    parser.add_argument("--structures", default=",".join(STRUCTURES),
+                        help="comma-separated subset of: " + ", ".join(STRUCTURES))
+    parser.add_argument("--scans", type=int, default=1000, help="range scans per size")
+    parser.add_argument("--width", type=int, default=100, help="approximate keys per range scan")
+    parser.add_argument("--output", help="write the JSON report to this file instead of stdout")
+    parser.add_argument("--no-memory", action="store_true", help="skip the tracemalloc pass")
+    args = parser.parse_args()
+
+    report = {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "results": [],
+    }
+    for size in (int(float(size)) for size in args.sizes.split(",")):
+        keys = generate_key_set(size)
+        for name in args.structures.split(","):
+            print(f"{name} x {size}...", file=sys.stderr)
+            report["results"].append(
+                run_structure(name, keys, args.scans, args.width, not args.no_memory))
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
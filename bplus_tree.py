@@ -0,0 +1,457 @@
+# Created by: Michael Jung (ID:10680322), Timothy Sanders (ID: 01002147), Megan Ng (ID: 00756276)
+
+# Date: 10/18/26
+
+# Course: Spr25_CS_034 CRN 39575
+
+#--------------------------------------------------------------------------------------------
+from bisect import bisect_left, bisect_right
+from operator import itemgetter
+from typing import Any, Iterable, Iterator, List, Tuple
+
+from bst_tree import BinarySearchTree
+from operation_log import OP_DELETE, OP_DUPLICATE, OP_INSERT, OP_MISSING, OperationLog
+
+
+class BPlusLeaf:
+    """Leaf of a B+ tree: sorted keys with their payloads, linked to its neighbouring leaves."""
+    __slots__ = ('keys', 'payloads', 'prev', 'next')
+
+    def __init__(self, keys: List[Any], payloads: List[Any]):
+        self.keys = keys
+        self.payloads = payloads
+        self.prev = None
+        self.next = None
+
+
+class BPlusBranch:
+    """Inner node of a B+ tree: `children[i]` holds the keys k with `keys[i-1] <= k < keys[i]`."""
+    __slots__ = ('keys', 'children')
+
+    def __init__(self, keys: List[Any], children: List[Any]):
+        self.keys = keys
+        self.children = children
+
+
+class BPlusTree:
+    """B+ tree: wide nodes holding sorted Python lists, with all entries in linked leaves.
+
+    Each node holds up to `fanout` keys (leaves) or children (branches), so a lookup walks
+    only log_fanout(n) nodes and does the rest of its search with `bisect` inside C-level
+    lists, instead of chasing one node object per level as the binary trees do. Range scans
+    find their first leaf once and then slice along the leaf chain.
+
+    Exposes the same insert/search/delete/iterate API as AVLTree, so InventoryManager can
+    switch to it by configuration.
+
+    Args:
+        fanout (int): Maximum keys per leaf and children per branch (at least 4). Defaults to 64.
+        log_capacity (int): Number of recent operations to keep in the log; 0 disables logging
+
+    Attributes:
+        root: The root leaf or branch, or None when the tree is empty
+        size (int): Number of keys stored in the tree
+        split_count (int): Node splits performed by inserts
+        merge_count (int): Node merges performed by deletes
+        log (OperationLog): Ring buffer of recent operations, or None when logging is off
+    """
+    def __init__(self, fanout: int=64, log_capacity: int=0):
+        if fanout < 4:
+            raise ValueError("fanout must be at least 4")
+        self.fanout = fanout
+        self.root = None
+        self.size = 0
+        self.split_count = 0
+        self.merge_count = 0
+        self.log = OperationLog(log_capacity) if log_capacity else None
+
+    @classmethod
+    def from_sorted(cls, iterable: Iterable, items: bool=False, **kwargs) -> 'BPlusTree':
+        """Builds a tree from keys in ascending order in O(n), level by level.
+
+        The keys are spread evenly over the fewest leaves that hold them, and each level of
+        branches over the fewest branches that hold the level below, so every node is at
+        least half full.
+
+        Args:
+            iterable: Keys in ascending order, or `(key, payload)` pairs when `items` is True.
+            items: Whether the iterable yields `(key, payload)` pairs.
+            **kwargs: Passed to the tree constructor (`fanout`, `log_capacity`).
+
+        Raises:
+            ValueError: If the keys are not in ascending order.
+        """
+        tree = cls(**kwargs)
+        pairs = BinarySearchTree._sorted_pairs(iterable, items)
+        if not pairs:
+            return tree
+        keys = [key for key, _ in pairs]
+        payloads = [payload for _, payload in pairs]
+        level, previous = [], None
+        for lo, hi in cls._even_slices(len(keys), tree.fanout):
+            leaf = BPlusLeaf(keys[lo:hi], payloads[lo:hi])
+            leaf.prev = previous
+            if previous:
+                previous.next = leaf
+            level.append(leaf)
+            previous = leaf
+        lows = [leaf.keys[0] for leaf in level]  # Smallest key under each node of the level
+        while len(level) > 1:
+            level, lows = ([BPlusBranch(lows[lo + 1:hi], level[lo:hi])
+                            for lo, hi in cls._even_slices(len(level), tree.fanout)],
+                           [lows[lo] for lo, _ in cls._even_slices(len(level), tree.fanout)])
+        tree.root = level[0]
+        tree.size = len(keys)
+        return tree
+
+    @classmethod
+    def from_unsorted(cls, iterable: Iterable, items: bool=False, **kwargs) -> 'BPlusTree':
+        """Sorts the keys (O(n log n)) and builds the tree with `from_sorted`."""
+        ordered = sorted(iterable, key=itemgetter(0)) if items else sorted(iterable)
+        return cls.from_sorted(ordered, items, **kwargs)
+
+    @staticmethod
+    def _even_slices(count: int, capacity: int) -> Iterator[Tuple[int, int]]:
+        """Yields `(lo, hi)` bounds splitting `count` items evenly into the fewest groups of at most `capacity`."""
+        groups = -(-count // capacity)
+        base, extra = divmod(count, groups)
+        lo = 0
+        for group in range(groups):
+            hi = lo + base + (group < extra)
+            yield lo, hi
+            lo = hi
+
+    @property
+    def height(self) -> int:
+        """Number of branch levels above the leaves (0 for a single leaf, -1 when empty)."""
+        height, node = -1, self.root
+        while node is not None:
+            height += 1
+            node = node.children[0] if isinstance(node, BPlusBranch) else None
+        return height
+
+    # --- Descents ---
+    def _find_leaf(self, key: Any) -> BPlusLeaf:
+        """Returns the leaf where `key` is or would be stored (None when the tree is empty)."""
+        node = self.root
+        while isinstance(node, BPlusBranch):
+            node = node.children[bisect_right(node.keys, key)]
+        return node
+
+    def _find_path(self, key: Any) -> Tuple[BPlusLeaf, List[Tuple[BPlusBranch, int]]]:
+        """Returns the leaf for `key` and the `(branch, child index)` pairs above it, root first."""
+        path, node = [], self.root
+        while isinstance(node, BPlusBranch):
+            index = bisect_right(node.keys, key)
+            path.append((node, index))
+            node = node.children[index]
+        return node, path
+
+    # --- Updates ---
+    def insert(self, value: Any, payload: Any=None) -> None:
+        """Inserts a key (a duplicate key is ignored, as in AVLTree).
+
+        An overfull leaf is split in half and the split is carried up the path.
+        """
+        if self.root is None:
+            self.root = BPlusLeaf([value], [payload])
+        else:
+            leaf, path = self._find_path(value)
+            index = bisect_left(leaf.keys, value)
+            if index < len(leaf.keys) and leaf.keys[index] == value:
+                if self.log is not None:
+                    self.log.record(OP_DUPLICATE, value)
+                return
+            leaf.keys.insert(index, value)
+            leaf.payloads.insert(index, payload)
+            if len(leaf.keys) > self.fanout:
+                self._split(leaf, path)
+        self.size += 1
+        if self.log is not None:
+            self.log.record(OP_INSERT, value, self.height)
+
+    def _split(self, node, path: List[Tuple[BPlusBranch, int]]) -> None:
+        """Splits an overfull node in half, inserting the separator into its parent (recursively)."""
+        while True:
+            self.split_count += 1
+            middle = len(node.keys) // 2
+            if isinstance(node, BPlusLeaf):
+                sibling = BPlusLeaf(node.keys[middle:], node.payloads[middle:])
+                del node.keys[middle:], node.payloads[middle:]
+                sibling.prev, sibling.next = node, node.next
+                if node.next:
+                    node.next.prev = sibling
+                node.next = sibling
+                separator = sibling.keys[0]
+            else:  # The middle key moves up; the children around it are divided
+                separator = node.keys[middle]
+                sibling = BPlusBranch(node.keys[middle + 1:], node.children[middle + 1:])
+                del node.keys[middle:], node.children[middle + 1:]
+            if not path:
+                self.root = BPlusBranch([separator], [node, sibling])
+                return
+            parent, index = path.pop()
+            parent.keys.insert(index, separator)
+            parent.children.insert(index + 1, sibling)
+            if len(parent.children) <= self.fanout:
+                return
+            node = parent
+
+    def delete(self, value: Any) -> bool:
+        """Deletes a key. Returns True if it was found.
+
+        An underfull node borrows an entry from a sibling, or is merged into one, and the
+        change is carried up the path; separators left behind by deleted keys stay valid.
+        """
+        leaf, path = self._find_path(value)
+        index = bisect_left(leaf.keys, value) if leaf else 0
+        if leaf is None or index == len(leaf.keys) or leaf.keys[index] != value:
+            if self.log is not None:
+                self.log.record(OP_MISSING, value)
+            return False
+        del leaf.keys[index], leaf.payloads[index]
+        self.size -= 1
+        self._rebalance(leaf, path)
+        if self.log is not None:
+            self.log.record(OP_DELETE, value, self.height)
+        return True
+
+    def _rebalance(self, node, path: List[Tuple[BPlusBranch, int]]) -> None:
+        """Restores minimum occupancy from `node` up the path after a deletion."""
+        minimum = self.fanout // 2
+        while path:
+            leaf = isinstance(node, BPlusLeaf)
+            if len(node.keys if leaf else node.children) >= minimum:
+                return
+            parent, index = path.pop()
+            left = parent.children[index - 1] if index else None
+            right = parent.children[index + 1] if index + 1 < len(parent.children) else None
+            if left and len(left.keys if leaf else left.children) > minimum:  # Borrow from the left
+                if leaf:
+                    node.keys.insert(0, left.keys.pop())
+                    node.payloads.insert(0, left.payloads.pop())
+                    parent.keys[index - 1] = node.keys[0]
+                else:
+                    node.keys.insert(0, parent.keys[index - 1])
+                    node.children.insert(0, left.children.pop())
+                    parent.keys[index - 1] = left.keys.pop()
+                return
+            if right and len(right.keys if leaf else right.children) > minimum:  # Borrow from the right
+                if leaf:
+                    node.keys.append(right.keys.pop(0))
+                    node.payloads.append(right.payloads.pop(0))
+                    parent.keys[index] = right.keys[0]
+                else:
+                    node.keys.append(parent.keys[index])
+                    node.children.append(right.children.pop(0))
+                    parent.keys[index] = right.keys.pop(0)
+                return
+            if left is None:  # Merge the right sibling into this node instead
+                left, node, index = node, right, index + 1
+            self.merge_count += 1
+            if leaf:
+                left.keys += node.keys
+                left.payloads += node.payloads
+                left.next = node.next
+                if node.next:
+                    node.next.prev = left
+            else:
+                left.keys.append(parent.keys[index - 1])
+                left.keys += node.keys
+                left.children += node.children
+            del parent.keys[index - 1], parent.children[index]
+            node = parent
+        # The root may be a leaf of any size or a branch of at least two children
+        if isinstance(node, BPlusBranch) and len(node.children) == 1:
+            self.root = node.children[0]
+        elif isinstance(node, BPlusLeaf) and not node.keys:
+            self.root = None
+
+    # --- Lookups ---
+    def get(self, key: Any, default: Any=None) -> Any:
+        """Returns the payload stored under `key`, or `default` if the key is missing."""
+        leaf = self._find_leaf(key)
+        if leaf is not None:
+            index = bisect_left(leaf.keys, key)
+            if index < len(leaf.keys) and leaf.keys[index] == key:
+                return leaf.payloads[index]
+        return default
+
+    def __contains__(self, key: Any) -> bool:
+        leaf = self._find_leaf(key)
+        if leaf is None:
+            return False
+        index = bisect_left(leaf.keys, key)
+        return index < len(leaf.keys) and leaf.keys[index] == key
+
+    def __getitem__(self, key: Any) -> Any:
+        leaf = self._find_leaf(key)
+        if leaf is not None:
+            index = bisect_left(leaf.keys, key)
+            if index < len(leaf.keys) and leaf.keys[index] == key:
+                return leaf.payloads[index]
+        raise KeyError(key)
+
+    def __setitem__(self, key: Any, payload: Any) -> None:
+        """Stores `payload` under `key`, inserting the key if needed."""
+        leaf = self._find_leaf(key)
+        if leaf is not None:
+            index = bisect_left(leaf.keys, key)
+            if index < len(leaf.keys) and leaf.keys[index] == key:
+                leaf.payloads[index] = payload
+                return
+        self.insert(key, payload)
+
+    def __delitem__(self, key: Any) -> None:
+        if not self.delete(key):
+            raise KeyError(key)
+
+    def __len__(self) -> int:
+        return self.size
+
+    def floor(self, key: Any) -> Any:
+        """Returns the largest key less than or equal to `key`, or None if there is none."""
+        leaf = self._find_leaf(key)
+        if leaf is None:
+            return None
+        index = bisect_right(leaf.keys, key)
+        if index:
+            return leaf.keys[index - 1]
+        return leaf.prev.keys[-1] if leaf.prev else None
+
+    def ceiling(self, key: Any) -> Any:
+        """Returns the smallest key greater than or equal to `key`, or None if there is none."""
+        leaf = self._find_leaf(key)
+        if leaf is None:
+            return None
+        index = bisect_left(leaf.keys, key)
+        if index < len(leaf.keys):
+            return leaf.keys[index]
+        return leaf.next.keys[0] if leaf.next else None  # Separators can outlive deleted keys
+
+    def _first_leaf(self) -> BPlusLeaf:
+        node = self.root
+        while isinstance(node, BPlusBranch):
+            node = node.children[0]
+        return node
+
+    def _last_leaf(self) -> BPlusLeaf:
+        node = self.root
+        while isinstance(node, BPlusBranch):
+            node = node.children[-1]
+        return node
+
+    def min(self) -> Any:
+        """Returns the smallest key, or None if the tree is empty."""
+        return self.root and self._first_leaf().keys[0]
+
+    def max(self) -> Any:
+        """Returns the largest key, or None if the tree is empty."""
+        return self.root and self._last_leaf().keys[-1]
+
+    # --- Iteration (along the leaf chain) ---
+    def _iter_leaves(self, reverse: bool=False) -> Iterator[BPlusLeaf]:
+        leaf = self._last_leaf() if reverse else self._first_leaf()
+        while leaf is not None:
+            following = leaf.prev if reverse else leaf.next
+            yield leaf
+            leaf = following
+
+    def __iter__(self) -> Iterator[Any]:
+        for leaf in self._iter_leaves():
+            yield from leaf.keys[:]  # Copy, so the current key can be deleted while iterating
+
+    def __reversed__(self) -> Iterator[Any]:
+        for leaf in self._iter_leaves(reverse=True):
+            yield from leaf.keys[::-1]
+
+    def keys(self) -> Iterator[Any]:
+        """Yields the keys in ascending order."""
+        return iter(self)
+
+    def values(self) -> Iterator[Any]:
+        """Yields the payloads in ascending key order."""
+        for leaf in self._iter_leaves():
+            yield from leaf.payloads[:]
+
+    def items(self) -> Iterator[Tuple[Any, Any]]:
+        """Yields `(key, payload)` pairs in ascending key order."""
+        for leaf in self._iter_leaves():
+            yield from zip(leaf.keys[:], leaf.payloads[:])
+
+    def irange(self, lo: Any=None, hi: Any=None, inclusive: Tuple[bool, bool]=(True, True),
+               reverse: bool=False) -> Iterator[Any]:
+        """Lazily yields the keys between `lo` and `hi` in O(log n + k) for k keys.
+
+        One descent finds the first leaf; each leaf then contributes a slice of its keys
+        (bounded with `bisect` only in the first and last leaf of the range).
+
+        Args:
+            lo: Lower bound, or None for no lower bound.
+            hi: Upper bound, or None for no upper bound.
+            inclusive: Whether `lo` and `hi` themselves are included.
+            reverse: Yield the keys in descending order.
+        """
+        for leaf, start, stop in self._range_slices(lo, hi, inclusive, reverse):
+            yield from leaf.keys[start:stop][::-1] if reverse else leaf.keys[start:stop]
+
+    def irange_items(self, lo: Any=None, hi: Any=None, inclusive: Tuple[bool, bool]=(True, True),
+                     reverse: bool=False) -> Iterator[Tuple[Any, Any]]:
+        """Lazily yields the `(key, payload)` pairs between `lo` and `hi` (see `irange`)."""
+        for leaf, start, stop in self._range_slices(lo, hi, inclusive, reverse):
+            pairs = zip(leaf.keys[start:stop], leaf.payloads[start:stop])
+            yield from reversed(list(pairs)) if reverse else pairs
+
+    def _range_slices(self, lo: Any, hi: Any, inclusive: Tuple[bool, bool],
+                      reverse: bool) -> Iterator[Tuple[BPlusLeaf, int, int]]:
+        """Yields `(leaf, start, stop)` for each leaf slice in the range, in scan order.
+
+        The caller must slice the leaf before asking for the next one; the following leaf is
+        looked up first, so the keys just yielded may be deleted while iterating.
+        """
+        lo_inclusive, hi_inclusive = inclusive
+        if self.root is None:
+            return
+        if reverse:
+            leaf = self._find_leaf(hi) if hi is not None else self._last_leaf()
+            while leaf is not None:
+                keys = leaf.keys
+                stop = len(keys) if hi is None else (bisect_right if hi_inclusive else bisect_left)(keys, hi)
+                start = 0 if lo is None else (bisect_left if lo_inclusive else bisect_right)(keys, lo)
+                following = leaf.prev
+                yield leaf, start, stop
+                if start:
+                    return
+                leaf = following
+        else:
+            leaf = self._find_leaf(lo) if lo is not None else self._first_leaf()
+            while leaf is not None:
+                keys = leaf.keys
+                start = 0 if lo is None else (bisect_left if lo_inclusive else bisect_right)(keys, lo)
+                stop = len(keys) if hi is None else (bisect_right if hi_inclusive else bisect_left)(keys, hi)
+                following = leaf.next
+                yield leaf, start, stop
+                if stop < len(keys):
+                    return
+                leaf = following
+
+    # --- Display ---
+    def print_tree(self, node=None, level: int=0, prefix: str='Root:', visited=None) -> None:
+        """Prints the tree one node per line, children indented below their branch."""
+        if node is None:
+            return
+        print(' ' * (5 * level) + prefix + str(node.keys))
+        if isinstance(node, BPlusBranch):
+            for index, child in enumerate(node.children):
+                self.print_tree(child, level + 1, f'C{index}---', visited)
+
+    def print_log(self):
+        """Prints the recent operations, the split/merge counts and the final height."""
+        print("\n--- B+ Tree Log ---")
+        if self.log is None:
+            print("(logging disabled)")
+        else:
+            for entry in self.log.messages():
+                print(entry)
+        print(f"Node Splits: {self.split_count}, Node Merges: {self.merge_count}")
+        print(f"Final Tree Height: {self.height}")
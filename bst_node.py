@@ -10,19 +10,29 @@
 class BstNode:
     """
     Base node for Binary Search Tree.
+
+    Nodes use __slots__ (no per-instance __dict__) to keep large trees compact.
+    Debug output is controlled by the class-level `debug` switch or the `debug` argument;
+    it is not stored on each node.
     """
-    # Constructor for the Node class   
-    def __init__(self, value, parent=None, debug=False):
+    __slots__ = ('value', 'payload', 'left', 'right', 'parent')
+    debug = False  # Class-level switch: set BstNode.debug = True to trace every node creation
+
+    # Constructor for the Node class
+    def __init__(self, value, parent=None, debug=False, payload=None):
         """
         Initializes a new node with a given value.
 
         Args:
             value: The data to be stored in the node. Defaults to None.
+            parent: The parent node of this node (default: None).
+            debug: Print a debugging message for this node only.
+            payload: Optional object mapped to the value when the tree is used as a map.
         """
-        self.debug = debug
-        if self.debug:
+        if debug or BstNode.debug:
             print(f"DEBUG: BstNode.__init__({value}) called") # Added for demo
         self.value = value  # Store data in the node
+        self.payload = payload  # Object mapped to the value (key)
         self.left = None    # Pointer to the left child node
         self.right = None   # Pointer to the right child node
         self.parent = parent # Assign parent to the current node (default value: None)
@@ -0,0 +1,830 @@
+# Created by: Michael Jung (ID:10680322), Timothy Sanders (ID: 01002147), Megan Ng (ID: 00756276)
+
+# Date: 10/18/26
+
+# Course: Spr25_CS_034 CRN 39575
+
+#--------------------------------------------------------------------------------------------
+import gc
+from itertools import islice
+from operator import attrgetter, itemgetter
+from typing import Any, Callable, Iterable, Iterator, List, Tuple
+
+from bst_node import BstNode
+from operation_log import OP_INSERT
+from tree_stats import TreeStats
+
+
+class BinarySearchTree:
+    """Base class holding the ordered-map operations shared by AVLTree and RedBlackTree.
+
+    Every node stores its key in ``value`` and the mapped object in ``payload``.
+    Subclasses only provide insertion and rebalancing; all lookups here are
+    iterative descents from the root, so they run in O(log n) on a balanced tree.
+    Descents make one `<` comparison per level and test for equality once at the
+    bottom, against the closest key on the side they last turned away from.
+
+    With `key=` (as in `sorted`), keys are ordered by `key(k)`. The derived key is computed
+    once per inserted key and stored in the node's ``value``, with the original key in
+    ``item``; every comparison inside the tree uses the cached derived key. Keys passed in
+    (lookups, bounds, deletes) are mapped through `key` once per call, and keys reported
+    back (iteration, `min`, `floor`, ...) are the original ones.
+
+    Attributes:
+        root (BstNode): A reference to the optional root node of the tree
+        size (int): Number of keys stored in the tree
+        order_statistics (bool): Whether nodes keep subtree sizes for `rank`/`select`/`count_range`
+        key (callable): The key function, or None to order keys by themselves
+        stats (TreeStats): Hot-path counters, or None when statistics are off
+    """
+    def __init__(self, root: BstNode=None, order_statistics: bool=False, stats: bool=False,
+                 key: Callable[[Any], Any]=None):
+        """Initializes the tree with an optional root node.
+
+        Args:
+            root: The root node of the tree. Defaults to `None`
+            order_statistics: Maintain subtree sizes on every node. Defaults to False
+            stats: Collect TreeStats counters. Defaults to False (no instrumentation)
+            key: Function deriving the sort key of each key. Defaults to None (keys compare directly)
+        """
+        self.root = root
+        self.size = self._count_nodes(root)
+        self.order_statistics = order_statistics
+        self.key = key
+        self._reported = attrgetter("value" if key is None else "item")  # Node -> key given back to callers
+        self.stats = None
+        if stats:
+            # Only instrumented trees get timing wrappers, so plain trees pay nothing for them
+            self.stats = TreeStats()
+            self.insert = self.stats.wrap("insert", self.insert)
+            self.delete = self.stats.wrap("delete", self.delete)
+
+    @classmethod
+    def from_sorted(cls, iterable: Iterable, items: bool=False, **kwargs) -> 'BinarySearchTree':
+        """Builds a balanced tree from keys in ascending order in O(n), without rotations.
+
+        Repeated keys are skipped (the first one wins, as with `insert`).
+
+        Args:
+            iterable: Keys in ascending order, or `(key, payload)` pairs when `items` is True.
+            items: Whether the iterable yields `(key, payload)` pairs.
+            **kwargs: Passed to the tree constructor (e.g. `log_capacity`, `key`).
+
+        Returns:
+            A new tree holding the keys.
+
+        Raises:
+            ValueError: If the keys (their derived keys, with `key=`) are not in ascending order.
+        """
+        tree = cls(**kwargs)
+        if tree.key is not None:
+            iterable, items = tree._decorate(iterable, items), True
+        tree._build(cls._sorted_pairs(iterable, items))
+        return tree
+
+    def _build(self, pairs: List[Tuple[Any, Any]]) -> None:
+        """Replaces the contents with a balanced tree of sorted, distinct (decorated) pairs."""
+        # Every node allocated here stays reachable, so pause the cyclic collector instead of
+        # letting it rescan the growing set of parent-linked nodes.
+        collecting = gc.isenabled()
+        gc.disable()
+        try:
+            nodes = [self._pair_node(key, payload) for key, payload in pairs]
+            self._adopt(self._link_balanced(nodes), len(nodes))
+        finally:
+            if collecting:
+                gc.enable()
+
+    def _decorate(self, iterable: Iterable, items: bool) -> Iterator[Tuple[Any, Tuple[Any, Any]]]:
+        """Yields `(key(k), (k, payload))` for each input key of a keyed tree."""
+        key = self.key
+        for entry in iterable:
+            item, payload = entry if items else (entry, None)
+            yield key(item), (item, payload)
+
+    def _pair_node(self, key: Any, payload: Any) -> BstNode:
+        """Creates a detached node from a pair (decorated on keyed trees, see `_decorate`)."""
+        if self.key is None:
+            return self._new_node(key, payload)
+        item, payload = payload
+        node = self._new_node(key, payload)
+        node.item = item
+        return node
+
+    @classmethod
+    def from_unsorted(cls, iterable: Iterable, items: bool=False, **kwargs) -> 'BinarySearchTree':
+        """Sorts the keys (O(n log n)) and builds a balanced tree with `from_sorted`.
+
+        Args:
+            iterable: Keys in any order, or `(key, payload)` pairs when `items` is True.
+            items: Whether the iterable yields `(key, payload)` pairs.
+            **kwargs: Passed to the tree constructor (e.g. `log_capacity`, `key`).
+        """
+        if kwargs.get("key") is None:
+            ordered = sorted(iterable, key=itemgetter(0)) if items else sorted(iterable)
+            return cls.from_sorted(ordered, items, **kwargs)
+        tree = cls(**kwargs)  # Derive each key once, then sort by the derived keys
+        tree._build(cls._sorted_pairs(sorted(tree._decorate(iterable, items), key=itemgetter(0)), True))
+        return tree
+
+    @staticmethod
+    def _sorted_pairs(iterable: Iterable, items: bool) -> List[Tuple[Any, Any]]:
+        """Validates ascending order and returns the distinct `(key, payload)` pairs."""
+        pairs = []
+        for entry in iterable:
+            key, payload = entry if items else (entry, None)
+            if pairs and not key > pairs[-1][0]:
+                if key < pairs[-1][0]:
+                    raise ValueError("from_sorted() requires keys in ascending order")
+                continue  # Repeated key: keep the first
+            pairs.append((key, payload))
+        return pairs
+
+    def _new_node(self, value: Any, payload: Any) -> BstNode:
+        """Creates a detached node of the tree's node type. Implemented by the subclasses."""
+        raise NotImplementedError
+
+    def _link_balanced(self, nodes: List[BstNode]) -> BstNode:
+        """Links sorted, detached nodes into a perfectly balanced tree and returns its root.
+
+        Each node is linked below the midpoint of its range, so every level except the
+        deepest is full. `_finish_built_node` is called bottom-up so subclasses can set
+        heights and colors.
+        """
+        if not nodes:
+            return None
+        max_depth = len(nodes).bit_length() - 1  # Depth of the (possibly partial) last level
+
+        def link(lo: int, hi: int, parent: BstNode, depth: int) -> BstNode:
+            if lo > hi:
+                return None
+            mid = (lo + hi) // 2
+            node = nodes[mid]
+            node.parent = parent
+            node.left = link(lo, mid - 1, node, depth + 1)
+            node.right = link(mid + 1, hi, node, depth + 1)
+            self._finish_built_node(node, depth, max_depth)
+            return node
+
+        return link(0, len(nodes) - 1, None, 0)
+
+    def _finish_built_node(self, node: BstNode, depth: int, max_depth: int) -> None:
+        """Sets balancing metadata on a node whose children are already linked (bulk build hook)."""
+
+    @staticmethod
+    def _count_nodes(node: BstNode) -> int:
+        """Counts the nodes below (and including) a node without recursion."""
+        count, stack = 0, [node] if node else []
+        while stack:
+            node = stack.pop()
+            count += 1
+            if node.left:
+                stack.append(node.left)
+            if node.right:
+                stack.append(node.right)
+        return count
+
+    @staticmethod
+    def _pull_size(node: BstNode) -> None:
+        """Recomputes a sized node's subtree size from its children."""
+        node.size = 1 + (node.left.size if node.left else 0) + (node.right.size if node.right else 0)
+
+    def _resize_path(self, node: BstNode) -> None:
+        """Recomputes subtree sizes from `node` up to the root after a structural change."""
+        while node:
+            self._pull_size(node)
+            node = node.parent
+
+    def _find_node(self, key: Any) -> BstNode:
+        """Returns the node holding `key`, or None if the key is not in the tree."""
+        if self.key is not None:
+            key = self.key(key)
+        if self.stats is not None:
+            return self.stats.find(self.root, key)
+        current, candidate = self.root, None
+        while current:  # One comparison per level
+            if key < current.value:
+                current = current.left
+            else:
+                candidate, current = current, current.right  # Largest key <= `key` so far
+        if candidate is not None and not candidate.value < key:
+            return candidate
+        return None
+
+    @staticmethod
+    def _min_node(node: BstNode) -> BstNode:
+        """Returns the left-most node of the subtree rooted at `node`."""
+        while node.left:
+            node = node.left
+        return node
+
+    @staticmethod
+    def _max_node(node: BstNode) -> BstNode:
+        """Returns the right-most node of the subtree rooted at `node`."""
+        while node.right:
+            node = node.right
+        return node
+
+    def _transplant(self, old: BstNode, new: BstNode) -> None:
+        """Replaces the subtree rooted at `old` with the subtree rooted at `new` (which may be None)."""
+        if not old.parent:                # old was the root
+            self.root = new
+        elif old is old.parent.left:      # old was a left child
+            old.parent.left = new
+        else:                             # old was a right child
+            old.parent.right = new
+        if new:
+            new.parent = old.parent
+
+    def insert(self, value: Any, payload: Any=None) -> None:
+        """Inserts a key with an optional payload. Implemented by the balanced subclasses."""
+        raise NotImplementedError
+
+    def delete(self, value: Any) -> bool:
+        """Removes a key and its payload. Implemented by the balanced subclasses.
+
+        Returns:
+            True if the key was removed, False if it was not in the tree.
+        """
+        raise NotImplementedError
+
+    def get(self, key: Any, default: Any=None) -> Any:
+        """Returns the payload stored under `key`, or `default` if the key is missing.
+
+        Args:
+            key: The key to look up.
+            default: The value returned when the key is not in the tree.
+
+        Returns:
+            The payload mapped to the key, or `default`.
+        """
+        node = self._find_node(key)
+        return node.payload if node else default
+
+    def __contains__(self, key: Any) -> bool:
+        return self._find_node(key) is not None
+
+    def __getitem__(self, key: Any) -> Any:
+        node = self._find_node(key)
+        if node is None:
+            raise KeyError(key)
+        return node.payload
+
+    def __setitem__(self, key: Any, payload: Any) -> None:
+        node = self._find_node(key)
+        if node:                      # Existing key: replace the payload in place
+            node.payload = payload
+        else:                         # New key: balanced insertion
+            self.insert(key, payload)
+
+    def __delitem__(self, key: Any) -> None:
+        if not self.delete(key):
+            raise KeyError(key)
+
+    def __len__(self) -> int:
+        return self.size
+
+    def floor(self, key: Any) -> Any:
+        """Returns the largest key less than or equal to `key`, or None if there is none."""
+        best = self._last_node_to(self.key(key) if self.key is not None else key, True)
+        return self._reported(best) if best else None
+
+    def ceiling(self, key: Any) -> Any:
+        """Returns the smallest key greater than or equal to `key`, or None if there is none."""
+        best = self._first_node_from(self.key(key) if self.key is not None else key, True)
+        return self._reported(best) if best else None
+
+    def min(self) -> Any:
+        """Returns the smallest key in the tree, or None if the tree is empty."""
+        return self._reported(self._min_node(self.root)) if self.root else None
+
+    def max(self) -> Any:
+        """Returns the largest key in the tree, or None if the tree is empty."""
+        return self._reported(self._max_node(self.root)) if self.root else None
+
+    # --- Iteration (parent-pointer walks: O(1) extra memory, no recursion) ---
+    @staticmethod
+    def _successor(node: BstNode) -> BstNode:
+        """Returns the node following `node` in key order, or None."""
+        if node.right:  # Left-most node of the right subtree
+            node = node.right
+            while node.left:
+                node = node.left
+            return node
+        while node.parent and node is node.parent.right:  # Climb until we arrive from a left child
+            node = node.parent
+        return node.parent
+
+    @staticmethod
+    def _predecessor(node: BstNode) -> BstNode:
+        """Returns the node preceding `node` in key order, or None."""
+        if node.left:  # Right-most node of the left subtree
+            node = node.left
+            while node.right:
+                node = node.right
+            return node
+        while node.parent and node is node.parent.left:  # Climb until we arrive from a right child
+            node = node.parent
+        return node.parent
+
+    def _iter_nodes(self, reverse: bool=False) -> Iterator[BstNode]:
+        """Yields every node in ascending (or descending) key order.
+
+        The next node is found before the current one is yielded, so the consumer may delete
+        the key it was just given; any other change to the tree invalidates the iterator.
+        """
+        if not self.root:
+            return
+        if reverse:
+            node, step = self._max_node(self.root), self._predecessor
+        else:
+            node, step = self._min_node(self.root), self._successor
+        while node:
+            following = step(node)
+            yield node
+            node = following
+
+    def _first_node_from(self, key: Any, inclusive: bool) -> BstNode:
+        """Returns the smallest node with a (derived) key >= `key` (> `key` if not `inclusive`), or None."""
+        current, best = self.root, None
+        if inclusive:
+            while current:  # One comparison per level
+                if current.value < key:
+                    current = current.right
+                else:
+                    best, current = current, current.left
+        else:
+            while current:
+                if key < current.value:
+                    best, current = current, current.left
+                else:
+                    current = current.right
+        return best
+
+    def _last_node_to(self, key: Any, inclusive: bool) -> BstNode:
+        """Returns the largest node with a (derived) key <= `key` (< `key` if not `inclusive`), or None."""
+        current, best = self.root, None
+        if inclusive:
+            while current:  # One comparison per level
+                if key < current.value:
+                    current = current.left
+                else:
+                    best, current = current, current.right
+        else:
+            while current:
+                if current.value < key:
+                    best, current = current, current.right
+                else:
+                    current = current.left
+        return best
+
+    def __iter__(self) -> Iterator[Any]:
+        return map(self._reported, self._iter_nodes())
+
+    def __reversed__(self) -> Iterator[Any]:
+        return map(self._reported, self._iter_nodes(reverse=True))
+
+    def keys(self) -> Iterator[Any]:
+        """Yields the keys in ascending order."""
+        return iter(self)
+
+    def values(self) -> Iterator[Any]:
+        """Yields the payloads in ascending key order."""
+        return (node.payload for node in self._iter_nodes())
+
+    def items(self) -> Iterator[Tuple[Any, Any]]:
+        """Yields `(key, payload)` pairs in ascending key order."""
+        reported = self._reported
+        return ((reported(node), node.payload) for node in self._iter_nodes())
+
+    def irange(self, lo: Any=None, hi: Any=None, inclusive: Tuple[bool, bool]=(True, True),
+               reverse: bool=False) -> Iterator[Any]:
+        """Lazily yields the keys between `lo` and `hi` in O(log n + k) for k keys.
+
+        Only the start of the range is searched for; the walk then follows parent pointers and
+        stops at the first key outside the range, so nothing is materialized.
+
+        Args:
+            lo: Lower bound, or None for no lower bound.
+            hi: Upper bound, or None for no upper bound.
+            inclusive: Whether `lo` and `hi` themselves are included.
+            reverse: Yield the keys in descending order.
+        """
+        if self.key is not None:
+            lo = self.key(lo) if lo is not None else None
+            hi = self.key(hi) if hi is not None else None
+        return map(self._reported, self._range_nodes(lo, hi, inclusive, reverse))
+
+    def irange_items(self, lo: Any=None, hi: Any=None, inclusive: Tuple[bool, bool]=(True, True),
+                     reverse: bool=False) -> Iterator[Tuple[Any, Any]]:
+        """Lazily yields the `(key, payload)` pairs between `lo` and `hi` (see `irange`).
+
+        The payloads come from the same node walk as the keys, so a range read costs one
+        descent rather than one `get` per key.
+        """
+        if self.key is not None:
+            lo = self.key(lo) if lo is not None else None
+            hi = self.key(hi) if hi is not None else None
+        reported = self._reported
+        return ((reported(node), node.payload) for node in self._range_nodes(lo, hi, inclusive, reverse))
+
+    def _range_nodes(self, lo: Any, hi: Any, inclusive: Tuple[bool, bool],
+                     reverse: bool) -> Iterator[BstNode]:
+        """Lazily yields the nodes whose (derived) keys lie between `lo` and `hi` (see `irange`)."""
+        lo_inclusive, hi_inclusive = inclusive
+        if not self.root:
+            return
+        if reverse:
+            node = self._last_node_to(hi, hi_inclusive) if hi is not None else self._max_node(self.root)
+            step = self._predecessor
+        else:
+            node = self._first_node_from(lo, lo_inclusive) if lo is not None else self._min_node(self.root)
+            step = self._successor
+        while node:
+            key = node.value
+            if reverse:
+                if lo is not None and (key < lo or (not lo_inclusive and not lo < key)):
+                    return
+            elif hi is not None and (hi < key or (not hi_inclusive and not key < hi)):
+                return
+            following = step(node)
+            yield node
+            node = following
+
+    # --- Join / split based set algebra ---
+    def _join_roots(self, left: BstNode, node: BstNode, right: BstNode) -> BstNode:
+        """Links two detached subtrees under `node` (all left keys < node < all right keys).
+
+        Implemented by the balanced subclasses in O(|height difference|); `self.root` is used
+        as scratch space while rebalancing. Returns the root of the joined subtree.
+        """
+        raise NotImplementedError
+
+    def _empty_like(self) -> 'BinarySearchTree':
+        """Returns a new, empty tree of the same type, node layout and key function."""
+        if self.key is None:
+            return type(self)(order_statistics=self.order_statistics)
+        return type(self)(order_statistics=self.order_statistics, key=self.key)
+
+    @staticmethod
+    def _detach_children(node: BstNode) -> Tuple[BstNode, BstNode]:
+        """Unlinks and returns a node's children, leaving the node bare."""
+        left, right = node.left, node.right
+        if left:
+            left.parent = None
+        if right:
+            right.parent = None
+        node.left = node.right = node.parent = None
+        return left, right
+
+    def _split_roots(self, root: BstNode, key: Any) -> Tuple[BstNode, BstNode, BstNode]:
+        """Splits a detached subtree into (keys < key, node holding key or None, keys > key)."""
+        if root is None:
+            return None, None, None
+        left, right = self._detach_children(root)
+        if key < root.value:
+            smaller, found, larger = self._split_roots(left, key)
+            return smaller, found, self._join_roots(larger, root, right)
+        if key > root.value:
+            smaller, found, larger = self._split_roots(right, key)
+            return self._join_roots(left, root, smaller), found, larger
+        return left, root, right
+
+    def _split_last(self, root: BstNode) -> Tuple[BstNode, BstNode]:
+        """Removes the largest node from a detached subtree; returns (remaining root, that node)."""
+        left, right = self._detach_children(root)
+        if right is None:
+            return left, root
+        rest, last = self._split_last(right)
+        return self._join_roots(left, root, rest), last
+
+    def _concat_roots(self, left: BstNode, right: BstNode) -> BstNode:
+        """Joins two detached subtrees (all left keys < all right keys) without a middle key."""
+        if left is None:
+            return right
+        if right is None:
+            return left
+        rest, last = self._split_last(left)
+        return self._join_roots(rest, last, right)
+
+    def _check_compatible(self, other: 'BinarySearchTree') -> None:
+        """Ensures `other` uses the same node type, since its nodes are moved into this tree."""
+        if type(other) is not type(self):
+            raise TypeError(f"expected a {type(self).__name__}, got {type(other).__name__}")
+        if other.order_statistics != self.order_statistics:
+            raise TypeError("both trees must use the same order_statistics setting")
+        if other.key is not self.key:
+            raise TypeError("both trees must use the same key function")
+
+    def _adopt(self, root: BstNode, size: int) -> None:
+        """Installs a detached subtree as this tree's contents."""
+        if root:
+            root.parent = None
+        self.root = root
+        self.size = size
+
+    def join(self, key: Any, other: 'BinarySearchTree', payload: Any=None) -> 'BinarySearchTree':
+        """Appends `key` and then every key of `other` to this tree in O(log n).
+
+        All keys in this tree must be smaller than `key`, which must be smaller than all keys
+        in `other`. `other` is emptied.
+
+        Args:
+            key: The separating key to insert.
+            other: A tree of the same type whose keys are all greater than `key`.
+            payload: Optional payload for `key`.
+
+        Returns:
+            This tree.
+
+        Raises:
+            ValueError: If the keys are not ordered as required.
+        """
+        self._check_compatible(other)
+        if self.key is not None:
+            key, payload = self.key(key), (key, payload)
+        if (self.root and not self._max_node(self.root).value < key) or \
+                (other.root and not key < other._min_node(other.root).value):
+            raise ValueError("join() requires max(self) < key < min(other)")
+        size = self.size + other.size + 1
+        joined = self._join_roots(self.root, self._pair_node(key, payload), other.root)
+        other._adopt(None, 0)
+        self._adopt(joined, size)
+        return self
+
+    def split(self, key: Any) -> Tuple['BinarySearchTree', Any, 'BinarySearchTree']:
+        """Splits the tree around `key` in O(log n) rotations/joins. This tree is emptied.
+
+        Returns:
+            tuple: `(smaller, entry, larger)` where `smaller` and `larger` are new trees holding
+            the keys below and above `key`, and `entry` is the `(key, payload)` pair if `key`
+            was present, else None. Without order statistics the new trees' sizes are recounted.
+        """
+        smaller, found, larger = self._split_roots(self.root, self.key(key) if self.key is not None else key)
+        self._adopt(None, 0)  # Joins used self.root as scratch space
+        left_tree, right_tree = self._empty_like(), self._empty_like()
+        if self.order_statistics:
+            left_tree._adopt(smaller, smaller.size if smaller else 0)
+            right_tree._adopt(larger, larger.size if larger else 0)
+        else:
+            left_tree._adopt(smaller, self._count_nodes(smaller))
+            right_tree._adopt(larger, self._count_nodes(larger))
+        return left_tree, ((self._reported(found), found.payload) if found else None), right_tree
+
+    def union(self, other: 'BinarySearchTree') -> 'BinarySearchTree':
+        """Merges every key of `other` into this tree in O(m log(n/m + 1)) for m <= n.
+
+        For keys present in both trees, the payload from `other` wins. `other` is emptied.
+
+        Returns:
+            This tree.
+        """
+        self._check_compatible(other)
+        duplicates = 0
+
+        def merge(ours: BstNode, theirs: BstNode) -> BstNode:
+            nonlocal duplicates
+            if ours is None:
+                return theirs
+            if theirs is None:
+                return ours
+            their_left, their_right = self._detach_children(theirs)
+            smaller, found, larger = self._split_roots(ours, theirs.value)
+            if found:
+                duplicates += 1  # `theirs` replaces our node
+            return self._join_roots(merge(smaller, their_left), theirs, merge(larger, their_right))
+
+        size = self.size + other.size
+        merged = merge(self.root, other.root)
+        other._adopt(None, 0)
+        self._adopt(merged, size - duplicates)
+        return self
+
+    def intersection(self, other: 'BinarySearchTree') -> 'BinarySearchTree':
+        """Keeps only the keys that are also in `other`, in O(m log(n/m + 1)). `other` is emptied.
+
+        Payloads come from this tree.
+
+        Returns:
+            This tree.
+        """
+        self._check_compatible(other)
+        kept = 0
+
+        def common(ours: BstNode, theirs: BstNode) -> BstNode:
+            nonlocal kept
+            if ours is None or theirs is None:
+                return None
+            their_left, their_right = self._detach_children(theirs)
+            smaller, found, larger = self._split_roots(ours, theirs.value)
+            left, right = common(smaller, their_left), common(larger, their_right)
+            if found:
+                kept += 1
+                return self._join_roots(left, found, right)
+            return self._concat_roots(left, right)
+
+        result = common(self.root, other.root)
+        other._adopt(None, 0)
+        self._adopt(result, kept)
+        return self
+
+    def difference(self, other: 'BinarySearchTree') -> 'BinarySearchTree':
+        """Removes every key of `other` from this tree, in O(m log(n/m + 1)). `other` is emptied.
+
+        Returns:
+            This tree.
+        """
+        self._check_compatible(other)
+        removed = 0
+
+        def subtract(ours: BstNode, theirs: BstNode) -> BstNode:
+            nonlocal removed
+            if ours is None or theirs is None:
+                return ours
+            their_left, their_right = self._detach_children(theirs)
+            smaller, found, larger = self._split_roots(ours, theirs.value)
+            if found:
+                removed += 1
+            return self._concat_roots(subtract(smaller, their_left), subtract(larger, their_right))
+
+        result = subtract(self.root, other.root)
+        other._adopt(None, 0)
+        self._adopt(result, self.size - removed)
+        return self
+
+    # --- Batch insertion ---
+    # Relinking one node costs about as much as this many levels of a sorted insert's descent
+    # and retrace (measured with benchmarks/insert_many.py); insert_many uses it to pick a strategy.
+    REBUILD_COST = 4
+
+    def insert_many(self, iterable: Iterable, items: bool=False) -> int:
+        """Inserts a batch of keys with whichever of two strategies is estimated to be cheaper.
+
+        The batch is sorted first. With k batch keys and m tree keys between the batch's
+        smallest and largest key, either
+
+        - the keys are inserted one at a time in ascending order: k descents of O(log n),
+          each retracing much of the previous one's path, or
+        - the tree is split at the batch's ends, the m nodes in between are merged with the
+          batch and relinked into a balanced subtree in O(m + k) (existing nodes are reused),
+          and the three parts are joined back in O(log n). A batch beyond the current key
+          range has m = 0; a batch spread over all of it makes this a linear rebuild.
+
+        The merge is used when `(m + k) * REBUILD_COST < k * log2(n)`; m is counted in
+        O(log n) with order statistics (or when the batch spans every key), otherwise by
+        walking at most that many keys.
+
+        As with `insert`, keys already present keep their payloads, and the first of several
+        equal keys in the batch wins.
+
+        Args:
+            iterable: Keys in any order, or `(key, payload)` pairs when `items` is True.
+            items: Whether the iterable yields `(key, payload)` pairs.
+
+        Returns:
+            int: The number of keys added.
+        """
+        if self.key is not None:  # Pairs of (derived key, (key, payload)), sorted by derived key
+            pairs = self._sorted_pairs(sorted(self._decorate(iterable, items), key=itemgetter(0)), True)
+        else:
+            ordered = sorted(iterable, key=itemgetter(0)) if items else sorted(iterable)
+            pairs = self._sorted_pairs(ordered, items)
+        if not pairs:
+            return 0
+        if not self.root:
+            return self._merge_range(pairs)  # Plain O(k) balanced build
+        lo, hi = pairs[0][0], pairs[-1][0]
+        budget = len(pairs) * self.size.bit_length() / self.REBUILD_COST  # In relinked nodes
+        limit = int(min(budget, self.size + len(pairs))) - len(pairs)  # Largest m worth merging
+        if limit >= 0:
+            if self.order_statistics:
+                in_range = self._rank(hi, True) - self._rank(lo, False)
+            elif not lo > self._min_node(self.root).value and not hi < self._max_node(self.root).value:
+                in_range = self.size  # The batch spans every key
+            else:
+                in_range = sum(1 for _ in islice(self._range_nodes(lo, hi, (True, True), False), limit + 1))
+            if in_range <= limit:
+                return self._merge_range(pairs)
+        before = self.size
+        if self.key is not None:
+            for _, (item, payload) in pairs:
+                self.insert(item, payload)  # Derives the key again; the merge path above does not
+        else:
+            for key, payload in pairs:
+                self.insert(key, payload)
+        return self.size - before
+
+    @staticmethod
+    def _subtree_nodes(root: BstNode) -> List[BstNode]:
+        """Returns the nodes of a detached subtree in order."""
+        nodes, stack, node = [], [], root
+        while stack or node:
+            while node:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            nodes.append(node)
+            node = node.right
+        return nodes
+
+    def _merge_range(self, pairs: List[Tuple[Any, Any]]) -> int:
+        """Merges sorted, distinct pairs into the tree by splitting out, relinking and re-joining
+        the batch's key range (see `insert_many`). Returns the number of keys added."""
+        collecting = gc.isenabled()  # As in from_sorted: the relinked nodes all stay reachable
+        gc.disable()
+        try:
+            smaller, first, rest = self._split_roots(self.root, pairs[0][0])
+            middle, last, larger = self._split_roots(rest, pairs[-1][0])
+            existing = ([first] if first else []) + self._subtree_nodes(middle) + ([last] if last else [])
+            merged, position, added = [], 0, []
+            for key, payload in pairs:
+                while position < len(existing) and existing[position].value < key:
+                    merged.append(existing[position])
+                    position += 1
+                if position < len(existing) and not key < existing[position].value:
+                    continue  # Already present: the existing node (and payload) is kept
+                merged.append(self._pair_node(key, payload))
+                added.append(key if self.key is None else payload[0])
+            merged.extend(existing[position:])
+            if smaller is None and larger is None:  # The batch spans the whole tree: plain rebuild
+                root = self._link_balanced(merged)
+            elif len(merged) == 1:
+                root = self._join_roots(smaller, merged[0], larger)
+            else:
+                inner = self._link_balanced(merged[1:-1])
+                root = self._join_roots(self._join_roots(smaller, merged[0], inner), merged[-1], larger)
+            self._adopt(root, self.size + len(added))
+        finally:
+            if collecting:
+                gc.enable()
+        if self.log is not None:
+            height = self.height
+            for key in added:
+                self.log.record(OP_INSERT, key, height)
+        return len(added)
+
+    # --- Order statistics (trees created with order_statistics=True) ---
+    def _require_order_statistics(self) -> None:
+        if not self.order_statistics:
+            raise ValueError("order statistics are disabled; create the tree with order_statistics=True")
+
+    def _rank(self, key: Any, inclusive: bool) -> int:
+        """Counts the (derived) keys below `key` (or at most `key` when `inclusive`) in one descent."""
+        count, current = 0, self.root
+        while current:  # One comparison per level
+            if current.value < key or (inclusive and not key < current.value):
+                count += 1 + (current.left.size if current.left else 0)  # Left subtree and current
+                current = current.right
+            else:
+                current = current.left
+        return count
+
+    def rank(self, key: Any) -> int:
+        """Returns the number of keys smaller than `key` in O(log n).
+
+        `key` does not have to be in the tree; when it is, this is its 0-based position.
+
+        Raises:
+            ValueError: If the tree was created without order statistics.
+        """
+        self._require_order_statistics()
+        return self._rank(self.key(key) if self.key is not None else key, False)
+
+    def select(self, index: int) -> Any:
+        """Returns the key at 0-based position `index` in sorted order in O(log n).
+
+        Negative indexes count from the largest key, as with lists, so the 95th percentile
+        of the keys is `tree.select(int(0.95 * (len(tree) - 1)))`.
+
+        Raises:
+            IndexError: If `index` is out of range.
+            ValueError: If the tree was created without order statistics.
+        """
+        self._require_order_statistics()
+        if index < 0:
+            index += self.size
+        if not 0 <= index < self.size:
+            raise IndexError("select index out of range")
+        current = self.root
+        while True:
+            left_size = current.left.size if current.left else 0
+            if index < left_size:
+                current = current.left
+            elif index > left_size:
+                index -= left_size + 1  # Skip the left subtree and current
+                current = current.right
+            else:
+                return self._reported(current)
+
+    def count_range(self, lo: Any, hi: Any) -> int:
+        """Returns the number of keys `k` with `lo <= k <= hi` in O(log n).
+
+        Raises:
+            ValueError: If the tree was created without order statistics.
+        """
+        self._require_order_statistics()
+        if self.key is not None:
+            lo, hi = self.key(lo), self.key(hi)
+        if hi < lo:
+            return 0
+        return self._rank(hi, True) - self._rank(lo, False)
@@ -0,0 +1,176 @@
+# Created by: Michael Jung (ID:10680322), Timothy Sanders (ID: 01002147), Megan Ng (ID: 00756276)
+
+# Date: 10/18/26
+
+# Course: Spr25_CS_034 CRN 39575
+
+#--------------------------------------------------------------------------------------------
+import threading
+from operator import itemgetter
+
+from rbt_flight_manager import FlightManager
+from rw_lock import ReadWriteLock
+
+
+class ConcurrentFlightManager(FlightManager):
+    """
+    FlightManager that is safe to share between threads.
+
+    Lookups and range scans hold a ReadWriteLock for reading, so they run concurrently with
+    each other; schedule/cancel/load hold it exclusively. Writes can also be queued with
+    `queue_schedule`/`queue_cancel` and applied in batches, taking the write lock once per
+    batch instead of once per flight. Unlike FlightManager, writes do not print.
+
+    Args:
+        log_capacity: Number of recent tree operations kept in the log; 0 disables logging.
+        batch_size: Queued writes that trigger an automatic `flush`.
+        backend: Name of the registered ordered container to store flights in.
+        verbose: Whether loads print the number of flights loaded.
+        **backend_options: Extra constructor arguments for the backend.
+    """
+    def __init__(self, log_capacity=1000, batch_size=256, backend="rbt", verbose=True, **backend_options):
+        super().__init__(log_capacity, backend, verbose, **backend_options)
+        self.lock = ReadWriteLock()
+        self.batch_size = batch_size
+        self._pending = []                     # Queued (flight_id, details, schedule) writes
+        self._pending_lock = threading.Lock()  # Guards `_pending` only
+
+    # --- Writes (exclusive) ---
+    def load_flights(self, flight_ids, presorted=False, items=False):
+        """Replace the schedule with an O(n) bulk build; readers are only blocked for the swap."""
+        tree_class = type(self.tree)
+        build = tree_class.from_sorted if presorted else tree_class.from_unsorted
+        tree = build(flight_ids, items, log_capacity=self.log_capacity, **self.backend_options)  # Built outside the lock
+        indexes = self._build_indexes(tree)
+        with self.lock.write_locked():
+            self.tree = tree
+            self.by_airline, self.by_departure = indexes
+            self.gates, self.windows = {}, {}
+        self._report(f"Loaded {len(tree)} flights")
+
+    def _merge_flights(self, flight_ids, items=False):
+        """Merge a batch under one write-lock acquisition, sorting it before taking the lock."""
+        ordered = sorted(flight_ids, key=itemgetter(0)) if items else sorted(flight_ids)
+        with self.lock.write_locked():
+            return super()._merge_flights(ordered, items)  # Re-sorting sorted input is a linear scan
+
+    def schedule_flights(self, flight_ids, items=False):
+        """Schedule a batch of flights at once (see FlightManager.schedule_flights); does not print."""
+        return self._merge_flights(flight_ids, items)
+
+    def schedule_flight(self, flight_id, details=None):
+        """Schedule a flight immediately. Returns True if it was not already scheduled."""
+        with self.lock.write_locked():
+            return self._add_flight(flight_id, details)
+
+    def schedule_flight_window(self, flight_id, gate, arrival, departure, details=None):
+        """Schedule a flight with a gate window immediately (see FlightManager.schedule_flight_window)."""
+        with self.lock.write_locked():
+            self._set_window(flight_id, gate, arrival, departure)
+            return self._add_flight(flight_id, details)
+
+    def cancel_flight(self, flight_id):
+        """Cancel a flight (and free its gate window) immediately. Returns True if it was scheduled."""
+        with self.lock.write_locked():
+            return self._remove_flight(flight_id)
+
+    # --- Batched writes ---
+    def queue_schedule(self, flight_id, details=None):
+        """Queue a flight to be scheduled by the next `flush` (automatic once a batch is full)."""
+        self._queue((flight_id, details, True))
+
+    def queue_cancel(self, flight_id):
+        """Queue a cancellation to be applied by the next `flush`."""
+        self._queue((flight_id, None, False))
+
+    def _queue(self, write):
+        with self._pending_lock:
+            self._pending.append(write)
+            full = len(self._pending) >= self.batch_size
+        if full:
+            self.flush()
+
+    def flush(self):
+        """Apply every queued write, in queue order, under a single write-lock acquisition.
+
+        Returns:
+            int: The number of writes applied.
+        """
+        with self.lock.write_locked():
+            # Taking the batch while holding the write lock keeps batches in queue order
+            with self._pending_lock:
+                batch, self._pending = self._pending, []
+            for flight_id, details, schedule in batch:
+                if schedule:
+                    self._add_flight(flight_id, details)
+                else:
+                    self._remove_flight(flight_id)
+        return len(batch)
+
+    # --- Reads (shared) ---
+    def is_scheduled(self, flight_id):
+        """Return True if the flight is in the schedule (queued writes are not visible yet)."""
+        with self.lock.read_locked():
+            return flight_id in self.tree
+
+    def get_flight(self, flight_id, default=None):
+        """Return the details stored with a flight, or `default` if it is not scheduled."""
+        with self.lock.read_locked():
+            return self.tree.get(flight_id, default)
+
+    def flights_between(self, first_id, last_id, reverse=False):
+        """Return the scheduled flight IDs from `first_id` to `last_id` (inclusive) as a list.
+
+        The range is materialized under the read lock, so no lock is held by a suspended
+        generator; use `scan_flights` to stream a range while holding it.
+        """
+        with self.lock.read_locked():
+            return list(self.tree.irange(first_id, last_id, reverse=reverse))
+
+    def flights_at_gate(self, gate, start, end):
+        """Return the IDs of flights whose window at `gate` overlaps `start`..`end`, as a list."""
+        with self.lock.read_locked():
+            return list(super().flights_at_gate(gate, start, end))
+
+    def flights_by_airline(self, airline, reverse=False):
+        """Return the IDs of an airline's scheduled flights in ID order, as a list."""
+        with self.lock.read_locked():
+            return list(super().flights_by_airline(airline, reverse))
+
+    def flights_departing(self, start, end, reverse=False):
+        """Return the IDs of flights departing from `start` to `end` (inclusive) in departure order, as a list."""
+        with self.lock.read_locked():
+            return list(super().flights_departing(start, end, reverse))
+
+    def get_window(self, flight_id):
+        """Return the flight's `(gate, arrival, departure)` window, or None if it has none."""
+        with self.lock.read_locked():
+            return self.windows.get(flight_id)
+
+    def scan_flights(self, first_id, last_id, consumer):
+        """Call `consumer(flight_id)` for each flight in the range while holding the read lock.
+
+        Other readers proceed concurrently; writers wait until the scan finishes.
+
+        Returns:
+            int: The number of flights passed to `consumer`.
+        """
+        count = 0
+        with self.lock.read_locked():
+            for flight_id in self.tree.irange(first_id, last_id):
+                consumer(flight_id)
+                count += 1
+        return count
+
+    def save_snapshot(self, filename):
+        """Write a binary snapshot; writers wait until the single sequential pass is done."""
+        with self.lock.read_locked():
+            return super().save_snapshot(filename)
+
+    def display_flight_schedule(self, node=None, level=0, prefix='Root:'):
+        with self.lock.read_locked():
+            super().display_flight_schedule(node, level, prefix)
+
+    def print_operations_log(self):
+        with self.lock.read_locked():
+            super().print_operations_log()
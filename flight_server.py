@@ -0,0 +1,368 @@
+# Created by: Michael Jung (ID:10680322), Timothy Sanders (ID: 01002147), Megan Ng (ID: 00756276)
+
+# Date: 10/18/26
+
+# Course: Spr25_CS_034 CRN 39575
+
+#--------------------------------------------------------------------------------------------
+"""Asyncio network front end for FlightManager, with concurrent writes coalesced into batches.
+
+The protocol is one JSON object per line in each direction, over TCP or a Unix socket:
+
+    -> {"id": 1, "op": "schedule", "flight": "AA123", "details": {"departure": "09:40"}}
+    <- {"id": 1, "ok": true, "result": true}
+    <- {"id": 2, "ok": false, "error": "ValueError: ..."}
+
+Requests on one connection may be pipelined; replies carry the request's `id` and can
+arrive out of order. Operations (fields other than `op`/`id` in brackets are optional):
+
+    schedule  flight [details] [gate arrival departure]  -> True if the flight is new
+    cancel    flight                                     -> True if it was scheduled
+    lookup    flight                                     -> {"scheduled": bool, "details": ...}
+    range     first last [reverse]                       -> flight IDs in ID order
+    airline   airline [reverse]                          -> the airline's flight IDs
+    departing start end [reverse]                        -> flight IDs in departure order
+    gate      gate start end                             -> flights whose window overlaps
+    window    flight                                     -> [gate, arrival, departure] or None
+    stats                                                -> flight and batching counters
+
+Writes are queued and applied together on the next event-loop pass (or once `batch_size`
+are waiting), so a burst of schedules from many clients becomes one `insert_many`-backed
+merge. A read first applies every queued write, so each client sees its own writes and
+all clients see writes in arrival order. Everything runs on the event loop thread; the
+manager needs no lock.
+
+Usage (from the repository root):
+    python flight_server.py [--host 127.0.0.1] [--port 8470] [--unix PATH]
+"""
+import argparse
+import asyncio
+import json
+from typing import Any, Dict, List, Tuple
+
+from rbt_flight_manager import FlightManager
+
+# Default TCP port of the flight service
+DEFAULT_PORT = 8470
+
+# Longest request or reply line accepted, in bytes (range replies can be long)
+LINE_LIMIT = 1 << 24
+
+WRITE_OPS = ("schedule", "cancel")
+
+
+class FlightServiceError(Exception):
+    """Raised by FlightClient when the server answers a request with an error."""
+
+
+def _args(request: Dict[str, Any], *names: str) -> List[Any]:
+    """Returns the named request fields, raising ValueError for a missing one."""
+    missing = [name for name in names if name not in request]
+    if missing:
+        raise ValueError(f"{request.get('op')!r} requires {', '.join(missing)}")
+    return [request[name] for name in names]
+
+
+def _flight(request: Dict[str, Any]) -> Any:
+    """Returns the request's flight ID, raising ValueError unless it is a string or an integer."""
+    flight_id, = _args(request, "flight")
+    if not isinstance(flight_id, (str, int)) or isinstance(flight_id, bool):
+        raise ValueError(f"flight IDs are strings or integers, got {flight_id!r}")
+    return flight_id
+
+
+class FlightServer:
+    """Serves a FlightManager over newline-delimited JSON (see the module docstring).
+
+    Args:
+        manager (FlightManager): The schedule to serve. Defaults to a new, quiet FlightManager
+            (pass one built with `verbose=False` so writes are not printed).
+        batch_size (int): Queued writes that are applied at once without waiting for the
+            next event-loop pass.
+        batch_delay (float): Seconds to keep collecting writes after the first one is queued.
+            Defaults to 0 (just the writes that arrive in the same loop pass).
+
+    Attributes:
+        writes (int): Write requests applied so far
+        batches (int): Batches those writes were applied in
+        server (asyncio.Server): The listening server once `start` has run
+    """
+    def __init__(self, manager: FlightManager=None, batch_size: int=1024, batch_delay: float=0.0):
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        self.manager = manager if manager is not None else FlightManager(log_capacity=0, verbose=False)
+        self.batch_size = batch_size
+        self.batch_delay = batch_delay
+        self.writes = 0
+        self.batches = 0
+        self.server = None
+        self._pending = []        # Queued ((op, request), future) writes, in arrival order
+        self._flush_task = None
+
+    # --- Lifecycle ---
+    async def start(self, host: str="127.0.0.1", port: int=DEFAULT_PORT, path: str=None) -> asyncio.Server:
+        """Starts listening on `host:port` (port 0 picks a free one), or on the Unix socket `path`."""
+        if path is not None:
+            self.server = await asyncio.start_unix_server(self._serve_connection, path, limit=LINE_LIMIT)
+        else:
+            self.server = await asyncio.start_server(self._serve_connection, host, port, limit=LINE_LIMIT)
+        return self.server
+
+    @property
+    def port(self) -> int:
+        """The TCP port the server listens on."""
+        return self.server.sockets[0].getsockname()[1]
+
+    async def close(self) -> None:
+        """Stops accepting connections and applies any queued writes."""
+        if self.server is not None:
+            self.server.close()
+            await self.server.wait_closed()
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            self._flush_task = None
+        self.flush()
+
+    # --- Connections ---
+    async def _serve_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        tasks = set()
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except (ConnectionError, ValueError):  # Reset, or a line over LINE_LIMIT
+                    break
+                if not line:
+                    break
+                task = asyncio.ensure_future(self._reply(line, writer))  # Writes are queued on its first step
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+                await writer.drain()  # The only drain on this connection, so it is never awaited twice
+            if tasks:
+                await asyncio.gather(*tasks)
+        finally:
+            writer.close()
+
+    async def _reply(self, line: bytes, writer: asyncio.StreamWriter) -> None:
+        request_id = None
+        try:
+            request = json.loads(line)
+            if not isinstance(request, dict):
+                raise ValueError("requests are JSON objects")
+            request_id = request.get("id")
+            reply = {"id": request_id, "ok": True, "result": await self.handle(request)}
+        except Exception as error:
+            reply = {"id": request_id, "ok": False, "error": f"{type(error).__name__}: {error}"}
+        if not writer.is_closing():
+            writer.write(json.dumps(reply).encode() + b"\n")
+
+    async def handle(self, request: Dict[str, Any]) -> Any:
+        """Runs one decoded request and returns its result (what a connection sends back).
+
+        Raises:
+            ValueError: If the operation is unknown or a required field is missing.
+        """
+        op = request.get("op")
+        if op in WRITE_OPS:
+            return await self._submit(op, request)
+        read = getattr(self, f"_read_{op}", None) if isinstance(op, str) else None
+        if read is None:
+            raise ValueError(f"unknown op {op!r}")
+        self.flush()  # Queued writes happened first
+        return read(request)
+
+    # --- Writes: queued, then applied in batches ---
+    def _submit(self, op: str, request: Dict[str, Any]) -> asyncio.Future:
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append(((op, request), future))
+        if len(self._pending) >= self.batch_size:
+            self.flush()
+        elif self._flush_task is None:
+            self._flush_task = asyncio.ensure_future(self._flush_later())
+        return future
+
+    async def _flush_later(self) -> None:
+        await asyncio.sleep(self.batch_delay)  # Lets every ready connection queue its writes
+        self._flush_task = None
+        self.flush()
+
+    def flush(self) -> int:
+        """Applies every queued write, in arrival order, and resolves their replies.
+
+        Runs of plain schedules (no gate window) are merged into the tree in one call; a
+        cancel or a windowed schedule ends the run and is applied on its own, so a flight
+        scheduled and cancelled in the same batch ends up cancelled.
+
+        Returns:
+            int: The number of writes applied.
+        """
+        batch, self._pending = self._pending, []
+        if not batch:
+            return 0
+        run = []
+        for (op, request), future in batch:
+            if op == "schedule" and "gate" not in request:
+                run.append((request, future))
+                continue
+            self._merge_run(run)
+            run = []
+            self._resolve(future, self._apply_one, op, request)
+        self._merge_run(run)
+        self.writes += len(batch)
+        self.batches += 1
+        return len(batch)
+
+    def _merge_run(self, run: List[Tuple[Dict[str, Any], asyncio.Future]]) -> None:
+        """Schedules a run of flights with one batched merge; each reply says whether its flight was new."""
+        if not run:
+            return
+        seen, new = set(), []
+        try:
+            pairs = [(_flight(request), request.get("details")) for request, _ in run]
+            for flight_id, _ in pairs:  # The first record of a flight wins, as in the merge
+                new.append(flight_id not in seen and flight_id not in self.manager.tree)
+                seen.add(flight_id)
+            self.manager.schedule_flights(pairs, items=True)  # Validates IDs and index keys before changing anything
+        except Exception:  # Apply one by one so only the offending requests fail
+            for request, future in run:
+                self._resolve(future, self._apply_one, "schedule", request)
+            return
+        for (_, future), added in zip(run, new):
+            if not future.done():
+                future.set_result(added)
+
+    def _apply_one(self, op: str, request: Dict[str, Any]) -> bool:
+        flight_id = _flight(request)
+        if op == "cancel":
+            return self.manager.cancel_flight(flight_id)
+        if "gate" in request:
+            gate, arrival, departure = _args(request, "gate", "arrival", "departure")
+            return self.manager.schedule_flight_window(flight_id, gate, arrival, departure, request.get("details"))
+        return self.manager.schedule_flight(flight_id, request.get("details"))
+
+    @staticmethod
+    def _resolve(future: asyncio.Future, apply, *args) -> None:
+        try:
+            result = apply(*args)
+        except Exception as error:
+            if not future.done():
+                future.set_exception(error)
+        else:
+            if not future.done():  # Cancelled if its connection went away
+                future.set_result(result)
+
+    # --- Reads: answered directly after the queued writes ---
+    def _read_lookup(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        flight_id = _flight(request)
+        scheduled = self.manager.is_scheduled(flight_id)
+        return {"scheduled": scheduled, "details": self.manager.get_flight(flight_id) if scheduled else None}
+
+    def _read_range(self, request: Dict[str, Any]) -> List[Any]:
+        first_id, last_id = _args(request, "first", "last")
+        return list(self.manager.flights_between(first_id, last_id, reverse=request.get("reverse", False)))
+
+    def _read_airline(self, request: Dict[str, Any]) -> List[Any]:
+        airline, = _args(request, "airline")
+        return list(self.manager.flights_by_airline(airline, reverse=request.get("reverse", False)))
+
+    def _read_departing(self, request: Dict[str, Any]) -> List[Any]:
+        start, end = _args(request, "start", "end")
+        return list(self.manager.flights_departing(start, end, reverse=request.get("reverse", False)))
+
+    def _read_gate(self, request: Dict[str, Any]) -> List[Any]:
+        gate, start, end = _args(request, "gate", "start", "end")
+        return list(self.manager.flights_at_gate(gate, start, end))
+
+    def _read_window(self, request: Dict[str, Any]) -> Any:
+        return self.manager.get_window(_flight(request))
+
+    def _read_stats(self, request: Dict[str, Any]) -> Dict[str, int]:
+        return {"flights": len(self.manager.tree), "writes": self.writes, "batches": self.batches}
+
+
+class FlightClient:
+    """Asyncio client for FlightServer; concurrent `request` calls are pipelined on one connection.
+
+    Create it with `await FlightClient.connect(...)` and close it with `await client.close()`
+    (or use `async with`).
+    """
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self._reader, self._writer = reader, writer
+        self._waiting = {}   # Request id -> future of its reply
+        self._next_id = 0
+        self._listener = asyncio.ensure_future(self._listen())
+
+    @classmethod
+    async def connect(cls, host: str="127.0.0.1", port: int=DEFAULT_PORT, path: str=None) -> 'FlightClient':
+        """Connects to a server on `host:port`, or on the Unix socket `path`."""
+        if path is not None:
+            reader, writer = await asyncio.open_unix_connection(path, limit=LINE_LIMIT)
+        else:
+            reader, writer = await asyncio.open_connection(host, port, limit=LINE_LIMIT)
+        return cls(reader, writer)
+
+    async def request(self, op: str, **fields) -> Any:
+        """Sends one request and returns its result.
+
+        Raises:
+            FlightServiceError: If the server reports an error (the message names its type).
+            ConnectionError: If the connection closes before the reply arrives.
+        """
+        self._next_id += 1
+        request_id = self._next_id
+        future = asyncio.get_running_loop().create_future()
+        self._waiting[request_id] = future
+        self._writer.write(json.dumps({"id": request_id, "op": op, **fields}).encode() + b"\n")
+        await self._writer.drain()
+        return await future
+
+    async def _listen(self) -> None:
+        try:
+            while True:
+                line = await self._reader.readline()
+                if not line:
+                    break
+                reply = json.loads(line)
+                future = self._waiting.pop(reply["id"], None)
+                if future is None or future.done():
+                    continue
+                if reply["ok"]:
+                    future.set_result(reply["result"])
+                else:
+                    future.set_exception(FlightServiceError(reply["error"]))
+        finally:
+            for future in self._waiting.values():
+                if not future.done():
+                    future.set_exception(ConnectionError("connection to the flight server closed"))
+            self._waiting.clear()
+
+    async def close(self) -> None:
+        self._writer.close()
+        try:
+            await self._writer.wait_closed()
+        except ConnectionError:
+            pass
+        await self._listener
+
+    async def __aenter__(self) -> 'FlightClient':
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+
+async def _serve(args) -> None:
+    server = FlightServer(batch_delay=args.batch_delay)
+    await server.start(args.host, args.port, args.unix)
+    print(f"Serving flights on {args.unix or f'{args.host}:{server.port}'}")
+    async with server.server:
+        await server.server.serve_forever()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Serve a FlightManager over newline-delimited JSON.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--unix", help="listen on this Unix socket path instead of TCP")
+    parser.add_argument("--batch-delay", type=float, default=0.0, help="seconds to collect writes per batch")
+    asyncio.run(_serve(parser.parse_args()))
@@ -9,7 +9,13 @@
 
 import random
 import json
-from typing import List
+import sys
+from array import array
+from itertools import islice
+from typing import Any, Iterable, Iterator, List
+
+# Keys per chunk yielded by the streaming readers
+CHUNK_SIZE = 65536
 
 # -----------------------Inventory Manage Dataset-----------------------
 
@@ -17,14 +23,22 @@ def generate_random_inventory(count: int = 100, seed: int = 42) -> List[int]:
     random.seed(seed)
     return random.sample(range(1000, 9999), count)
 
-def save_to_file(data: List[int], filename: str = "inventory_data.json"):
+def save_inventory_to_file(data: List[int], filename: str = "inventory_data.json"):
     with open(filename, 'w') as f:
         json.dump(data, f)
 
-def load_from_file(filename: str = "inventory_data.json") -> List[int]:
+def load_inventory_from_file(filename: str = "inventory_data.json") -> List[int]:
     with open(filename, 'r') as f:
         return json.load(f)
 
+def generate_key_set(count: int, seed: int = 7) -> List[int]:
+    """Return `count` distinct integer IDs in random order, for any size (used by the benchmarks).
+
+    Unlike generate_random_inventory, the ID range grows with `count`, and a private
+    random generator is used so the global random state is left alone.
+    """
+    return random.Random(seed).sample(range(1000, 1000 + 10 * count), count)
+
 # -----------------------Airline Flight Manage Dataset-----------------------
 AIRLINE_CODES = ["AA", "BA", "DL", "UA", "SW", "AF", "LH", "EK"]
 
@@ -45,10 +59,75 @@ def load_from_file(filename: str = "flight_data.json") -> List[str]:
     with open(filename, 'r') as f:
         return json.load(f)
 
+# -----------------------Streaming Datasets (bounded memory)-----------------------
+
+def write_ndjson(keys: Iterable[Any], filename: str) -> int:
+    """Write keys as NDJSON (one JSON value per line) without building a list. Returns the count."""
+    count = 0
+    with open(filename, 'w') as f:
+        for key in keys:
+            f.write(json.dumps(key))
+            f.write("\n")
+            count += 1
+    return count
+
+def iter_ndjson_chunks(filename: str, chunk_size: int = CHUNK_SIZE) -> Iterator[List[Any]]:
+    """Yield the keys of an NDJSON file in lists of at most `chunk_size`; blank lines are skipped."""
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be positive")
+    with open(filename, 'r') as f:
+        lines = (line for line in f if not line.isspace())
+        while True:
+            chunk = [json.loads(line) for line in islice(lines, chunk_size)]
+            if not chunk:
+                return
+            yield chunk
+
+def write_binary_keys(keys: Iterable[int], filename: str, typecode: str = 'q',
+                      chunk_size: int = CHUNK_SIZE) -> int:
+    """Write integer keys as fixed-width little-endian values (array `typecode`). Returns the count."""
+    count = 0
+    with open(filename, 'wb') as f:
+        keys = iter(keys)
+        while True:
+            chunk = array(typecode, islice(keys, chunk_size))
+            if not chunk:
+                return count
+            if sys.byteorder == "big":
+                chunk.byteswap()
+            chunk.tofile(f)
+            count += len(chunk)
+
+def iter_binary_chunks(filename: str, chunk_size: int = CHUNK_SIZE, typecode: str = 'q') -> Iterator[List[int]]:
+    """Yield the keys of a fixed-width binary file in lists of at most `chunk_size`."""
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be positive")
+    width = array(typecode).itemsize
+    with open(filename, 'rb') as f:
+        while True:
+            data = f.read(chunk_size * width)
+            if not data:
+                return
+            if len(data) % width:
+                raise ValueError(f"{filename} is not a whole number of {width}-byte keys")
+            chunk = array(typecode, data)
+            if sys.byteorder == "big":
+                chunk.byteswap()
+            yield chunk.tolist()
+
+def iter_key_chunks(filename: str, chunk_size: int = CHUNK_SIZE) -> Iterator[List[Any]]:
+    """Stream a dataset in chunks, choosing the reader by extension (.ndjson/.jsonl or .bin)."""
+    name = str(filename)
+    if name.endswith((".ndjson", ".jsonl")):
+        return iter_ndjson_chunks(filename, chunk_size)
+    if name.endswith(".bin"):
+        return iter_binary_chunks(filename, chunk_size)
+    raise ValueError(f"cannot stream {filename}: expected a .ndjson, .jsonl or .bin file")
+
 if __name__ == "__main__":
     # Demo of generating inventory dataset
     inventory = generate_random_inventory(50)
-    save_to_file(inventory)
+    save_inventory_to_file(inventory)
     print("Generated and saved inventory data:", inventory)
 
     # Demo of generating flight dataset
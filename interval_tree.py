@@ -0,0 +1,129 @@
+# Created by: Michael Jung (ID:10680322), Timothy Sanders (ID: 01002147), Megan Ng (ID: 00756276)
+
+# Date: 10/18/26
+
+# Course: Spr25_CS_034 CRN 39575
+
+#--------------------------------------------------------------------------------------------
+from typing import Any, Iterator
+
+from RedBlackTree import RedBlackTree
+from red_black_node import RedBlackTreeNode, SizedRedBlackTreeNode
+
+
+class IntervalNode(RedBlackTreeNode):
+    """Red-Black node whose key is an interval; `max_end` is the largest end in its subtree."""
+    __slots__ = ('max_end',)
+
+    def __init__(self, value, parent=None, is_red=True, debug=False, payload=None):
+        super().__init__(value, parent, is_red, debug, payload)
+        self.max_end = value[1]  # A new node is a subtree of one
+
+
+class SizedIntervalNode(SizedRedBlackTreeNode):
+    """IntervalNode that also counts its subtree, for trees created with `order_statistics=True`."""
+    __slots__ = ('max_end',)
+
+    def __init__(self, value, parent=None, is_red=True, debug=False, payload=None):
+        super().__init__(value, parent, is_red, debug, payload)
+        self.max_end = value[1]
+
+
+def _check_interval(key: Any) -> None:
+    """Raises ValueError unless `key` is a `(start, end, ...)` tuple with start <= end."""
+    if not isinstance(key, tuple) or len(key) < 2:
+        raise ValueError(f"interval keys are (start, end, ...) tuples, got {key!r}")
+    if key[1] < key[0]:
+        raise ValueError(f"interval {key!r} ends before it starts")
+
+
+class IntervalRedBlackTree(RedBlackTree):
+    """Red-Black Tree of closed intervals that answers overlap queries.
+
+    Keys are tuples `(start, end, ...)`, ordered by start, then end, then any extra items
+    (e.g. a flight ID, so equal windows can coexist). Every node caches `max_end`, the
+    largest end in its subtree. It is refreshed wherever the tree already refreshes cached
+    heights (`_pull_height`/`_retrace_height`), so the rotations in `_rotate_left` and
+    `_rotate_right`, inserts, deletes, joins and bulk builds all keep it exact.
+
+    Args:
+        log_capacity (int): Number of recent operations to keep in the log. Defaults to 0 (off).
+        order_statistics (bool): Keep subtree sizes for `rank`/`select`/`count_range`.
+        stats (bool): Collect TreeStats counters.
+    """
+    def __init__(self, log_capacity: int=0, order_statistics: bool=False, stats: bool=False):
+        super().__init__(log_capacity, order_statistics, stats)
+        self._node_class = SizedIntervalNode if order_statistics else IntervalNode
+
+    def insert(self, value: Any, payload: Any=None) -> None:
+        """Inserts an interval key `(start, end, ...)`; duplicates are ignored.
+
+        Raises:
+            ValueError: If the key is not a tuple or its end is before its start.
+        """
+        _check_interval(value)
+        super().insert(value, payload)
+
+    def _new_node(self, value: Any, payload: Any) -> IntervalNode:
+        _check_interval(value)
+        return super()._new_node(value, payload)
+
+    @staticmethod
+    def _pull_height(node: IntervalNode) -> None:
+        """Recomputes a node's cached height and `max_end` from its children."""
+        RedBlackTree._pull_height(node)
+        max_end = node.value[1]
+        if node.left and max_end < node.left.max_end:
+            max_end = node.left.max_end
+        if node.right and max_end < node.right.max_end:
+            max_end = node.right.max_end
+        node.max_end = max_end
+
+    def _retrace_height(self, node: IntervalNode) -> None:
+        """Refreshes heights and `max_end` from `node` upwards, stopping once neither changes."""
+        while node:
+            old_height, old_max_end = node.height, node.max_end
+            self._pull_height(node)
+            if node.height == old_height and node.max_end == old_max_end:
+                break
+            node = node.parent
+
+    @staticmethod
+    def _inherit_cache(successor: IntervalNode, node: IntervalNode) -> None:
+        successor.height = node.height
+        successor.max_end = node.max_end
+
+    def overlaps(self, lo: Any, hi: Any) -> Iterator[tuple]:
+        """Lazily yields, in key order, every interval key that overlaps `[lo, hi]`.
+
+        Intervals are closed: `(start, end, ...)` overlaps when `start <= hi` and `end >= lo`.
+        Subtrees whose `max_end` is below `lo` are skipped and the walk stops at the first
+        start past `hi`, so every subtree entered holds a match or lies on the path to that
+        start: O(log n + k) when the k matches are neighbours in key order, O(k log n) at worst.
+
+        Raises:
+            ValueError: If `hi` is less than `lo`.
+        """
+        if hi < lo:
+            raise ValueError("overlaps() requires lo <= hi")
+        stack, node = [], self.root
+        while True:
+            while node is not None and not node.max_end < lo:  # Some interval below ends at or after lo
+                stack.append(node)
+                node = node.left
+            if not stack:
+                return
+            node = stack.pop()
+            key = node.value
+            if hi < key[0]:  # Every later interval starts even later
+                return
+            if not key[1] < lo:
+                yield key
+            node = node.right
+
+    def print_tree(self, node=None, level=0, prefix='Root:', visited=None):
+        """Print the tree structure with each node's subtree `max_end`."""
+        if node:
+            print(' ' * (5 * level) + prefix + f"{node.value}({node.color}) max={node.max_end}")
+            self.print_tree(node.left, level + 1, 'L----', visited)
+            self.print_tree(node.right, level + 1, 'R----', visited)
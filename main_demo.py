@@ -23,7 +23,7 @@ def demo_all():
 
     # === AVL Tree Demo ===
     print("\n--- AVL Tree Random Insert Test ---")
-    random_avl_tree = AVLTree()
+    random_avl_tree = AVLTree(log_capacity=100)
     random_values = random.sample(range(1, 100), 20)
     for v in random_values:
         random_avl_tree.insert(v)
@@ -33,14 +33,18 @@ def demo_all():
     # === AVL Inventory Manager ===
     print("\n>>> AVL Inventory Demo")
     inv = InventoryManager()
-    for id in random.sample(range(1000, 1100), 10):
+    item_ids = random.sample(range(1000, 1100), 10)
+    for id in item_ids:
         inv.add_item(id)
     inv.show_inventory()
+    for id in item_ids[:3]:  # Sell a few items
+        inv.remove_item(id)
+    inv.show_inventory()
     inv.show_log()
 
     # === Red-Black Tree Demo ===
     print("\n--- Red-Black Tree Random Insert Test ---")
-    random_rb_tree = RedBlackTree()
+    random_rb_tree = RedBlackTree(log_capacity=100)
     for v in random_values:
         random_rb_tree.insert(v)
     random_rb_tree.print_tree(random_rb_tree.root)
@@ -49,9 +53,13 @@ def demo_all():
     # === Red-Black Flight Manager ===
     print("\n>>> Red-Black Flight Demo")
     flights = FlightManager()
-    for id in random.sample(range(2000, 2100), 10):
+    flight_ids = random.sample(range(2000, 2100), 10)
+    for id in flight_ids:
         flights.schedule_flight(id)
     flights.display_flight_schedule()
+    for id in flight_ids[:3]:  # Cancel a few flights
+        flights.cancel_flight(id)
+    flights.display_flight_schedule()
     flights.print_operations_log()
 
 if __name__ == "__main__":
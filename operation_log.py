@@ -0,0 +1,80 @@
+# Created by: Michael Jung (ID:10680322), Timothy Sanders (ID: 01002147), Megan Ng (ID: 00756276)
+
+# Date: 10/18/26
+
+# Course: Spr25_CS_034 CRN 39575
+
+#--------------------------------------------------------------------------------------------
+from collections import deque
+from typing import Any, Dict, Iterator, Tuple
+
+# Operation codes stored in log entries
+OP_INSERT = 0
+OP_DUPLICATE = 1
+OP_DELETE = 2
+OP_MISSING = 3
+OP_ROTATE_LEFT = 4
+OP_ROTATE_RIGHT = 5
+OP_RECOLOR = 6
+
+# Message templates used when entries are formatted for printing
+DEFAULT_FORMATS = {
+    OP_INSERT: "Inserted {key}, tree height: {height}",
+    OP_DUPLICATE: "Duplicated key {key} ignored.",
+    OP_DELETE: "Deleted {key}, tree height: {height}",
+    OP_MISSING: "Key {key} not found. Deletion skipped.",
+    OP_ROTATE_LEFT: "Left rotation on node {key}",
+    OP_ROTATE_RIGHT: "Right rotation on node {key}",
+    OP_RECOLOR: "Recoloring around grandparent {key}",
+}
+
+
+class OperationLog:
+    """Fixed-capacity ring buffer of tree operation events.
+
+    Each event is a compact `(op_code, key, height)` tuple; nothing is formatted until
+    `messages()` is called. Once full, the oldest events are dropped.
+
+    Args:
+        capacity (int): Maximum number of events kept.
+        formats (dict): Message template per op code. Defaults to DEFAULT_FORMATS.
+
+    Attributes:
+        entries (deque): The retained `(op_code, key, height)` tuples, oldest first
+        formats (dict): Message template per op code
+    """
+    def __init__(self, capacity: int=1000, formats: Dict[int, str]=None):
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        self.entries = deque(maxlen=capacity)
+        self.formats = formats or DEFAULT_FORMATS
+
+    @property
+    def capacity(self) -> int:
+        return self.entries.maxlen
+
+    def record(self, op: int, key: Any, height: int=None) -> None:
+        """Appends an event, evicting the oldest one if the buffer is full.
+
+        Args:
+            op (int): One of the OP_* codes.
+            key: The key the operation acted on.
+            height (int): Tree height after the operation, if known.
+        """
+        self.entries.append((op, key, height))
+
+    def messages(self) -> Iterator[str]:
+        """Yields the retained events formatted as human-readable messages, oldest first."""
+        formats = self.formats
+        for op, key, height in self.entries:
+            yield formats[op].format(key=key, height=height)
+
+    def clear(self) -> None:
+        """Drops all retained events."""
+        self.entries.clear()
+
+    def __iter__(self) -> Iterator[Tuple[int, Any, int]]:
+        return iter(self.entries)
+
+    def __len__(self) -> int:
+        return len(self.entries)
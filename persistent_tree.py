@@ -0,0 +1,524 @@
+# Created by: Michael Jung (ID:10680322), Timothy Sanders (ID: 01002147), Megan Ng (ID: 00756276)
+
+# Date: 10/18/26
+
+# Course: Spr25_CS_034 CRN 39575
+
+#--------------------------------------------------------------------------------------------
+"""Persistent (path-copying) AVL and Red-Black trees.
+
+Every tree object is an immutable version. `insert`, `set` and `delete` return a new version
+that shares every untouched node with the old one; only the O(log n) nodes on the search path
+(plus those touched by rebalancing) are copied. Old versions stay valid and unchanged, so a
+snapshot is just a reference to the current version: O(1), no copying, no locking.
+
+Nodes have no parent pointers (a shared node can have many parents across versions), so
+iteration uses an explicit stack of at most O(log n) nodes.
+"""
+from operator import itemgetter
+from typing import Any, Iterable, Iterator, List, Tuple
+
+from bst_tree import BinarySearchTree
+from operation_log import (DEFAULT_FORMATS, OP_DELETE, OP_DUPLICATE, OP_INSERT, OP_MISSING,
+                           OperationLog)
+
+
+class PersistentAvlNode:
+    """Immutable AVL node: never modified once it is linked into a version."""
+    __slots__ = ('value', 'payload', 'left', 'right', 'height')
+
+    def __init__(self, value, payload, left, right):
+        self.value = value
+        self.payload = payload
+        self.left = left
+        self.right = right
+        left_height = left.height if left else -1
+        right_height = right.height if right else -1
+        self.height = 1 + (left_height if left_height > right_height else right_height)
+
+
+class PersistentRedBlackNode:
+    """Immutable Red-Black node: never modified once it is linked into a version."""
+    __slots__ = ('value', 'payload', 'left', 'right', 'red', 'height')
+
+    def __init__(self, value, payload, left, right, red):
+        self.value = value
+        self.payload = payload
+        self.left = left
+        self.right = right
+        self.red = red
+        left_height = left.height if left else -1
+        right_height = right.height if right else -1
+        self.height = 1 + (left_height if left_height > right_height else right_height)
+
+
+class PersistentTree:
+    """Read-only ordered-map operations shared by the persistent AVL and Red-Black trees.
+
+    Args:
+        log_capacity (int): Number of recent operations to keep in the log; 0 disables logging.
+            All versions derived from one another share the same log.
+
+    Attributes:
+        root: The root node of this version, or None
+        size (int): Number of keys in this version
+        rotation_count (int): Rotations performed along the history leading to this version
+        log (OperationLog): Shared ring buffer of recent operations, or None when logging is off
+    """
+    LOG_FORMATS = DEFAULT_FORMATS
+
+    def __init__(self, log_capacity: int=0):
+        self.root = None
+        self.size = 0
+        self.rotation_count = 0
+        self.log = OperationLog(log_capacity, self.LOG_FORMATS) if log_capacity else None
+
+    def _derive(self, root, size: int) -> 'PersistentTree':
+        """Returns a new version sharing this version's log and rotation history."""
+        version = object.__new__(type(self))
+        version.root = root
+        version.size = size
+        version.rotation_count = self.rotation_count
+        version.log = self.log
+        return version
+
+    @classmethod
+    def from_sorted(cls, iterable: Iterable, items: bool=False, **kwargs) -> 'PersistentTree':
+        """Builds a balanced version from ascending keys in O(n) (see BinarySearchTree.from_sorted)."""
+        tree = cls(**kwargs)
+        pairs = BinarySearchTree._sorted_pairs(iterable, items)
+        max_depth = len(pairs).bit_length() - 1
+
+        def build(lo: int, hi: int, depth: int):
+            if lo > hi:
+                return None
+            mid = (lo + hi) // 2
+            left = build(lo, mid - 1, depth + 1)
+            right = build(mid + 1, hi, depth + 1)
+            return tree._built_node(pairs[mid], left, right, depth, max_depth)
+
+        tree.root = build(0, len(pairs) - 1, 0)
+        tree.size = len(pairs)
+        return tree
+
+    @classmethod
+    def from_unsorted(cls, iterable: Iterable, items: bool=False, **kwargs) -> 'PersistentTree':
+        """Sorts the keys (O(n log n)) and builds a balanced version with `from_sorted`."""
+        ordered = sorted(iterable, key=itemgetter(0)) if items else sorted(iterable)
+        return cls.from_sorted(ordered, items, **kwargs)
+
+    def _built_node(self, pair: Tuple[Any, Any], left, right, depth: int, max_depth: int):
+        """Creates one node of a bulk build. Implemented by the subclasses."""
+        raise NotImplementedError
+
+    # --- Updates (each returns a new version) ---
+    def insert(self, key: Any, payload: Any=None) -> 'PersistentTree':
+        """Returns a version that also holds `key`; this version is returned if the key exists."""
+        if key in self:
+            if self.log is not None:
+                self.log.record(OP_DUPLICATE, key)
+            return self
+        return self._updated(key, payload, self.size + 1)
+
+    def set(self, key: Any, payload: Any) -> 'PersistentTree':
+        """Returns a version mapping `key` to `payload`, inserting or replacing as needed."""
+        return self._updated(key, payload, self.size if key in self else self.size + 1)
+
+    def _updated(self, key: Any, payload: Any, size: int) -> 'PersistentTree':
+        """Path-copies `key` into a new version of `size` keys; the caller has already checked membership."""
+        version = self._derive(None, size)
+        version.root = version._insert(self.root, key, payload)
+        if self.log is not None:
+            self.log.record(OP_INSERT, key, version.height)
+        return version
+
+    def delete(self, key: Any) -> 'PersistentTree':
+        """Returns a version without `key`; this version is returned if the key is missing."""
+        if key not in self:
+            if self.log is not None:
+                self.log.record(OP_MISSING, key)
+            return self
+        version = self._derive(None, self.size - 1)
+        version.root = version._delete(self.root, key)
+        if self.log is not None:
+            self.log.record(OP_DELETE, key, version.height)
+        return version
+
+    def snapshot(self) -> 'PersistentTree':
+        """Returns this version: versions are immutable, so sharing one is a snapshot in O(1)."""
+        return self
+
+    # --- Lookups ---
+    def _find_node(self, key: Any):
+        current = self.root
+        while current:
+            if key < current.value:
+                current = current.left
+            elif key > current.value:
+                current = current.right
+            else:
+                return current
+        return None
+
+    def get(self, key: Any, default: Any=None) -> Any:
+        """Returns the payload stored under `key`, or `default` if the key is missing."""
+        node = self._find_node(key)
+        return node.payload if node else default
+
+    def __contains__(self, key: Any) -> bool:
+        return self._find_node(key) is not None
+
+    def __getitem__(self, key: Any) -> Any:
+        node = self._find_node(key)
+        if node is None:
+            raise KeyError(key)
+        return node.payload
+
+    def __len__(self) -> int:
+        return self.size
+
+    def floor(self, key: Any) -> Any:
+        """Returns the largest key less than or equal to `key`, or None if there is none."""
+        current, best = self.root, None
+        while current:
+            if key < current.value:
+                current = current.left
+            else:
+                best = current
+                current = current.right
+        return best.value if best else None
+
+    def ceiling(self, key: Any) -> Any:
+        """Returns the smallest key greater than or equal to `key`, or None if there is none."""
+        current, best = self.root, None
+        while current:
+            if key > current.value:
+                current = current.right
+            else:
+                best = current
+                current = current.left
+        return best.value if best else None
+
+    def min(self) -> Any:
+        """Returns the smallest key, or None if this version is empty."""
+        node = self.root
+        while node and node.left:
+            node = node.left
+        return node.value if node else None
+
+    def max(self) -> Any:
+        """Returns the largest key, or None if this version is empty."""
+        node = self.root
+        while node and node.right:
+            node = node.right
+        return node.value if node else None
+
+    # --- Iteration (explicit stack of at most one node per level) ---
+    def _iter_nodes(self, lo: Any=None, hi: Any=None, inclusive: Tuple[bool, bool]=(True, True),
+                    reverse: bool=False) -> Iterator[Any]:
+        lo_inclusive, hi_inclusive = inclusive
+        stack: List[Any] = []
+        node = self.root
+        if not reverse:
+            while node:  # Path to the first key in range; smaller subtrees are skipped
+                if lo is None or lo < node.value or (lo_inclusive and not node.value < lo):
+                    stack.append(node)
+                    node = node.left
+                else:
+                    node = node.right
+            while stack:
+                node = stack.pop()
+                if hi is not None and (hi < node.value or (not hi_inclusive and not node.value < hi)):
+                    return
+                yield node
+                node = node.right
+                while node:
+                    stack.append(node)
+                    node = node.left
+        else:
+            while node:  # Path to the last key in range; larger subtrees are skipped
+                if hi is None or node.value < hi or (hi_inclusive and not hi < node.value):
+                    stack.append(node)
+                    node = node.right
+                else:
+                    node = node.left
+            while stack:
+                node = stack.pop()
+                if lo is not None and (node.value < lo or (not lo_inclusive and not lo < node.value)):
+                    return
+                yield node
+                node = node.left
+                while node:
+                    stack.append(node)
+                    node = node.right
+
+    def __iter__(self) -> Iterator[Any]:
+        return (node.value for node in self._iter_nodes())
+
+    def __reversed__(self) -> Iterator[Any]:
+        return (node.value for node in self._iter_nodes(reverse=True))
+
+    def keys(self) -> Iterator[Any]:
+        """Yields the keys in ascending order."""
+        return iter(self)
+
+    def values(self) -> Iterator[Any]:
+        """Yields the payloads in ascending key order."""
+        return (node.payload for node in self._iter_nodes())
+
+    def items(self) -> Iterator[Tuple[Any, Any]]:
+        """Yields `(key, payload)` pairs in ascending key order."""
+        return ((node.value, node.payload) for node in self._iter_nodes())
+
+    def irange(self, lo: Any=None, hi: Any=None, inclusive: Tuple[bool, bool]=(True, True),
+               reverse: bool=False) -> Iterator[Any]:
+        """Lazily yields the keys between `lo` and `hi` (see BinarySearchTree.irange)."""
+        return (node.value for node in self._iter_nodes(lo, hi, inclusive, reverse))
+
+    def irange_items(self, lo: Any=None, hi: Any=None, inclusive: Tuple[bool, bool]=(True, True),
+                     reverse: bool=False) -> Iterator[Tuple[Any, Any]]:
+        """Lazily yields the `(key, payload)` pairs between `lo` and `hi` (see `irange`)."""
+        return ((node.value, node.payload) for node in self._iter_nodes(lo, hi, inclusive, reverse))
+
+    # --- Display ---
+    def _describe(self, node) -> str:
+        return str(node.value)
+
+    def print_tree(self, node=None, level: int=0, prefix: str='Root:', visited=None) -> None:
+        """Prints the version's tree structure (same layout as AVLTree.print_tree)."""
+        if node:
+            print(' ' * (5 * level) + prefix + self._describe(node))
+            self.print_tree(node.left, level + 1, 'L----', visited)
+            self.print_tree(node.right, level + 1, 'R----', visited)
+
+    def print_log(self) -> None:
+        """Prints the shared log, this version's rotation history and its height."""
+        print(f"\n--- {type(self).__name__} Log ---")
+        if self.log is None:
+            print("(logging disabled)")
+        else:
+            for entry in self.log.messages():
+                print(entry)
+        print(f"Total Rotations: {self.rotation_count}")
+        print(f"Final Tree Height: {self.height}")
+
+
+class PersistentAVLTree(PersistentTree):
+    """Persistent AVL tree: each update copies the search path and rebalances the copies."""
+    @property
+    def height(self) -> int:
+        """Height of this version (-1 when empty), in O(1)."""
+        return self.root.height if self.root else -1
+
+    def _built_node(self, pair, left, right, depth, max_depth):
+        return PersistentAvlNode(pair[0], pair[1], left, right)
+
+    def _describe(self, node) -> str:
+        left_height = node.left.height if node.left else -1
+        right_height = node.right.height if node.right else -1
+        return f"{node.value} (BF={left_height - right_height})"
+
+    def _balance(self, value, payload, left, right) -> PersistentAvlNode:
+        """Creates a node over two subtrees whose heights differ by at most two, rotating if needed."""
+        left_height = left.height if left else -1
+        right_height = right.height if right else -1
+        if left_height > right_height + 1:  # Left heavy
+            inner = left.right
+            if (left.left.height if left.left else -1) >= (inner.height if inner else -1):
+                self.rotation_count += 1  # Single right rotation
+                return PersistentAvlNode(left.value, left.payload, left.left,
+                                         PersistentAvlNode(value, payload, inner, right))
+            self.rotation_count += 2  # Left-right double rotation
+            return PersistentAvlNode(inner.value, inner.payload,
+                                     PersistentAvlNode(left.value, left.payload, left.left, inner.left),
+                                     PersistentAvlNode(value, payload, inner.right, right))
+        if right_height > left_height + 1:  # Right heavy
+            inner = right.left
+            if (right.right.height if right.right else -1) >= (inner.height if inner else -1):
+                self.rotation_count += 1  # Single left rotation
+                return PersistentAvlNode(right.value, right.payload,
+                                         PersistentAvlNode(value, payload, left, inner), right.right)
+            self.rotation_count += 2  # Right-left double rotation
+            return PersistentAvlNode(inner.value, inner.payload,
+                                     PersistentAvlNode(value, payload, left, inner.left),
+                                     PersistentAvlNode(right.value, right.payload, inner.right, right.right))
+        return PersistentAvlNode(value, payload, left, right)
+
+    def _insert(self, node, key, payload) -> PersistentAvlNode:
+        if node is None:
+            return PersistentAvlNode(key, payload, None, None)
+        if key < node.value:
+            return self._balance(node.value, node.payload, self._insert(node.left, key, payload), node.right)
+        if key > node.value:
+            return self._balance(node.value, node.payload, node.left, self._insert(node.right, key, payload))
+        return PersistentAvlNode(key, payload, node.left, node.right)  # Replace the payload
+
+    def _delete(self, node, key) -> PersistentAvlNode:
+        if key < node.value:
+            return self._balance(node.value, node.payload, self._delete(node.left, key), node.right)
+        if key > node.value:
+            return self._balance(node.value, node.payload, node.left, self._delete(node.right, key))
+        if node.left is None:
+            return node.right
+        if node.right is None:
+            return node.left
+        rest, successor = self._delete_min(node.right)
+        return self._balance(successor.value, successor.payload, node.left, rest)
+
+    def _delete_min(self, node) -> Tuple[PersistentAvlNode, PersistentAvlNode]:
+        """Returns (copy of the subtree without its smallest node, that smallest node)."""
+        if node.left is None:
+            return node.right, node
+        rest, smallest = self._delete_min(node.left)
+        return self._balance(node.value, node.payload, rest, node.right), smallest
+
+
+class PersistentRedBlackTree(PersistentTree):
+    """Persistent Red-Black tree: Okasaki's balance for inserts, Kahrs' algorithm for deletes."""
+    @property
+    def height(self) -> int:
+        """Height of this version (-1 when empty), in O(1)."""
+        return self.root.height if self.root else -1
+
+    @property
+    def black_height(self) -> int:
+        """Black nodes on every root-to-leaf path of this version."""
+        black, node = 0, self.root
+        while node:
+            black += not node.red
+            node = node.left
+        return black
+
+    def _built_node(self, pair, left, right, depth, max_depth):
+        return PersistentRedBlackNode(pair[0], pair[1], left, right, 0 < depth == max_depth)
+
+    def _describe(self, node) -> str:
+        return f"{node.value}({'R' if node.red else 'B'})"
+
+    def _updated(self, key: Any, payload: Any, size: int) -> 'PersistentRedBlackTree':
+        version = super()._updated(key, payload, size)
+        if version.root.red:  # The root is always black
+            root = version.root
+            version.root = PersistentRedBlackNode(root.value, root.payload, root.left, root.right, False)
+        return version
+
+    def delete(self, key: Any) -> 'PersistentRedBlackTree':
+        version = super().delete(key)
+        if version.root and version.root.red:
+            root = version.root
+            version.root = PersistentRedBlackNode(root.value, root.payload, root.left, root.right, False)
+        return version
+
+    def _balance(self, left, src, right) -> PersistentRedBlackNode:
+        """Okasaki's balance for a black node over `left`/`right` (one may have a red-red pair)."""
+        N = PersistentRedBlackNode
+        if left and left.red:
+            if right and right.red:  # Both children red: recolor, no rotation
+                return N(src.value, src.payload, N(left.value, left.payload, left.left, left.right, False),
+                         N(right.value, right.payload, right.left, right.right, False), True)
+            if left.left and left.left.red:
+                self.rotation_count += 1
+                a = left.left
+                return N(left.value, left.payload, N(a.value, a.payload, a.left, a.right, False),
+                         N(src.value, src.payload, left.right, right, False), True)
+            if left.right and left.right.red:
+                self.rotation_count += 2
+                b = left.right
+                return N(b.value, b.payload, N(left.value, left.payload, left.left, b.left, False),
+                         N(src.value, src.payload, b.right, right, False), True)
+        elif right and right.red:
+            if right.right and right.right.red:
+                self.rotation_count += 1
+                d = right.right
+                return N(right.value, right.payload, N(src.value, src.payload, left, right.left, False),
+                         N(d.value, d.payload, d.left, d.right, False), True)
+            if right.left and right.left.red:
+                self.rotation_count += 2
+                c = right.left
+                return N(c.value, c.payload, N(src.value, src.payload, left, c.left, False),
+                         N(right.value, right.payload, c.right, right.right, False), True)
+        return N(src.value, src.payload, left, right, False)
+
+    def _insert(self, node, key, payload) -> PersistentRedBlackNode:
+        N = PersistentRedBlackNode
+        if node is None:
+            return N(key, payload, None, None, True)
+        if key < node.value:
+            left = self._insert(node.left, key, payload)
+            return N(node.value, node.payload, left, node.right, True) if node.red else \
+                self._balance(left, node, node.right)
+        if key > node.value:
+            right = self._insert(node.right, key, payload)
+            return N(node.value, node.payload, node.left, right, True) if node.red else \
+                self._balance(node.left, node, right)
+        return N(key, payload, node.left, node.right, node.red)  # Replace the payload
+
+    # --- Kahrs' deletion ---
+    @staticmethod
+    def _redden(node) -> PersistentRedBlackNode:
+        """Kahrs' sub1: turns a black node red, reducing its black height by one."""
+        return PersistentRedBlackNode(node.value, node.payload, node.left, node.right, True)
+
+    def _balance_left(self, left, src, right) -> PersistentRedBlackNode:
+        """Rebuilds a node whose left subtree lost one black level."""
+        N = PersistentRedBlackNode
+        if left and left.red:
+            return N(src.value, src.payload, N(left.value, left.payload, left.left, left.right, False),
+                     right, True)
+        if right and not right.red:
+            return self._balance(left, src, self._redden(right))
+        inner = right.left  # right is red with a black left child
+        self.rotation_count += 1
+        return N(inner.value, inner.payload, N(src.value, src.payload, left, inner.left, False),
+                 self._balance(inner.right, right, self._redden(right.right)), True)
+
+    def _balance_right(self, left, src, right) -> PersistentRedBlackNode:
+        """Rebuilds a node whose right subtree lost one black level."""
+        N = PersistentRedBlackNode
+        if right and right.red:
+            return N(src.value, src.payload, left,
+                     N(right.value, right.payload, right.left, right.right, False), True)
+        if left and not left.red:
+            return self._balance(self._redden(left), src, right)
+        inner = left.right  # left is red with a black right child
+        self.rotation_count += 1
+        return N(inner.value, inner.payload, self._balance(self._redden(left.left), left, inner.left),
+                 N(src.value, src.payload, inner.right, right, False), True)
+
+    def _append(self, left, right) -> PersistentRedBlackNode:
+        """Kahrs' app: joins the two children of a deleted node."""
+        N = PersistentRedBlackNode
+        if left is None:
+            return right
+        if right is None:
+            return left
+        if left.red and right.red:
+            middle = self._append(left.right, right.left)
+            if middle and middle.red:
+                return N(middle.value, middle.payload, N(left.value, left.payload, left.left, middle.left, True),
+                         N(right.value, right.payload, middle.right, right.right, True), True)
+            return N(left.value, left.payload, left.left,
+                     N(right.value, right.payload, middle, right.right, True), True)
+        if not left.red and not right.red:
+            middle = self._append(left.right, right.left)
+            if middle and middle.red:
+                return N(middle.value, middle.payload, N(left.value, left.payload, left.left, middle.left, False),
+                         N(right.value, right.payload, middle.right, right.right, False), True)
+            return self._balance_left(left.left, left, N(right.value, right.payload, middle, right.right, False))
+        if right.red:
+            return N(right.value, right.payload, self._append(left, right.left), right.right, True)
+        return N(left.value, left.payload, left.left, self._append(left.right, right), True)
+
+    def _delete(self, node, key) -> PersistentRedBlackNode:
+        N = PersistentRedBlackNode
+        if key < node.value:
+            left = self._delete(node.left, key)
+            if node.left and not node.left.red:
+                return self._balance_left(left, node, node.right)
+            return N(node.value, node.payload, left, node.right, True)
+        if key > node.value:
+            right = self._delete(node.right, key)
+            if node.right and not node.right.red:
+                return self._balance_right(node.left, node, right)
+            return N(node.value, node.payload, node.left, right, True)
+        return self._append(node.left, node.right)
@@ -6,20 +6,281 @@
 
 #--------------------------------------------------------------------------------------------
 import random
+from operator import itemgetter
+from string import digits
+
 from RedBlackTree import RedBlackTree
+from backends import create_backend, delete_key, insert_batch, insert_key
+from generate_data import CHUNK_SIZE, iter_key_chunks, load_from_file
+from interval_tree import IntervalRedBlackTree
+from tree_snapshot import load_snapshot, save_snapshot
+
+
+class _Above:
+    """Compares greater than any flight ID, to end a range over `(field, flight_id)` index keys."""
+    def __lt__(self, other):
+        return False
+
+    def __gt__(self, other):
+        return True
+
+
+ABOVE = _Above()
+
+
+def airline_code(flight_id, record=None):
+    """Return a flight's airline: `record["airline"]` if given, else the ID's prefix before its
+    trailing digits ("AA123" -> "AA"). Returns "" when neither names an airline."""
+    if isinstance(record, dict) and "airline" in record:
+        return record["airline"]
+    return str(flight_id).rstrip(digits) if isinstance(flight_id, str) else ""
 
 
 class FlightManager:
     """
-    Manages flight schedules using a Red-Black Tree.
+    Manages flight schedules using a Red-Black Tree (or any other registered ordered container).
+
+    Each flight can carry a record (any object; dict records may set "airline" and "departure").
+    Two secondary Red-Black indexes hold `(airline, flight_id)` and `(departure, flight_id)`
+    keys and are kept in sync on every schedule and cancel, so per-airline and
+    departure-time listings are O(log n + k) range scans instead of full scans.
     """
-    def __init__(self):
-        self.tree = RedBlackTree()
+    def __init__(self, log_capacity=1000, backend="rbt", verbose=True, **backend_options):
+        """Create an empty schedule; `log_capacity` recent tree operations are kept (0 disables logging).
+
+        `backend` names the container in the backends registry (e.g. "rbt", "avl", "bplus" or
+        "persistent-rbt") and `backend_options` are passed to its constructor. Raises ValueError
+        for an unregistered name. With `verbose` False, loads and writes do not print.
+        """
+        self.tree = create_backend(backend, log_capacity, **backend_options)
+        self.backend = backend
+        self.log_capacity = log_capacity
+        self.backend_options = backend_options
+        self.verbose = verbose
+        self.gates = {}    # Gate -> IntervalRedBlackTree of (arrival, departure, flight_id) windows
+        self.windows = {}  # Flight ID -> (gate, arrival, departure) of its gate window
+        self.by_airline = RedBlackTree()    # (airline, flight_id) for flights with an airline code
+        self.by_departure = RedBlackTree()  # (departure, flight_id) for records with a departure time
+
+    @classmethod
+    def from_file(cls, filename, **kwargs):
+        """Create a schedule from a JSON list of flight IDs (as written by generate_data)."""
+        manager = cls(**kwargs)
+        manager.load_flights(load_from_file(filename))
+        return manager
+
+    @classmethod
+    def from_snapshot(cls, filename, **kwargs):
+        """Create a schedule from a binary snapshot, restoring the saved tree shape without rotations."""
+        manager = cls(**kwargs)
+        manager.tree = load_snapshot(filename, type(manager.tree), log_capacity=manager.log_capacity,
+                                     **manager.backend_options)
+        manager.by_airline, manager.by_departure = manager._build_indexes(manager.tree)
+        manager._report(f"Loaded {len(manager.tree)} flights")
+        return manager
+
+    def save_snapshot(self, filename):
+        """Write the scheduled flight IDs (and tree shape) to a binary snapshot file."""
+        return save_snapshot(self.tree, filename)
+
+    def load_flights(self, flight_ids, presorted=False, items=False):
+        """Replace the schedule with the given flights (or `(flight_id, record)` pairs when `items`
+        is True) using an O(n) balanced bulk build; the indexes are rebuilt in O(n log n)."""
+        tree_class = type(self.tree)
+        build = tree_class.from_sorted if presorted else tree_class.from_unsorted
+        tree = build(flight_ids, items, log_capacity=self.log_capacity, **self.backend_options)
+        self.by_airline, self.by_departure = self._build_indexes(tree)  # May raise: keep the old schedule
+        self.tree = tree
+        self.gates, self.windows = {}, {}
+        self._report(f"Loaded {len(self.tree)} flights")
+
+    def _report(self, message):
+        if self.verbose:
+            print(message)
+
+    @staticmethod
+    def _index_keys(flight_id, record):
+        """Return the flight's (airline index key, departure index key); either may be None."""
+        airline = airline_code(flight_id, record)
+        departure = record.get("departure") if isinstance(record, dict) else None
+        return ((airline, flight_id) if airline else None,
+                (departure, flight_id) if departure is not None else None)
+
+    def _build_indexes(self, tree):
+        airline_keys, departure_keys = [], []
+        for flight_id, record in tree.items():
+            airline_key, departure_key = self._index_keys(flight_id, record)
+            if airline_key:
+                airline_keys.append(airline_key)
+            if departure_key:
+                departure_keys.append(departure_key)
+        return RedBlackTree.from_unsorted(airline_keys), RedBlackTree.from_unsorted(departure_keys)
+
+    @staticmethod
+    def _probe(container, *keys):
+        """Compare each key with `container`'s keys, so a key that does not compare with them
+        (e.g. departure 940 among "09:40" strings) raises TypeError before anything is changed."""
+        if len(container):
+            for key in keys:
+                container.floor(key)
+
+    def _index(self, airline_key, departure_key):
+        if airline_key:
+            self.by_airline.insert(airline_key)
+        if departure_key:
+            self.by_departure.insert(departure_key)
+
+    def _unindex(self, flight_id, record):
+        airline_key, departure_key = self._index_keys(flight_id, record)
+        if airline_key:
+            self.by_airline.delete(airline_key)
+        if departure_key:
+            self.by_departure.delete(departure_key)
+
+    def ingest_file(self, filename, chunk_size=CHUNK_SIZE):
+        """Stream flight IDs from a .ndjson/.jsonl or .bin dataset into the schedule, `chunk_size` at a time.
+
+        Each chunk is added as one batch (see backends.insert_batch), so memory beyond the tree stays
+        bounded. Returns the number of scheduled flights.
+        """
+        for chunk in iter_key_chunks(filename, chunk_size):
+            self._merge_flights(chunk)
+        self._report(f"Loaded {len(self.tree)} flights")
+        return len(self.tree)
+
+    def _merge_flights(self, flight_ids, items=False):
+        """Merge a batch into the tree and both indexes. Every ID and index key is sorted and probed
+        against its container first, so a batch that cannot be merged raises before changing anything."""
+        pairs = list(flight_ids) if items else [(flight_id, None) for flight_id in flight_ids]
+        pairs.sort(key=itemgetter(0))  # Stable, so the first record of a flight still wins
+        if pairs:
+            self._probe(self.tree, pairs[0][0], pairs[-1][0])
+        entries = [(flight_id, record, self._index_keys(flight_id, record)) for flight_id, record in pairs]
+        if not any(airline_key or departure_key for _, _, (airline_key, departure_key) in entries):
+            before = len(self.tree)  # Nothing to index: merge the batch as is
+            self.tree = insert_batch(self.tree, pairs, items=True)  # Existing flights keep their details
+            return len(self.tree) - before
+        new, seen = [], set()
+        for flight_id, record, index_keys in entries:  # Only new flights are indexed
+            if flight_id not in seen and flight_id not in self.tree:
+                seen.add(flight_id)
+                new.append((flight_id, record, index_keys))
+        airline_keys = sorted(keys[0] for _, _, keys in new if keys[0])
+        departure_keys = sorted(keys[1] for _, _, keys in new if keys[1])
+        for index, keys in ((self.by_airline, airline_keys), (self.by_departure, departure_keys)):
+            if keys:
+                self._probe(index, keys[0], keys[-1])
+        self.tree = insert_batch(self.tree, [(flight_id, record) for flight_id, record, _ in new], items=True)
+        self.by_airline = insert_batch(self.by_airline, airline_keys)
+        self.by_departure = insert_batch(self.by_departure, departure_keys)
+        return len(new)
+
+    def schedule_flight(self, flight_id, details=None):
+        """Schedule a flight, optionally storing details (gate, times, ...) with it.
+
+        Returns True if the flight was not already scheduled (a scheduled flight keeps its details).
+        """
+        self._report(f"Scheduling flight {flight_id}")
+        return self._add_flight(flight_id, details)
+
+    def _add_flight(self, flight_id, details):
+        airline_key, departure_key = self._index_keys(flight_id, details)
+        if airline_key:  # Probe the indexes first, so a bad record raises before the tree changes
+            self._probe(self.by_airline, airline_key)
+        if departure_key:
+            self._probe(self.by_departure, departure_key)
+        before = len(self.tree)
+        self.tree = insert_key(self.tree, flight_id, details)
+        if len(self.tree) == before:  # An already scheduled flight keeps its record and index entries
+            return False
+        self._index(airline_key, departure_key)
+        return True
+
+    def schedule_flights(self, flight_ids, items=False):
+        """Schedule a batch of flights (or `(flight_id, details)` pairs when `items` is True) in one call.
+
+        Tree backends use `insert_many`, which picks the cheaper of sorted inserts or a
+        split/merge/join of the batch's ID range. Returns the number of newly scheduled flights.
+        """
+        added = self._merge_flights(flight_ids, items)
+        self._report(f"Scheduled {added} flights")
+        return added
+
+    def schedule_flight_window(self, flight_id, gate, arrival, departure, details=None):
+        """Schedule a flight that occupies `gate` from `arrival` to `departure` (inclusive).
+
+        Times may be any comparable values used consistently per gate (minutes, datetimes,
+        or zero-padded "HH:MM" strings). A flight that already has a window is moved to the
+        new one. Returns True if the flight was not already scheduled. Raises ValueError if
+        `departure` is before `arrival`.
+        """
+        self._report(f"Scheduling flight {flight_id} at gate {gate} from {arrival} to {departure}")
+        self._set_window(flight_id, gate, arrival, departure)
+        return self._add_flight(flight_id, details)
+
+    def _set_window(self, flight_id, gate, arrival, departure):
+        if departure < arrival:
+            raise ValueError(f"flight {flight_id} departs ({departure}) before it arrives ({arrival})")
+        self._drop_window(flight_id)
+        if gate not in self.gates:
+            self.gates[gate] = IntervalRedBlackTree()
+        self.gates[gate].insert((arrival, departure, flight_id))
+        self.windows[flight_id] = (gate, arrival, departure)
+
+    def _drop_window(self, flight_id):
+        window = self.windows.pop(flight_id, None)
+        if window:
+            gate, arrival, departure = window
+            self.gates[gate].delete((arrival, departure, flight_id))
+
+    def flights_at_gate(self, gate, start, end):
+        """Lazily yield the IDs of flights whose window at `gate` overlaps `start`..`end` (inclusive).
+
+        Flights come in arrival order. Each gate's windows are kept in an interval tree, so
+        this costs O(log n + k) for k results in the usual case (see IntervalRedBlackTree.overlaps).
+        """
+        windows = self.gates.get(gate)
+        if windows is None:
+            return iter(())
+        return (key[2] for key in windows.overlaps(start, end))
+
+    def get_window(self, flight_id):
+        """Return the flight's `(gate, arrival, departure)` window, or None if it has none."""
+        return self.windows.get(flight_id)
+
+    def cancel_flight(self, flight_id):
+        """Cancel a flight (and free its gate window). Returns True if it was scheduled."""
+        self._report(f"Cancelling flight {flight_id}")
+        return self._remove_flight(flight_id)
+
+    def _remove_flight(self, flight_id):
+        self._drop_window(flight_id)
+        record = self.tree.get(flight_id)
+        self.tree, removed = delete_key(self.tree, flight_id)
+        if removed:
+            self._unindex(flight_id, record)
+        return removed
+
+    def flights_by_airline(self, airline, reverse=False):
+        """Lazily yield the IDs of an airline's scheduled flights in ID order, in O(log n + k)."""
+        return (key[1] for key in self.by_airline.irange((airline,), (airline, ABOVE), reverse=reverse))
+
+    def flights_departing(self, start, end, reverse=False):
+        """Lazily yield the IDs of flights whose record departs from `start` to `end` (inclusive),
+        in departure order, in O(log n + k)."""
+        return (key[1] for key in self.by_departure.irange((start,), (end, ABOVE), reverse=reverse))
+
+    def is_scheduled(self, flight_id):
+        """Return True if the flight is in the schedule."""
+        return flight_id in self.tree
+
+    def get_flight(self, flight_id, default=None):
+        """Return the details stored with a flight, or `default` if it is not scheduled."""
+        return self.tree.get(flight_id, default)
 
-    def schedule_flight(self, flight_id):
-        """Schedule a flight."""
-        print(f"Scheduling flight {flight_id}")
-        self.tree.insert(flight_id)
+    def flights_between(self, first_id, last_id, reverse=False):
+        """Lazily yield the scheduled flight IDs from `first_id` to `last_id` (inclusive), in order."""
+        return self.tree.irange(first_id, last_id, reverse=reverse)
 
     def display_flight_schedule(self, node=None, level=0, prefix='Root:'):
         """Display the flight schedule tree."""
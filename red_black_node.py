@@ -8,7 +8,14 @@
 from bst_node import BstNode
 
 class RedBlackTreeNode(BstNode):  # This class inherits from BstNode (a basic Binary Search Tree node class)
-    def __init__(self, value, parent=None, is_red=True, debug=False):
+    """
+    Node for Red-Black tree, inheriting from BstNode.
+    The color is stored as a boolean `red` slot; `color` exposes it as 'R'/'B'.
+    `height` caches the subtree height (0 for a leaf); RedBlackTree keeps it up to date.
+    """
+    __slots__ = ('red', 'height')
+
+    def __init__(self, value, parent=None, is_red=True, debug=False, payload=None):
         """
         Initializes a new Red-Black Tree Node.
 
@@ -17,15 +24,24 @@ class RedBlackTreeNode(BstNode):  # This class inherits from BstNode (a basic Bi
             parent: The parent node of this node (default: None).
             is_red: True if the node should be colored red initially, otherwise black (default: True).
             debug: Whether to print debugging messages for the node.
+            payload: Optional object mapped to the value when the tree is used as a map.
         """
-        super().__init__(value)  # Call the parent class's __init__ to initialize common attributes like value, left, right, parent
-        # Set the color of the node based on the 'is_red' parameter:
-        # 'R' for red if is_red is True, 'B' for black otherwise
-        self.color = 'R' if is_red else 'B'
-        self.debug = debug
-        if self.debug:
+        super().__init__(value, parent, payload=payload)  # Call the parent class's __init__ to initialize common attributes like value, left, right, parent
+        # Store the color as a boolean: True for red, False for black
+        self.red = is_red
+        self.height = 0  # Cached subtree height; a new node is a leaf
+        if debug or RedBlackTreeNode.debug:
             print(f"DEBUG: RedBlackTreeNode.__init__({value}) calling super()")  # Added for demo
 
+    @property
+    def color(self) -> str:
+        """The node color as 'R' (red) or 'B' (black)."""
+        return 'R' if self.red else 'B'
+
+    @color.setter
+    def color(self, color: str) -> None:
+        self.red = color == 'R'
+
     def __str__(self) -> str:
         """
         Returns a string representation of the node's value and color.
@@ -39,7 +55,7 @@ class RedBlackTreeNode(BstNode):  # This class inherits from BstNode (a basic Bi
         Returns:
             True if the node is red, False otherwise.
         """
-        return self.color == 'R'
+        return self.red
 
     def is_black(self) -> bool:
         """
@@ -48,7 +64,7 @@ class RedBlackTreeNode(BstNode):  # This class inherits from BstNode (a basic Bi
         Returns:
             True if the node is black, False otherwise.
         """
-        return self.color == 'B'
+        return not self.red
 
     def get_grandparent(self):
         """
@@ -89,12 +105,37 @@ class RedBlackTreeNode(BstNode):  # This class inherits from BstNode (a basic Bi
         return self.parent.right if self == self.parent.left else self.parent.left
 
     def get_height(self):
-        """Get the height of the node."""
+        """Recompute the height of the node's subtree recursively (ignores the cached `height`)."""
         l = self.left.get_height() if self.left else -1
         r = self.right.get_height() if self.right else -1
         return 1 + max(l, r)
 
 
+class SizedRedBlackTreeNode(RedBlackTreeNode):
+    """
+    Red-Black node that also counts the nodes in its subtree, for order-statistic queries.
+    Only used by trees created with `order_statistics=True`, so plain trees do not pay for the slot.
+    """
+    __slots__ = ('size',)
+
+    def __init__(self, value, parent=None, is_red=True, debug=False, payload=None):
+        super().__init__(value, parent, is_red, debug, payload)
+        self.size = 1  # A new node is a subtree of one
+
+
+class KeyedRedBlackTreeNode(RedBlackTreeNode):
+    """
+    Red-Black node of a tree created with `key=`: `value` holds the derived sort key, computed
+    once on insertion, and `item` the original key that the tree reports back.
+    """
+    __slots__ = ('item',)
+
+
+class KeyedSizedRedBlackTreeNode(SizedRedBlackTreeNode):
+    """SizedRedBlackTreeNode for trees created with both `key=` and `order_statistics=True`."""
+    __slots__ = ('item',)
+
+
 # ---- Example Usage  ----
 if __name__ == "__main__":
     # Demonstrate instantiation calls __init__ chain
@@ -0,0 +1,72 @@
+# Created by: Michael Jung (ID:10680322), Timothy Sanders (ID: 01002147), Megan Ng (ID: 00756276)
+
+# Date: 10/18/26
+
+# Course: Spr25_CS_034 CRN 39575
+
+#--------------------------------------------------------------------------------------------
+import threading
+from contextlib import contextmanager
+from typing import Iterator
+
+
+class ReadWriteLock:
+    """Lock that admits many concurrent readers or a single writer.
+
+    Writers are preferred: once a writer is waiting, new readers queue behind it, so a
+    steady stream of lookups cannot starve updates. The lock is not reentrant; a thread
+    holding it must not acquire it again (in either mode).
+
+    Attributes:
+        readers (int): Number of threads currently holding the lock for reading
+    """
+    def __init__(self):
+        self._condition = threading.Condition(threading.Lock())
+        self.readers = 0
+        self._writing = False
+        self._writers_waiting = 0
+
+    def acquire_read(self) -> None:
+        """Blocks until no writer holds or is waiting for the lock, then joins the readers."""
+        with self._condition:
+            while self._writing or self._writers_waiting:
+                self._condition.wait()
+            self.readers += 1
+
+    def release_read(self) -> None:
+        with self._condition:
+            self.readers -= 1
+            if not self.readers:  # Last reader out lets a waiting writer in
+                self._condition.notify_all()
+
+    def acquire_write(self) -> None:
+        """Blocks until the lock is free of readers and writers, then holds it exclusively."""
+        with self._condition:
+            self._writers_waiting += 1
+            while self._writing or self.readers:
+                self._condition.wait()
+            self._writers_waiting -= 1
+            self._writing = True
+
+    def release_write(self) -> None:
+        with self._condition:
+            self._writing = False
+            self._condition.notify_all()  # Wake both queued writers and queued readers
+
+    @contextmanager
+    def read_locked(self) -> Iterator[None]:
+        """Context manager holding the lock for reading."""
+        self.acquire_read()
+        try:
+            yield
+        finally:
+            self.release_read()
+
+    @contextmanager
+    def write_locked(self) -> Iterator[None]:
+        """Context manager holding the lock exclusively."""
+        self.acquire_write()
+        try:
+            yield
+        finally:
+            self.release_write()
@@ -0,0 +1,405 @@
+# Created by: Michael Jung (ID:10680322), Timothy Sanders (ID: 01002147), Megan Ng (ID: 00756276)
+
+# Date: 10/18/26
+
+# Course: Spr25_CS_034 CRN 39575
+
+#--------------------------------------------------------------------------------------------
+"""Ordered map range-partitioned across worker processes, one tree per process.
+
+A single tree runs on one core. ShardedTree splits the key space at sorted boundary keys
+and gives each range to a worker process that owns an ordinary backend (see backends.py).
+Batches are cut by shard and sent to every worker before any reply is read, so the shards
+build, merge and scan in parallel. Because each shard holds one contiguous key range,
+the results of a range scan are merged in order by concatenating them in shard order.
+
+Keys and payloads cross process boundaries, so they must be picklable.
+"""
+import multiprocessing
+from bisect import bisect_left, bisect_right
+from itertools import chain, islice
+from operator import itemgetter
+from typing import Any, Dict, Iterable, Iterator, List, Tuple
+
+from backends import create_backend, delete_key, get_backend, insert_batch, insert_key
+
+# Shards smaller than this are never rebalanced automatically
+MIN_REBALANCE_SIZE = 1024
+
+
+# --- Worker side: each command takes the shard's tree and returns (tree, result) ---
+def _load(tree, pairs, options):
+    tree = type(tree).from_sorted(pairs, True, **options)
+    return tree, len(tree)
+
+
+def _insert(tree, key, payload):
+    before = len(tree)
+    tree = insert_key(tree, key, payload)
+    return tree, len(tree) > before
+
+
+def _insert_many(tree, pairs):
+    before = len(tree)
+    tree = insert_batch(tree, pairs, items=True)
+    return tree, len(tree) - before
+
+
+def _delete(tree, key):
+    return delete_key(tree, key)
+
+
+def _get(tree, key, default):
+    return tree, tree.get(key, default)
+
+
+def _contains(tree, key):
+    return tree, key in tree
+
+
+def _range(tree, lo, hi, inclusive, reverse):
+    return tree, list(tree.irange_items(lo, hi, inclusive, reverse))
+
+
+def _bound(tree, name, key):
+    return tree, getattr(tree, name)(key) if key is not None else getattr(tree, name)()
+
+
+def _take(tree, count, high):
+    """Removes the `count` largest (or smallest) entries; returns them ascending and the new min."""
+    entries = list(islice(tree.irange_items(reverse=high), count))
+    for key, _ in entries:
+        tree, _ = delete_key(tree, key)
+    if high:
+        entries.reverse()
+    return tree, (entries, tree.min())
+
+
+COMMANDS = {
+    "load": _load,
+    "insert": _insert,
+    "insert_many": _insert_many,
+    "delete": _delete,
+    "get": _get,
+    "contains": _contains,
+    "range": _range,
+    "bound": _bound,
+    "take": _take,
+}
+
+
+def _serve(conn, backend: str, options: Dict[str, Any]) -> None:
+    """Worker loop: owns one tree and answers `(command, args)` requests until it gets None."""
+    tree = create_backend(backend, **options)
+    while True:
+        request = conn.recv()
+        if request is None:
+            break
+        command, args = request
+        try:
+            tree, result = COMMANDS[command](tree, *args)
+        except Exception as error:  # Re-raised in the parent process
+            conn.send((False, error))
+        else:
+            conn.send((True, result))
+    conn.close()
+
+
+class ShardedTree:
+    """Ordered key -> payload map whose key ranges live in separate worker processes.
+
+    Shard `i` holds the keys `k` with `boundaries[i - 1] <= k < boundaries[i]`. The map starts
+    with every key routed to shard 0; `load` picks boundaries at the quantiles of its input,
+    and `rebalance` (run automatically once a shard holds more than `max_skew` times its
+    share) moves keys between neighbouring shards and shifts the boundary between them.
+    Shards past the last boundary are idle until a rebalance hands them keys.
+
+    The object is not thread-safe; use one per thread or guard it with a lock. Call `close`
+    (or use it as a context manager) to stop the workers.
+
+    Args:
+        shards (int): Number of worker processes. Defaults to 4.
+        backend (str): Registered backend each shard stores its keys in. Defaults to "avl".
+        max_skew (float): Rebalance when the largest shard exceeds this multiple of an even
+            share. None disables automatic rebalancing.
+        **backend_options: Extra constructor arguments for each shard's backend.
+
+    Attributes:
+        boundaries (list): Sorted split keys, one fewer than the shards in use (repeated around empty shards)
+        sizes (list): Number of keys in each shard
+
+    Raises:
+        ValueError: If `shards` is less than 1, `max_skew` is not above 1 or `backend` is not registered.
+    """
+    def __init__(self, shards: int=4, backend: str="avl", max_skew: float=2.0, **backend_options):
+        if shards < 1:
+            raise ValueError("ShardedTree needs at least one shard")
+        if max_skew is not None and max_skew <= 1:
+            raise ValueError("max_skew must be greater than 1")
+        get_backend(backend)  # Fail here rather than in every worker
+        self.backend = backend
+        self.backend_options = backend_options
+        self.max_skew = max_skew
+        self.boundaries = []
+        self.sizes = [0] * shards
+        self._connections, self._workers = [], []
+        for _ in range(shards):
+            parent_end, child_end = multiprocessing.Pipe()
+            worker = multiprocessing.Process(target=_serve, args=(child_end, backend, backend_options),
+                                             daemon=True)
+            worker.start()
+            child_end.close()
+            self._connections.append(parent_end)
+            self._workers.append(worker)
+
+    # --- Messaging ---
+    def _call(self, shard: int, command: str, *args) -> Any:
+        return self._gather({shard: (command, args)})[shard]
+
+    def _gather(self, requests: Dict[int, Tuple[str, tuple]]) -> Dict[int, Any]:
+        """Sends every request before reading any reply, so the shards work in parallel."""
+        if self._workers is None:
+            raise ValueError("ShardedTree is closed")
+        for shard, request in requests.items():
+            self._connections[shard].send(request)
+        results, failure = {}, None
+        for shard in requests:
+            ok, result = self._connections[shard].recv()  # Drain every reply, even after a failure
+            if ok:
+                results[shard] = result
+            elif failure is None:
+                failure = result
+        if failure is not None:
+            raise failure
+        return results
+
+    def close(self) -> None:
+        """Stops the worker processes; the map cannot be used afterwards."""
+        if self._workers is None:
+            return
+        for conn, worker in zip(self._connections, self._workers):
+            conn.send(None)
+            worker.join()
+            conn.close()
+        self._workers = None
+
+    def __enter__(self) -> 'ShardedTree':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:  # Interpreter shutdown may have closed the pipes already
+            pass
+
+    # --- Routing ---
+    @property
+    def shards(self) -> int:
+        return len(self.sizes)
+
+    def shard_of(self, key: Any) -> int:
+        """Returns the index of the shard responsible for `key`."""
+        return bisect_right(self.boundaries, key)
+
+    def _partition(self, pairs: List[Tuple[Any, Any]]) -> Dict[int, List[Tuple[Any, Any]]]:
+        """Cuts sorted pairs at the boundaries; returns shard -> its non-empty slice."""
+        keys = [key for key, _ in pairs]
+        cuts = [0] + [bisect_left(keys, boundary) for boundary in self.boundaries] + [len(pairs)]
+        return {shard: pairs[cuts[shard]:cuts[shard + 1]]
+                for shard in range(len(cuts) - 1) if cuts[shard] < cuts[shard + 1]}
+
+    # --- Writes ---
+    def load(self, iterable: Iterable, items: bool=False, presorted: bool=False) -> None:
+        """Replaces the contents, cutting the sorted keys into equal shards built in parallel.
+
+        Args:
+            iterable: Keys, or `(key, payload)` pairs when `items` is True. Repeated keys keep the first.
+            items: Whether the iterable yields `(key, payload)` pairs.
+            presorted: Skip the sort when the keys are already in ascending order.
+        """
+        pairs = list(iterable) if items else [(key, None) for key in iterable]
+        if not presorted:
+            pairs.sort(key=itemgetter(0))  # Stable, so the first of repeated keys stays first
+        keys = [key for key, _ in pairs]
+        boundaries = []
+        for shard in range(1, self.shards):
+            cut = len(keys) * shard // self.shards
+            if cut < len(keys):
+                cut = bisect_left(keys, keys[cut])  # Repeated keys stay in one shard
+                if cut and (not boundaries or boundaries[-1] < keys[cut]):
+                    boundaries.append(keys[cut])
+        self.boundaries = boundaries
+        parts = self._partition(pairs)
+        sizes = self._gather({shard: ("load", (parts.get(shard, []), self.backend_options)) for shard in range(self.shards)})
+        self.sizes = [sizes[shard] for shard in range(self.shards)]
+
+    def insert(self, key: Any, payload: Any=None) -> bool:
+        """Inserts a key (an existing key keeps its payload). Returns True if it was new."""
+        shard = self.shard_of(key)
+        added = self._call(shard, "insert", key, payload)
+        self.sizes[shard] += added
+        if added:
+            self._maybe_rebalance()
+        return added
+
+    def insert_many(self, iterable: Iterable, items: bool=False) -> int:
+        """Adds a batch of keys, sending each shard its slice at once; returns the number added.
+
+        Args:
+            iterable: Keys in any order, or `(key, payload)` pairs when `items` is True.
+            items: Whether the iterable yields `(key, payload)` pairs.
+        """
+        pairs = sorted(iterable, key=itemgetter(0)) if items else [(key, None) for key in sorted(iterable)]
+        added = self._gather({shard: ("insert_many", (part,)) for shard, part in self._partition(pairs).items()})
+        for shard, count in added.items():
+            self.sizes[shard] += count
+        self._maybe_rebalance()
+        return sum(added.values())
+
+    def delete(self, key: Any) -> bool:
+        """Removes a key. Returns True if it was in the map."""
+        shard = self.shard_of(key)
+        removed = self._call(shard, "delete", key)
+        self.sizes[shard] -= removed
+        return removed
+
+    def __delitem__(self, key: Any) -> None:
+        if not self.delete(key):
+            raise KeyError(key)
+
+    # --- Reads ---
+    def get(self, key: Any, default: Any=None) -> Any:
+        return self._call(self.shard_of(key), "get", key, default)
+
+    def __getitem__(self, key: Any) -> Any:
+        payload = self.get(key, _MISSING)
+        if payload is _MISSING:
+            raise KeyError(key)
+        return payload
+
+    def __contains__(self, key: Any) -> bool:
+        return self._call(self.shard_of(key), "contains", key)
+
+    def __len__(self) -> int:
+        return sum(self.sizes)
+
+    def range_items(self, lo: Any=None, hi: Any=None, inclusive: Tuple[bool, bool]=(True, True),
+                    reverse: bool=False) -> List[Tuple[Any, Any]]:
+        """Returns the `(key, payload)` pairs between `lo` and `hi`, scanning the shards in parallel.
+
+        Only shards whose range meets `[lo, hi]` are asked. Arguments are as for `irange`.
+        """
+        first = self.shard_of(lo) if lo is not None else 0
+        last = self.shard_of(hi) if hi is not None else len(self.boundaries)
+        order = range(first, last + 1)
+        parts = self._gather({shard: ("range", (lo, hi, inclusive, reverse)) for shard in order if self.sizes[shard]})
+        return list(chain.from_iterable(parts[shard] for shard in (reversed(order) if reverse else order)
+                                        if shard in parts))
+
+    def irange(self, lo: Any=None, hi: Any=None, inclusive: Tuple[bool, bool]=(True, True),
+               reverse: bool=False) -> Iterator[Any]:
+        """Yields the keys between `lo` and `hi` in order (see BinarySearchTree.irange).
+
+        The scan is done up front (see `range_items`), so the map may be changed while iterating.
+        """
+        return map(itemgetter(0), self.range_items(lo, hi, inclusive, reverse))
+
+    def irange_items(self, lo: Any=None, hi: Any=None, inclusive: Tuple[bool, bool]=(True, True),
+                     reverse: bool=False) -> Iterator[Tuple[Any, Any]]:
+        """Yields the `(key, payload)` pairs between `lo` and `hi` in order (see `range_items`)."""
+        return iter(self.range_items(lo, hi, inclusive, reverse))
+
+    def __iter__(self) -> Iterator[Any]:
+        return self.irange()
+
+    def items(self) -> Iterator[Tuple[Any, Any]]:
+        return iter(self.range_items())
+
+    def min(self) -> Any:
+        """Returns the smallest key, or None if the map is empty."""
+        shard = next((shard for shard, size in enumerate(self.sizes) if size), None)
+        return self._call(shard, "bound", "min", None) if shard is not None else None
+
+    def max(self) -> Any:
+        """Returns the largest key, or None if the map is empty."""
+        shard = next((shard for shard in reversed(range(self.shards)) if self.sizes[shard]), None)
+        return self._call(shard, "bound", "max", None) if shard is not None else None
+
+    def floor(self, key: Any) -> Any:
+        """Returns the largest key <= `key`, or None; falls back to the next non-empty shard below."""
+        shard = self.shard_of(key)
+        found = self._call(shard, "bound", "floor", key) if self.sizes[shard] else None
+        if found is None:
+            below = next((lower for lower in reversed(range(shard)) if self.sizes[lower]), None)
+            if below is not None:
+                found = self._call(below, "bound", "max", None)
+        return found
+
+    def ceiling(self, key: Any) -> Any:
+        """Returns the smallest key >= `key`, or None; falls back to the next non-empty shard above."""
+        shard = self.shard_of(key)
+        found = self._call(shard, "bound", "ceiling", key) if self.sizes[shard] else None
+        if found is None:
+            above = next((upper for upper in range(shard + 1, self.shards) if self.sizes[upper]), None)
+            if above is not None:
+                found = self._call(above, "bound", "min", None)
+        return found
+
+    # --- Rebalancing ---
+    def _maybe_rebalance(self) -> None:
+        largest = max(self.sizes)
+        share = -(-len(self) // self.shards)  # Even share, rounded up
+        if self.max_skew is not None and largest >= MIN_REBALANCE_SIZE and largest > self.max_skew * share:
+            self.rebalance()
+
+    def rebalance(self) -> int:
+        """Evens out the shard sizes by moving keys between shards and shifting boundaries.
+
+        One sweep from the first shard to the last: a shard over its share hands its largest
+        keys to the next shard; a shard under it takes the smallest keys of the next non-empty
+        shard, and the boundaries of any empty shards in between move up with them. Only the
+        moved keys are touched.
+
+        Returns:
+            The number of keys moved.
+        """
+        share = -(-len(self) // self.shards)
+        moved = 0
+        for shard in range(self.shards - 1):
+            if self.sizes[shard] > share:  # Hand the largest keys to the next shard
+                entries, _ = self._call(shard, "take", self.sizes[shard] - share, True)
+                if shard < len(self.boundaries):
+                    self.boundaries[shard] = entries[0][0]
+                else:  # The next shard gets its first range
+                    self.boundaries.append(entries[0][0])
+                moved += self._move(entries, shard, shard + 1)
+            while self.sizes[shard] < share:  # Pull the smallest keys of the next non-empty shard
+                donor = next((upper for upper in range(shard + 1, len(self.boundaries) + 1)
+                              if self.sizes[upper]), None)
+                if donor is None:
+                    break
+                entries, new_min = self._call(donor, "take", share - self.sizes[shard], False)
+                if new_min is not None:
+                    lower = new_min
+                elif donor < len(self.boundaries):  # Emptied: its range closes up to its upper boundary
+                    lower = self.boundaries[donor]
+                else:  # Emptied the last shard in use: this shard now holds every larger key
+                    lower = None
+                    del self.boundaries[shard:]
+                if lower is not None:
+                    self.boundaries[shard:donor] = [lower] * (donor - shard)
+                moved += self._move(entries, donor, shard)
+        return moved
+
+    def _move(self, entries: List[Tuple[Any, Any]], donor: int, receiver: int) -> int:
+        """Inserts entries taken from `donor` into `receiver`; returns how many moved."""
+        self._call(receiver, "insert_many", entries)
+        self.sizes[donor] -= len(entries)
+        self.sizes[receiver] += len(entries)
+        return len(entries)
+
+
+_MISSING = object()
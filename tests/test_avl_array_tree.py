@@ -0,0 +1,112 @@
+import random
+
+import pytest
+from avl_array_tree import NIL, ArrayAVLTree
+from avl_inventory_manager import InventoryManager
+
+@pytest.fixture
+def tree():
+    return ArrayAVLTree()
+
+def assert_array_avl_invariants(tree):
+    """Checks ordering, parent handles, stored heights, balance and size."""
+    def check(node, lo, hi):
+        if not node:
+            return -1, 0
+        key = tree.keys[node]
+        assert (lo is None or key > lo) and (hi is None or key < hi)
+        for child in (tree.left[node], tree.right[node]):
+            if child:
+                assert tree.parent[child] == node
+        left_height, left_count = check(tree.left[node], lo, key)
+        right_height, right_count = check(tree.right[node], key, hi)
+        assert abs(left_height - right_height) <= 1
+        assert tree.height[node] == 1 + max(left_height, right_height)
+        return tree.height[node], left_count + right_count + 1
+    assert check(tree.root, None, None)[1] == len(tree)
+
+def test_insert_and_lookup(tree):
+    for value in [50, 30, 70, 20, 40, 60, 80]:
+        tree.insert(value)
+    assert 40 in tree
+    assert 45 not in tree
+    assert list(tree) == [20, 30, 40, 50, 60, 70, 80]
+    assert tree.floor(45) == 40
+    assert tree.ceiling(45) == 50
+    assert (tree.min(), tree.max()) == (20, 80)
+    assert_array_avl_invariants(tree)
+
+def test_sequential_inserts_rotate(tree):
+    for value in [10, 20, 30]:
+        tree.insert(value)
+    assert tree.keys[tree.root] == 20
+    assert tree.rotation_count == 1
+
+def test_payloads_allocated_lazily(tree):
+    tree.insert(1)
+    assert tree.payloads is None
+    tree[2] = "two"
+    tree[1] = "one"
+    assert tree.get(1) == "one"
+    assert tree[2] == "two"
+    assert list(tree.items()) == [(1, "one"), (2, "two")]
+    with pytest.raises(KeyError):
+        tree[3]
+
+def test_deleted_rows_are_reused(tree):
+    for value in range(10):
+        tree.insert(value)
+    rows = len(tree.keys)
+    assert tree.delete(3)
+    assert not tree.delete(3)
+    tree.insert(42)
+    assert len(tree.keys) == rows
+    assert_array_avl_invariants(tree)
+
+def test_random_churn_matches_set(tree):
+    rng = random.Random(5)
+    present = set()
+    for _ in range(3000):
+        key = rng.randrange(400)
+        if rng.random() < 0.55:
+            tree.insert(key)
+            present.add(key)
+        else:
+            assert tree.delete(key) == (key in present)
+            present.discard(key)
+    assert_array_avl_invariants(tree)
+    assert list(tree) == sorted(present)
+
+def test_snapshot_is_independent(tree):
+    for value in range(20):
+        tree.insert(value)
+    copy = tree.snapshot()
+    tree.delete(5)
+    assert 5 in copy
+    assert 5 not in tree
+    assert list(copy) == list(range(20))
+
+def test_empty_tree(tree):
+    assert tree.root == NIL
+    assert list(tree) == []
+    assert tree.min() is None
+
+def test_inventory_manager_array_backend():
+    manager = InventoryManager(backend="array")
+    for item in [5, 3, 8]:
+        manager.add_item(item)
+    assert manager.has_item(3)
+    assert manager.remove_item(3)
+    assert not manager.has_item(3)
+    with pytest.raises(ValueError):
+        InventoryManager(backend="nope")
+
+def test_from_sorted_builds_balanced_tree():
+    for count in range(0, 40):
+        tree = ArrayAVLTree.from_sorted(range(count))
+        assert_array_avl_invariants(tree)
+    tree = ArrayAVLTree.from_unsorted([(3, "c"), (1, "a")], items=True)
+    assert list(tree.items()) == [(1, "a"), (3, "c")]
+    tree.insert(2)
+    tree.delete(3)
+    assert_array_avl_invariants(tree)
@@ -37,19 +37,32 @@ def test_right_left_rotation(avl_tree):
     insert_values(avl_tree, [10, 30, 20])  # Causes right-left rotation
     assert avl_tree.root.value == 20
 
-def test_duplicate_insertion(avl_tree):
+def test_duplicate_insertion():
+    avl_tree = AVLTree(log_capacity=100)
     insert_values(avl_tree, [50, 30, 70])
     avl_tree.insert(50)  # Duplicate
-    assert any("duplicated key 50" in msg.lower() for msg in avl_tree.log)
+    assert any("duplicated key 50" in msg.lower() for msg in avl_tree.log.messages())
     assert avl_tree.root.value == 50
 
 def test_rotation_count(avl_tree):
     insert_values(avl_tree, [10, 20, 30])
     assert avl_tree.rotation_count > 0
 
-def test_log_population(avl_tree):
+def test_log_population():
+    avl_tree = AVLTree(log_capacity=100)
     insert_values(avl_tree, [10, 20, 30])
-    assert any("rotation" in entry.lower() for entry in avl_tree.log)
+    assert any("rotation" in entry.lower() for entry in avl_tree.log.messages())
+
+def test_log_disabled_by_default(avl_tree):
+    insert_values(avl_tree, [10, 20, 30])
+    assert avl_tree.log is None
+
+def test_log_is_bounded_ring_of_tuples():
+    from operation_log import OP_INSERT
+    avl_tree = AVLTree(log_capacity=5)
+    insert_values(avl_tree, range(100))
+    assert len(avl_tree.log) == 5
+    assert list(avl_tree.log)[-1] == (OP_INSERT, 99, avl_tree.root.height)
 
 def test_avl_node_inherits_bst_node():
     node = AvlNode(5)
@@ -74,3 +87,352 @@ def test_avl_node_debug_true_prints_debug_message(capsys):
 def test_avl_node_str_method():
     node = AvlNode(42)
     assert str(node) == "42 (height: 1)"
+
+def test_get_and_contains(avl_tree):
+    avl_tree.insert(10, "ten")
+    avl_tree.insert(5)
+    assert 10 in avl_tree
+    assert 7 not in avl_tree
+    assert avl_tree.get(10) == "ten"
+    assert avl_tree.get(5) is None
+    assert avl_tree.get(7, "missing") == "missing"
+
+def test_getitem_setitem(avl_tree):
+    avl_tree[3] = "c"
+    avl_tree[1] = "a"
+    avl_tree[3] = "C"  # Replaces the payload without a new node
+    assert avl_tree[3] == "C"
+    assert avl_tree[1] == "a"
+    assert len(avl_tree) == 2
+    with pytest.raises(KeyError):
+        avl_tree[2]
+
+def test_floor_ceiling_min_max(avl_tree):
+    insert_values(avl_tree, [50, 30, 70, 20, 40, 60, 80])
+    assert avl_tree.floor(45) == 40
+    assert avl_tree.floor(50) == 50
+    assert avl_tree.floor(10) is None
+    assert avl_tree.ceiling(45) == 50
+    assert avl_tree.ceiling(80) == 80
+    assert avl_tree.ceiling(90) is None
+    assert avl_tree.min() == 20
+    assert avl_tree.max() == 80
+
+def test_empty_tree_lookups(avl_tree):
+    assert len(avl_tree) == 0
+    assert avl_tree.min() is None
+    assert avl_tree.max() is None
+    assert avl_tree.floor(1) is None
+
+def assert_avl_invariants(tree):
+    """Checks ordering, parent links, stored heights, balance factors and (subtree) sizes."""
+    def check(node, lo, hi):
+        if node is None:
+            return -1, 0
+        assert (lo is None or node.value > lo) and (hi is None or node.value < hi)
+        for child in (node.left, node.right):
+            if child:
+                assert child.parent is node
+        left_height, left_count = check(node.left, lo, node.value)
+        right_height, right_count = check(node.right, node.value, hi)
+        assert abs(left_height - right_height) <= 1
+        height = 1 + max(left_height, right_height)
+        assert node.height == height
+        if tree.order_statistics:
+            assert node.size == left_count + right_count + 1
+        return height, left_count + right_count + 1
+    if tree.root:
+        assert tree.root.parent is None
+    assert check(tree.root, None, None)[1] == len(tree)
+
+def test_delete_leaf_and_internal_nodes(avl_tree):
+    insert_values(avl_tree, [50, 30, 70, 20, 40, 60, 80])
+    assert avl_tree.delete(20)       # Leaf
+    assert avl_tree.delete(30)       # One child
+    assert avl_tree.delete(50)       # Two children (root)
+    assert not avl_tree.delete(99)   # Missing
+    assert 50 not in avl_tree
+    assert len(avl_tree) == 4
+    assert_avl_invariants(avl_tree)
+
+def test_delete_triggers_rebalance(avl_tree):
+    insert_values(avl_tree, [20, 10, 30, 40])
+    avl_tree.delete(10)  # Root becomes right heavy -> left rotation
+    assert avl_tree.root.value == 30
+    assert_avl_invariants(avl_tree)
+
+def test_delitem_missing_raises(avl_tree):
+    avl_tree[1] = "a"
+    del avl_tree[1]
+    assert avl_tree.root is None
+    with pytest.raises(KeyError):
+        del avl_tree[1]
+
+def test_random_insert_delete_churn(avl_tree):
+    import random
+    rng = random.Random(7)
+    present = set()
+    for _ in range(2000):
+        key = rng.randrange(300)
+        if rng.random() < 0.5:
+            avl_tree.insert(key)
+            present.add(key)
+        else:
+            assert avl_tree.delete(key) == (key in present)
+            present.discard(key)
+    assert_avl_invariants(avl_tree)
+    assert all(key in avl_tree for key in present)
+
+def test_avl_node_is_slotted():
+    node = AvlNode(1)
+    assert not hasattr(node, "__dict__")
+    with pytest.raises(AttributeError):
+        node.extra = 1
+
+def test_class_level_debug_switch(capsys):
+    AvlNode.debug = True
+    try:
+        AvlNode(7)
+    finally:
+        AvlNode.debug = False
+    assert "DEBUG: AvlNode.__init__(7) calling super()" in capsys.readouterr().out
+
+def test_insert_retrace_stops_early():
+    import random
+    class CountingTree(AVLTree):
+        visits = 0
+        def _retrace_insert(self, node):
+            visited = super()._retrace_insert(node)
+            CountingTree.visits += visited
+            return visited
+    tree = CountingTree()
+    keys = list(range(5000))
+    random.Random(3).shuffle(keys)
+    insert_values(tree, keys)
+    assert CountingTree.visits / len(keys) < 4  # Amortized O(1), far below the height (~14)
+    assert_avl_invariants(tree)
+
+def test_single_node_has_leaf_height(avl_tree):
+    avl_tree.insert(1)
+    assert avl_tree.root.height == 0
+
+def test_from_sorted_builds_balanced_tree():
+    for count in range(0, 70):
+        tree = AVLTree.from_sorted(range(count))
+        assert len(tree) == count
+        assert_avl_invariants(tree)
+    tree = AVLTree.from_sorted(range(1023))
+    assert tree.root.height == 9
+    assert tree.rotation_count == 0
+
+def test_from_sorted_items_and_duplicates():
+    tree = AVLTree.from_sorted([(1, "a"), (1, "dup"), (2, "b")], items=True)
+    assert tree[1] == "a"
+    assert tree[2] == "b"
+    assert len(tree) == 2
+
+def test_from_sorted_rejects_unsorted_input():
+    with pytest.raises(ValueError):
+        AVLTree.from_sorted([1, 3, 2])
+
+def test_from_unsorted_then_update():
+    tree = AVLTree.from_unsorted([9, 4, 7, 1, 4], log_capacity=10)
+    assert tree.log is not None
+    insert_values(tree, [3, 8])
+    tree.delete(9)
+    assert_avl_invariants(tree)
+    assert 4 in tree and 9 not in tree
+
+def test_inventory_manager_loads_from_file(tmp_path):
+    from avl_inventory_manager import InventoryManager
+    from generate_data import save_inventory_to_file
+    path = tmp_path / "inventory.json"
+    save_inventory_to_file([5, 3, 8, 1], str(path))
+    manager = InventoryManager.from_file(str(path))
+    assert manager.has_item(8)
+    assert len(manager.avl_tree) == 4
+
+def test_join_and_split():
+    left = AVLTree.from_sorted(range(0, 100))
+    right = AVLTree.from_sorted(range(101, 105))
+    left.join(100, right, payload="mid")
+    assert len(left) == 105 and len(right) == 0
+    assert left[100] == "mid"
+    assert_avl_invariants(left)
+    smaller, entry, larger = left.split(50)
+    assert entry == (50, None)
+    assert len(smaller) == 50 and len(larger) == 54
+    assert left.root is None
+    assert_avl_invariants(smaller)
+    assert_avl_invariants(larger)
+    with pytest.raises(ValueError):
+        smaller.join(10, larger)
+
+def test_set_algebra_matches_python_sets():
+    import random
+    rng = random.Random(8)
+    for _ in range(30):
+        a = set(rng.sample(range(500), rng.randrange(0, 200)))
+        b = set(rng.sample(range(500), rng.randrange(0, 40)))
+        for operation, expected in (("union", a | b), ("intersection", a & b), ("difference", a - b)):
+            tree = AVLTree.from_unsorted(a)
+            other = AVLTree.from_unsorted(b)
+            getattr(tree, operation)(other)
+            assert len(other) == 0
+            assert_avl_invariants(tree)
+            assert len(tree) == len(expected)
+            assert all(key in tree for key in expected)
+
+def test_union_prefers_other_payload():
+    tree = AVLTree.from_sorted([(1, "old"), (2, "keep")], items=True)
+    tree.union(AVLTree.from_sorted([(1, "new")], items=True))
+    assert tree[1] == "new" and tree[2] == "keep"
+    with pytest.raises(TypeError):
+        from RedBlackTree import RedBlackTree
+        tree.union(RedBlackTree())
+
+def assert_order_statistics(tree, keys):
+    import bisect
+    ordered = sorted(keys)
+    for probe in range(-2, 305, 7):
+        assert tree.rank(probe) == bisect.bisect_left(ordered, probe)
+        assert tree.count_range(probe, probe + 40) == (
+            bisect.bisect_right(ordered, probe + 40) - bisect.bisect_left(ordered, probe))
+    for index, key in enumerate(ordered):
+        assert tree.select(index) == key
+
+def test_order_statistics_through_churn():
+    import random
+    rng = random.Random(12)
+    tree = AVLTree(order_statistics=True)
+    present = set()
+    for _ in range(2000):
+        key = rng.randrange(300)
+        if rng.random() < 0.6:
+            tree.insert(key)
+            present.add(key)
+        else:
+            tree.delete(key)
+            present.discard(key)
+    assert_avl_invariants(tree)
+    assert_order_statistics(tree, present)
+    assert tree.select(-1) == max(present)
+    with pytest.raises(IndexError):
+        tree.select(len(tree))
+    assert tree.count_range(10, 5) == 0
+
+def test_order_statistics_through_bulk_build_and_set_algebra():
+    tree = AVLTree.from_sorted(range(0, 300, 2), order_statistics=True)
+    assert_avl_invariants(tree)
+    tree.union(AVLTree.from_sorted(range(1, 300, 3), order_statistics=True))
+    expected = set(range(0, 300, 2)) | set(range(1, 300, 3))
+    assert_avl_invariants(tree)
+    assert_order_statistics(tree, expected)
+    smaller, _, larger = tree.split(150)
+    assert smaller.order_statistics and len(smaller) == smaller.rank(150)
+    assert_avl_invariants(larger)
+    assert larger.select(0) == min(k for k in expected if k > 150)
+    with pytest.raises(TypeError):
+        smaller.union(AVLTree())
+
+def test_order_statistics_disabled_by_default(avl_tree):
+    insert_values(avl_tree, [1, 2, 3])
+    assert not hasattr(avl_tree.root, "size")
+    with pytest.raises(ValueError):
+        avl_tree.rank(2)
+
+def test_iteration_and_items(avl_tree):
+    for key in [50, 20, 80, 10, 30]:
+        avl_tree[key] = f"item-{key}"
+    assert list(avl_tree) == [10, 20, 30, 50, 80]
+    assert list(reversed(avl_tree)) == [80, 50, 30, 20, 10]
+    assert list(avl_tree.keys()) == list(avl_tree)
+    assert list(avl_tree.values())[0] == "item-10"
+    assert dict(avl_tree.items()) == {key: f"item-{key}" for key in [10, 20, 30, 50, 80]}
+    assert list(AVLTree()) == [] and list(AVLTree().irange(1, 2)) == []
+
+def test_irange_matches_filtered_keys():
+    import itertools
+    keys = list(range(0, 100, 3))
+    tree = AVLTree.from_sorted(keys)
+    for lo, hi in [(None, None), (None, 30), (30, None), (-5, 200), (10, 40), (9, 39), (40, 10)]:
+        for inclusive in itertools.product((True, False), repeat=2):
+            expected = [k for k in keys
+                        if (lo is None or k > lo or (inclusive[0] and k == lo))
+                        and (hi is None or k < hi or (inclusive[1] and k == hi))]
+            assert list(tree.irange(lo, hi, inclusive)) == expected
+            assert list(tree.irange(lo, hi, inclusive, reverse=True)) == expected[::-1]
+
+def test_iteration_is_lazy_and_not_recursive():
+    tree = AVLTree.from_sorted(range(200_000))
+    scan = tree.irange(150_000)
+    assert next(scan) == 150_000
+    assert sum(1 for _ in tree) == 200_000
+    for key in tree.irange(0, 999):  # Deleting the key just yielded is allowed
+        tree.delete(key)
+    assert tree.min() == 1000
+    assert_avl_invariants(tree)
+
+def test_stats_count_comparisons_and_visits():
+    import json
+    tree = AVLTree(stats=True)
+    insert_values(tree, [50, 30, 70])
+    assert 70 in tree and 10 not in tree
+    snapshot = tree.stats.snapshot()
+    insert, lookup = snapshot["operations"]["insert"], snapshot["operations"]["lookup"]
+    assert (insert["count"], insert["nodes_visited"], insert["comparisons"]) == (3, 2, 3)
+    assert (lookup["count"], lookup["nodes_visited"], lookup["comparisons"]) == (2, 4, 5)
+    assert sum(insert["latency_ns"].values()) == 3
+    json.dumps(snapshot)  # Exportable as-is
+
+def test_stats_rotations_and_retrace_depth():
+    tree = AVLTree(stats=True)
+    insert_values(tree, [10, 20, 30])   # Single rotation
+    insert_values(tree, [25, 27])       # Right-left double rotation at 30
+    tree.delete(10)
+    snapshot = tree.stats.snapshot()
+    assert snapshot["rotations"]["double"] >= 1
+    assert snapshot["rotations"]["single"] >= 1
+    assert tree.rotation_count == snapshot["rotations"]["single"] + 2 * snapshot["rotations"]["double"]
+    assert snapshot["operations"]["delete"]["count"] == 1
+    assert snapshot["retrace"]["count"] == 5  # Four non-root inserts and one delete
+    assert_avl_invariants(tree)
+
+def test_stats_disabled_by_default(avl_tree):
+    assert avl_tree.stats is None
+    assert "insert" not in vars(avl_tree)  # No per-instance timing wrapper
+
+@pytest.mark.parametrize("rebuild_cost", [1e-9, float("inf"), AVLTree.REBUILD_COST])
+def test_insert_many_strategies_agree(rebuild_cost):
+    import random
+    rng = random.Random(18)
+    tree = AVLTree.from_sorted([(key, "old") for key in range(0, 2000, 2)], items=True, order_statistics=True)
+    tree.REBUILD_COST = rebuild_cost  # Force merge, force sorted inserts, or choose automatically
+    expected = dict(tree.items())
+    for batch in ([(key, "new") for key in rng.sample(range(3000), 500)],
+                  [(key, "new") for key in range(5000, 5100)],
+                  [(7, "first"), (7, "second")]):
+        added = tree.insert_many(batch, items=True)
+        assert added == len({key for key, _ in batch} - expected.keys())
+        for key, payload in batch:
+            expected.setdefault(key, payload)
+        assert list(tree.items()) == sorted(expected.items())
+        assert_avl_invariants(tree)
+    assert tree[0] == "old" and tree[7] == "first"
+
+def test_insert_many_into_empty_tree_logs_each_key():
+    tree = AVLTree(log_capacity=10)
+    assert tree.insert_many([3, 1, 2, 2]) == 3
+    assert list(tree) == [1, 2, 3] and tree.rotation_count == 0
+    assert len(tree.log) == 3
+    assert tree.insert_many([]) == 0
+
+def test_inventory_manager_add_items(capsys):
+    from avl_inventory_manager import InventoryManager
+    for backend in ("avl", "array", "persistent"):
+        manager = InventoryManager(backend=backend)
+        manager.add_item(5, "shelf 1")
+        assert manager.add_items([(5, "dup"), (9, "shelf 2")], items=True) == 1
+        assert manager.add_items(range(20)) == 18
+        assert manager.get_item(5) == "shelf 1" and manager.get_item(9) == "shelf 2"
+        assert list(manager.avl_tree) == list(range(20))
@@ -0,0 +1,103 @@
+import random
+
+import pytest
+from AVLTree import AVLTree
+from avl_array_tree import ArrayAVLTree
+from avl_inventory_manager import InventoryManager
+from backends import (BACKENDS, OrderedContainer, backend_name, backend_names, create_backend, delete_key,
+                      get_backend, insert_batch, register_backend)
+from concurrent_flight_manager import ConcurrentFlightManager
+from rbt_flight_manager import FlightManager
+
+ALL_BACKENDS = ["array", "avl", "bplus", "persistent", "persistent-rbt", "rbt"]
+
+def test_registry_lists_builtin_backends():
+    assert backend_names() == ALL_BACKENDS
+    for name in ALL_BACKENDS:
+        container = create_backend(name)
+        assert isinstance(container, OrderedContainer) and backend_name(container) == name
+    assert get_backend("avl") is AVLTree
+    with pytest.raises(ValueError):
+        get_backend("nope")
+
+def test_register_backend_checks_names_and_interface(monkeypatch):
+    monkeypatch.setattr("backends.BACKENDS", dict(BACKENDS))
+    with pytest.raises(ValueError):
+        register_backend("avl", AVLTree)
+    with pytest.raises(TypeError):
+        register_backend("dict", dict)
+
+    class CountingAVLTree(AVLTree):
+        pass
+    assert register_backend("counting", CountingAVLTree) is CountingAVLTree
+    register_backend("avl", CountingAVLTree, replace=True)
+    manager = InventoryManager(backend="counting", log_capacity=0)
+    assert type(manager.avl_tree) is CountingAVLTree and manager.backend == "counting"
+
+def test_versioned_helpers_return_the_live_container():
+    tree = create_backend("persistent")
+    tree = insert_batch(tree, [(3, "c"), (1, "a")], items=True)
+    old = tree
+    tree, removed = delete_key(tree, 1)
+    assert removed and list(old) == [1, 3] and list(tree) == [3]
+    assert delete_key(tree, 1) == (tree, False)
+
+@pytest.mark.parametrize("reverse", [False, True])
+def test_array_tree_irange_matches_sorted_list(reverse):
+    rng = random.Random(20)
+    keys = sorted(rng.sample(range(500), 200))
+    tree = ArrayAVLTree.from_sorted(keys)
+    for lo, hi in [(None, None), (100, 300), (0, 499), (250, 250), (300, 100), (-5, 3)]:
+        for inclusive in [(True, True), (False, False), (True, False)]:
+            expected = [key for key in keys if (lo is None or key > lo or (inclusive[0] and key == lo)) and
+                        (hi is None or key < hi or (inclusive[1] and key == hi))]
+            assert list(tree.irange(lo, hi, inclusive, reverse)) == (expected[::-1] if reverse else expected)
+    assert list(reversed(tree)) == keys[::-1] and list(tree.values()) == [None] * len(keys)
+
+@pytest.mark.parametrize("backend", ALL_BACKENDS)
+def test_irange_items_pairs_keys_with_payloads(backend):
+    keys = random.Random(24).sample(range(300), 120)
+    tree = insert_batch(create_backend(backend), [(key, -key) for key in keys], items=True)
+    for lo, hi, inclusive in [(None, None, (True, True)), (50, 250, (False, True)), (300, 0, (True, True))]:
+        for reverse in [False, True]:
+            expected = [(key, -key) for key in tree.irange(lo, hi, inclusive, reverse)]
+            assert list(tree.irange_items(lo, hi, inclusive, reverse)) == expected
+
+@pytest.mark.parametrize("backend", ALL_BACKENDS)
+def test_inventory_manager_runs_on_every_backend(capsys, backend):
+    manager = InventoryManager(backend=backend)
+    manager.load_items(range(50, 0, -1))
+    manager.add_item(75, "shelf 2")
+    assert manager.add_items(range(45, 60)) == 9
+    assert manager.remove_item(10) and not manager.remove_item(10)
+    assert manager.has_item(75) and manager.get_item(75) == "shelf 2"
+    assert list(manager.avl_tree) == [key for key in range(1, 60) if key != 10] + [75]
+    manager.show_inventory()
+    manager.show_log()
+
+@pytest.mark.parametrize("manager_class", [FlightManager, ConcurrentFlightManager])
+@pytest.mark.parametrize("backend", ALL_BACKENDS)
+def test_flight_managers_run_on_every_backend(tmp_path, capsys, manager_class, backend):
+    manager = manager_class(backend=backend)
+    manager.load_flights([1300, 1100, 1200])
+    manager.schedule_flight(1150, {"gate": "A1"})
+    assert manager.schedule_flights([1000, 1100, 1400]) == 2
+    assert manager.cancel_flight(1200) and not manager.cancel_flight(1200)
+    assert manager.get_flight(1150) == {"gate": "A1"}
+    assert list(manager.flights_between(1100, 1300)) == [1100, 1150, 1300]
+    manager.save_snapshot(tmp_path / "flights.bin")
+    restored = manager_class.from_snapshot(tmp_path / "flights.bin", backend=backend)
+    assert type(restored.tree) is type(manager.tree) and list(restored.tree) == list(manager.tree)
+    manager.display_flight_schedule()
+    manager.print_operations_log()
+
+def test_concurrent_flush_keeps_persistent_versions():
+    manager = ConcurrentFlightManager(backend="persistent-rbt", batch_size=1000)
+    manager.schedule_flight(1)
+    before = manager.tree
+    manager.queue_schedule(2)
+    manager.queue_cancel(1)
+    assert manager.flush() == 2
+    assert list(manager.tree) == [2] and list(before) == [1]
+    with pytest.raises(ValueError):
+        FlightManager(backend="nope")
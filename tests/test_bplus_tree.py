@@ -0,0 +1,111 @@
+import random
+
+import pytest
+from avl_inventory_manager import InventoryManager
+from bplus_tree import BPlusBranch, BPlusLeaf, BPlusTree
+
+@pytest.fixture
+def tree():
+    return BPlusTree(fanout=4)
+
+def assert_bplus_invariants(tree):
+    """Checks key order and separator bounds, node occupancy, equal leaf depth, the leaf chain and size."""
+    leaves = []
+    def check(node, lo, hi, depth, root):
+        if isinstance(node, BPlusLeaf):
+            assert node.keys == sorted(node.keys) and len(node.keys) == len(node.payloads)
+            assert len(node.keys) <= tree.fanout and (root or len(node.keys) >= tree.fanout // 2)
+            assert all((lo is None or key >= lo) and (hi is None or key < hi) for key in node.keys)
+            leaves.append((node, depth))
+            return
+        assert len(node.children) == len(node.keys) + 1 <= tree.fanout
+        assert len(node.children) >= (2 if root else tree.fanout // 2)
+        bounds = [lo] + node.keys + [hi]
+        for index, child in enumerate(node.children):
+            check(child, bounds[index], bounds[index + 1], depth + 1, False)
+    if tree.root is None:
+        assert len(tree) == 0
+        return
+    check(tree.root, None, None, 0, True)
+    assert len({depth for _, depth in leaves}) == 1
+    chain = [leaf for leaf, _ in leaves]
+    assert chain[0].prev is None and chain[-1].next is None
+    assert all(left.next is right and right.prev is left for left, right in zip(chain, chain[1:]))
+    assert sum(len(leaf.keys) for leaf in chain) == len(tree)
+
+def test_insert_and_lookup(tree):
+    for value in [50, 30, 70, 20, 40, 60, 80]:
+        tree.insert(value, str(value))
+    tree.insert(40, "dup")  # Ignored
+    assert 40 in tree and 45 not in tree
+    assert tree[40] == "40" and tree.get(45, "-") == "-"
+    assert list(tree) == [20, 30, 40, 50, 60, 70, 80]
+    assert list(reversed(tree)) == [80, 70, 60, 50, 40, 30, 20]
+    assert (tree.floor(45), tree.ceiling(45)) == (40, 50)
+    assert (tree.min(), tree.max()) == (20, 80)
+    assert tree.height == 1 and tree.split_count == 2
+    assert_bplus_invariants(tree)
+
+def test_setitem_and_delitem(tree):
+    tree[1] = "one"
+    tree[1] = "uno"
+    assert list(tree.items()) == [(1, "uno")]
+    del tree[1]
+    assert tree.root is None and tree.min() is None
+    with pytest.raises(KeyError):
+        del tree[1]
+    with pytest.raises(ValueError):
+        BPlusTree(fanout=3)
+
+@pytest.mark.parametrize("fanout", [4, 5, 16])
+def test_random_churn_keeps_invariants(fanout):
+    rng = random.Random(fanout)
+    tree, expected = BPlusTree(fanout=fanout), set()
+    for step in range(6000):
+        key = rng.randrange(1500)
+        if rng.random() < 0.55:
+            tree.insert(key)
+            expected.add(key)
+        else:
+            assert tree.delete(key) == (key in expected)
+            expected.discard(key)
+        if step % 300 == 0:
+            assert_bplus_invariants(tree)
+            assert list(tree) == sorted(expected)
+    for key in list(tree):  # Deleting while iterating
+        tree.delete(key)
+    assert_bplus_invariants(tree)
+    assert tree.root is None and tree.merge_count > 0
+
+def test_irange_across_leaves():
+    tree = BPlusTree.from_sorted(range(0, 200, 2), fanout=4)
+    for key in range(40, 80, 2):  # Leaves stale separators behind
+        tree.delete(key)
+    keys = list(tree)
+    assert list(tree.irange(30, 90)) == [key for key in keys if 30 <= key <= 90]
+    assert list(tree.irange(30, 90, inclusive=(False, False), reverse=True)) == \
+        [key for key in reversed(keys) if 30 < key < 90]
+    assert list(tree.irange(hi=5)) == [0, 2, 4]
+    assert list(tree.irange(lo=195, reverse=True)) == [198, 196]
+    assert (tree.floor(60), tree.ceiling(60)) == (38, 80)
+
+@pytest.mark.parametrize("count", [0, 1, 16, 17, 1000])
+def test_from_sorted_fills_every_node_at_least_half(count):
+    tree = BPlusTree.from_unsorted([(key, -key) for key in reversed(range(count))], items=True, fanout=16)
+    assert_bplus_invariants(tree)
+    assert list(tree.items()) == [(key, -key) for key in range(count)]
+    with pytest.raises(ValueError):
+        BPlusTree.from_sorted([2, 1])
+
+def test_inventory_manager_bplus_backend(capsys):
+    manager = InventoryManager(backend="bplus", fanout=8)
+    manager.load_items(range(100, 0, -1))
+    manager.add_item(500, "shelf 9")
+    assert manager.add_items(range(90, 110)) == 9
+    assert manager.remove_item(50) and not manager.remove_item(50)
+    assert manager.avl_tree.fanout == 8 and manager.get_item(500) == "shelf 9"
+    assert_bplus_invariants(manager.avl_tree)
+    manager.show_inventory()
+    manager.show_log()
+    out = capsys.readouterr().out
+    assert "Root:[" in out and "Node Splits" in out
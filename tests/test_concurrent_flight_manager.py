@@ -0,0 +1,87 @@
+import threading
+
+from concurrent_flight_manager import ConcurrentFlightManager
+from rw_lock import ReadWriteLock
+from tests.test_rbtree import assert_rb_invariants
+
+
+def test_readers_share_and_writers_exclude():
+    lock = ReadWriteLock()
+    lock.acquire_read()
+    lock.acquire_read()  # A second reader does not block
+    assert lock.readers == 2
+    wrote = threading.Event()
+
+    def writer():
+        with lock.write_locked():
+            wrote.set()
+
+    thread = threading.Thread(target=writer)
+    thread.start()
+    assert not wrote.wait(0.05)  # Blocked by the readers
+    lock.release_read()
+    lock.release_read()
+    assert wrote.wait(1)
+    thread.join()
+
+def test_waiting_writer_blocks_new_readers():
+    lock = ReadWriteLock()
+    lock.acquire_read()
+    writer = threading.Thread(target=lock.acquire_write)
+    writer.start()
+    while not lock._writers_waiting:
+        pass
+    read = threading.Event()
+    reader = threading.Thread(target=lambda: (lock.acquire_read(), read.set()))
+    reader.start()
+    assert not read.wait(0.05)  # Queued behind the waiting writer
+    lock.release_read()
+    writer.join()
+    lock.release_write()
+    assert read.wait(1)
+    reader.join()
+
+def test_queued_writes_apply_in_order_on_flush():
+    manager = ConcurrentFlightManager(log_capacity=0, batch_size=100)
+    manager.queue_schedule(1, "first")
+    manager.queue_cancel(1)
+    manager.queue_schedule(1, "second")
+    assert not manager.is_scheduled(1)  # Not visible until flushed
+    assert manager.flush() == 3
+    assert manager.get_flight(1) == "second"
+
+def test_batch_flushes_automatically():
+    manager = ConcurrentFlightManager(log_capacity=0, batch_size=4)
+    for flight_id in range(4):
+        manager.queue_schedule(flight_id)
+    assert manager.flights_between(0, 10) == [0, 1, 2, 3]
+
+def test_concurrent_readers_and_writers():
+    manager = ConcurrentFlightManager(log_capacity=0, batch_size=16)
+    manager.load_flights(range(0, 2000, 2), presorted=True)
+    errors = []
+
+    def write(offset):
+        for flight_id in range(offset, 2000, 8):
+            manager.queue_schedule(flight_id + 1)
+            manager.cancel_flight(flight_id)
+
+    def read():
+        try:
+            for lo in range(0, 2000, 50):
+                scanned = manager.flights_between(lo, lo + 100)
+                assert scanned == sorted(scanned)
+                assert manager.scan_flights(lo, lo + 100, lambda flight_id: None) >= 0
+        except AssertionError as error:
+            errors.append(error)
+
+    threads = [threading.Thread(target=write, args=(offset,)) for offset in range(0, 8, 2)]
+    threads += [threading.Thread(target=read) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    manager.flush()
+    assert not errors
+    assert manager.flights_between(0, 2000) == list(range(1, 2000, 2))
+    assert_rb_invariants(manager.tree)
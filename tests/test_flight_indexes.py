@@ -0,0 +1,104 @@
+import random
+
+import pytest
+from concurrent_flight_manager import ConcurrentFlightManager
+from generate_data import generate_flight_numbers
+from rbt_flight_manager import FlightManager, airline_code
+
+def assert_indexes_match(manager):
+    """Checks both secondary indexes against a full scan of the flight records."""
+    records = dict(manager.tree.items())
+    assert list(manager.by_airline) == sorted((airline_code(fid, rec), fid) for fid, rec in records.items()
+                                              if airline_code(fid, rec))
+    assert list(manager.by_departure) == sorted((rec["departure"], fid) for fid, rec in records.items()
+                                                if isinstance(rec, dict) and "departure" in rec)
+
+def test_airline_code():
+    assert airline_code("AA123") == "AA"
+    assert airline_code("B6123", {"airline": "JBU"}) == "JBU"
+    assert airline_code(1234) == "" and airline_code("123") == ""
+
+@pytest.mark.parametrize("manager_class", [FlightManager, ConcurrentFlightManager])
+@pytest.mark.parametrize("backend", ["rbt", "persistent-rbt"])
+def test_indexes_follow_schedule_and_cancel(capsys, manager_class, backend):
+    manager = manager_class(backend=backend)
+    manager.schedule_flight("UA100", {"departure": "09:15"})
+    manager.schedule_flight("AA300", {"departure": "07:40", "gate": "B7"})
+    manager.schedule_flight("AA200", {"departure": "12:05"})
+    manager.schedule_flight("AA200", {"departure": "06:00"})  # Already scheduled: record and index unchanged
+    manager.schedule_flight("DL500")
+    assert list(manager.flights_by_airline("AA")) == ["AA200", "AA300"]
+    assert list(manager.flights_by_airline("AA", reverse=True)) == ["AA300", "AA200"]
+    assert list(manager.flights_by_airline("A")) == [] and list(manager.flights_by_airline("DL")) == ["DL500"]
+    assert list(manager.flights_departing("07:00", "10:00")) == ["AA300", "UA100"]
+    assert list(manager.flights_departing("09:15", "12:05", reverse=True)) == ["AA200", "UA100"]
+    assert manager.cancel_flight("AA300") and not manager.cancel_flight("AA300")
+    assert list(manager.flights_by_airline("AA")) == ["AA200"]
+    assert list(manager.flights_departing("00:00", "23:59")) == ["UA100", "AA200"]
+    assert_indexes_match(manager)
+
+@pytest.mark.parametrize("manager_class", [FlightManager, ConcurrentFlightManager])
+def test_quiet_manager_reports_through_return_values(capsys, manager_class):
+    manager = manager_class(log_capacity=0, verbose=False)
+    manager.load_flights(["AA100"])
+    assert manager.schedule_flight("UA200") and not manager.schedule_flight("AA100")
+    assert manager.schedule_flight_window("DL300", "B7", 600, 660)
+    assert not manager.schedule_flight_window("DL300", "B8", 0, 1)  # Moved, but not new
+    assert manager.schedule_flights(["AA100", "WN400"]) == 1
+    assert manager.cancel_flight("UA200") and not manager.cancel_flight("UA200")
+    assert manager.get_window("DL300") == ("B8", 0, 1)
+    assert capsys.readouterr().out == ""
+
+def test_batches_index_only_new_flights(capsys):
+    manager = FlightManager()
+    manager.schedule_flight("AA100", {"departure": 900})
+    batch = [("AA100", {"departure": 100}), ("UA200", {"departure": 800}), ("UA200", {"departure": 50}),
+             ("WN300", {"departure": 1000})]
+    assert manager.schedule_flights(batch, items=True) == 2
+    assert manager.get_flight("AA100") == {"departure": 900} and manager.get_flight("UA200") == {"departure": 800}
+    assert list(manager.flights_departing(0, 2000)) == ["UA200", "AA100", "WN300"]
+    assert_indexes_match(manager)
+    numeric = FlightManager()
+    assert numeric.schedule_flights([3, 1, 2, 1]) == 3  # Plain numeric IDs: nothing to index
+    assert len(numeric.by_airline) == len(numeric.by_departure) == 0
+
+@pytest.mark.parametrize("manager_class", [FlightManager, ConcurrentFlightManager])
+def test_failed_schedules_leave_tree_and_indexes_unchanged(manager_class):
+    manager = manager_class(verbose=False)
+    manager.schedule_flight("AA1", {"departure": "09:40"})
+    state = (list(manager.tree), list(manager.by_airline), list(manager.by_departure))
+    with pytest.raises(TypeError):  # 940 does not compare with "09:40"
+        manager.schedule_flights([("BB1", {"departure": "10:00"}), ("CC1", {"departure": 940})], items=True)
+    with pytest.raises(TypeError):
+        manager.schedule_flight("DD1", {"departure": 5})
+    with pytest.raises(TypeError):
+        manager.schedule_flights(["EE1", 7])
+    with pytest.raises(TypeError):
+        manager.load_flights([("FF1", {"departure": "08:00"}), ("GG1", {"departure": 800})], items=True)
+    assert (list(manager.tree), list(manager.by_airline), list(manager.by_departure)) == state
+    assert manager.schedule_flights([("BB1", {"departure": "10:00"})], items=True) == 1
+    assert list(manager.flights_departing("00:00", "23:59")) == ["AA1", "BB1"]
+    assert_indexes_match(manager)
+
+def test_bulk_loads_and_snapshots_rebuild_indexes(tmp_path, capsys):
+    flights = generate_flight_numbers(200)
+    manager = FlightManager()
+    manager.load_flights([(fid, {"departure": index % 24}) for index, fid in enumerate(flights)], items=True)
+    assert_indexes_match(manager)
+    assert list(manager.flights_by_airline("AA")) == sorted(fid for fid in flights if fid.startswith("AA"))
+    manager.save_snapshot(tmp_path / "flights.bin")
+    restored = FlightManager.from_snapshot(tmp_path / "flights.bin")
+    assert list(restored.by_airline) == list(manager.by_airline) and len(restored.by_departure) == 0
+
+def test_random_churn_keeps_indexes_in_sync(capsys):
+    rng = random.Random(22)
+    manager = ConcurrentFlightManager(batch_size=64)
+    flights = generate_flight_numbers(300)
+    for _ in range(2000):
+        fid = rng.choice(flights)
+        if rng.random() < 0.6:
+            manager.queue_schedule(fid, {"departure": rng.randrange(1440)})
+        else:
+            manager.queue_cancel(fid)
+    manager.flush()
+    assert_indexes_match(manager)
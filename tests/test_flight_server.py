@@ -0,0 +1,124 @@
+import asyncio
+import json
+import socket
+
+import pytest
+from flight_server import FlightClient, FlightServer, FlightServiceError
+
+def run_with_server(scenario, **server_options):
+    """Runs `scenario(server, client)` against a server on a free localhost port."""
+    async def main():
+        server = FlightServer(**server_options)
+        await server.start(port=0)
+        try:
+            async with await FlightClient.connect(port=server.port) as client:
+                return await scenario(server, client)
+        finally:
+            await server.close()
+    return asyncio.run(main())
+
+def test_schedule_lookup_range_and_cancel():
+    async def scenario(server, client):
+        assert await client.request("schedule", flight="AA120", details={"departure": "09:40"})
+        assert not await client.request("schedule", flight="AA120", details={"departure": "10:00"})
+        for flight_id in ["UA300", "AA110", "DL200"]:
+            await client.request("schedule", flight=flight_id)
+        assert await client.request("lookup", flight="AA120") == {"scheduled": True, "details": {"departure": "09:40"}}
+        assert await client.request("range", first="AA000", last="DL999") == ["AA110", "AA120", "DL200"]
+        assert await client.request("range", first="AA000", last="ZZ", reverse=True) == \
+            ["UA300", "DL200", "AA120", "AA110"]
+        assert await client.request("airline", airline="AA") == ["AA110", "AA120"]
+        assert await client.request("departing", start="09:00", end="09:59") == ["AA120"]
+        assert await client.request("cancel", flight="AA120")
+        assert not await client.request("cancel", flight="AA120")
+        assert await client.request("lookup", flight="AA120") == {"scheduled": False, "details": None}
+        return await client.request("stats")
+    assert run_with_server(scenario)["flights"] == 3
+
+def test_default_manager_does_not_print(capsys):
+    async def scenario(server, client):
+        await client.request("schedule", flight="AA1", gate="A1", arrival=0, departure=5)
+        await asyncio.gather(*(client.request("schedule", flight=f"AA{number}") for number in range(2, 10)))
+        return await client.request("cancel", flight="AA1")
+    assert run_with_server(scenario) and capsys.readouterr().out == ""
+
+def test_gate_windows():
+    async def scenario(server, client):
+        await client.request("schedule", flight="BA1", gate="B7", arrival=600, departure=660)
+        await client.request("schedule", flight="BA2", gate="B7", arrival=650, departure=700)
+        assert await client.request("gate", gate="B7", start=655, end=655) == ["BA1", "BA2"]
+        assert await client.request("window", flight="BA2") == ["B7", 650, 700]
+        with pytest.raises(FlightServiceError, match="ValueError"):
+            await client.request("schedule", flight="BA3", gate="B7", arrival=700, departure=600)
+        await client.request("cancel", flight="BA1")
+        return await client.request("gate", gate="B7", start=600, end=700)
+    assert run_with_server(scenario) == ["BA2"]
+
+def test_concurrent_writes_are_coalesced():
+    async def scenario(server, client):
+        others = [await FlightClient.connect(port=server.port) for _ in range(3)]
+        clients = [client] + others
+        flights = [f"SW{number}" for number in range(400)]
+        added = await asyncio.gather(*(clients[number % 4].request("schedule", flight=flight_id)
+                                       for number, flight_id in enumerate(flights + flights[:50])))
+        stats = await client.request("stats")
+        for other in others:
+            await other.close()
+        return added, stats
+    added, stats = run_with_server(scenario)
+    assert sum(added) == 400 and not any(added[400:])  # Repeats are reported as not new
+    assert stats["flights"] == 400 and stats["writes"] == 450
+    assert stats["batches"] < 20  # Pipelined writes share batches
+
+def test_writes_in_one_batch_apply_in_order():
+    async def scenario(server, client):
+        results = await asyncio.gather(client.request("schedule", flight="EK1"),
+                                       client.request("cancel", flight="EK1"),
+                                       client.request("schedule", flight="EK2"),
+                                       client.request("schedule", flight=["bad"]),
+                                       client.request("range", first="EK0", last="EK9"),
+                                       return_exceptions=True)
+        return results, server.batches
+    results, batches = run_with_server(scenario)
+    assert results[:3] == [True, True, True] and isinstance(results[3], FlightServiceError)
+    assert results[4] == ["EK2"] and batches == 1
+
+def test_failed_merge_falls_back_to_single_writes():
+    async def scenario(server, client):
+        await client.request("schedule", flight="AA1", details={"departure": "09:40"})
+        results = await asyncio.gather(client.request("schedule", flight="BB1", details={"departure": "10:00"}),
+                                       client.request("schedule", flight="CC1", details={"departure": 940}),
+                                       client.request("schedule", flight="DD1"),
+                                       return_exceptions=True)
+        return results, await client.request("departing", start="00:00", end="23:59")
+    results, departing = run_with_server(scenario)
+    assert results[0] is True and results[2] is True
+    assert isinstance(results[1], FlightServiceError) and "TypeError" in str(results[1])
+    assert departing == ["AA1", "BB1"]
+
+def test_bad_requests_get_error_replies():
+    async def scenario(server, client):
+        with pytest.raises(FlightServiceError, match="unknown op"):
+            await client.request("explode")
+        with pytest.raises(FlightServiceError, match="requires first, last"):
+            await client.request("range")
+        reader, writer = await asyncio.open_connection("127.0.0.1", server.port)
+        writer.write(b"not json\n[1, 2]\n")
+        replies = [json.loads(await reader.readline()) for _ in range(2)]
+        writer.close()
+        assert all(not reply["ok"] and reply["id"] is None for reply in replies)
+        return await client.request("stats")  # The server is still serving
+    assert run_with_server(scenario)["flights"] == 0
+
+@pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="needs Unix sockets")
+def test_unix_socket(tmp_path):
+    async def main():
+        path = str(tmp_path / "flights.sock")
+        server = FlightServer(batch_size=1)
+        await server.start(path=path)
+        async with await FlightClient.connect(path=path) as client:
+            await asyncio.gather(*(client.request("schedule", flight=number) for number in range(10)))
+            flights = await client.request("range", first=0, last=9)
+        await server.close()
+        return flights, server.batches
+    assert asyncio.run(main()) == (list(range(10)), 10)
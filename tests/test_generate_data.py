@@ -0,0 +1,70 @@
+import pytest
+from avl_inventory_manager import InventoryManager
+from concurrent_flight_manager import ConcurrentFlightManager
+from generate_data import (generate_flight_numbers, iter_binary_chunks, iter_key_chunks, iter_ndjson_chunks,
+                           load_from_file, load_inventory_from_file, save_inventory_to_file, save_to_file,
+                           write_binary_keys, write_ndjson)
+from rbt_flight_manager import FlightManager
+from tests.test_avl_tree import assert_avl_invariants
+from tests.test_rbtree import assert_rb_invariants
+
+def test_inventory_and_flight_files_keep_their_defaults(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    save_inventory_to_file([3, 1, 2])
+    save_to_file(["AA100"])
+    assert load_inventory_from_file() == [3, 1, 2]
+    assert load_from_file() == ["AA100"]
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["flight_data.json", "inventory_data.json"]
+
+def test_ndjson_round_trip_in_chunks(tmp_path):
+    path = tmp_path / "flights.ndjson"
+    flights = generate_flight_numbers(25)
+    assert write_ndjson(iter(flights), path) == 25
+    with open(path, "a") as f:
+        f.write("\n")  # Trailing blank line is ignored
+    chunks = list(iter_ndjson_chunks(path, chunk_size=10))
+    assert [len(chunk) for chunk in chunks] == [10, 10, 5]
+    assert sum(chunks, []) == flights
+
+def test_binary_round_trip_in_chunks(tmp_path):
+    path = tmp_path / "items.bin"
+    assert write_binary_keys(range(-5, 1000), path, chunk_size=100) == 1005
+    assert path.stat().st_size == 8 * 1005
+    chunks = list(iter_binary_chunks(path, chunk_size=256))
+    assert [len(chunk) for chunk in chunks] == [256, 256, 256, 237]
+    assert sum(chunks, []) == list(range(-5, 1000))
+    assert sum(iter_binary_chunks(tmp_path / "items.bin", typecode="q"), []) == list(range(-5, 1000))
+
+def test_streaming_rejects_bad_input(tmp_path):
+    with pytest.raises(ValueError):
+        iter_key_chunks(tmp_path / "items.json")
+    path = tmp_path / "torn.bin"
+    path.write_bytes(b"\x00" * 12)
+    with pytest.raises(ValueError):
+        list(iter_binary_chunks(path))
+    with pytest.raises(ValueError):
+        list(iter_ndjson_chunks(path, chunk_size=0))
+
+@pytest.mark.parametrize("backend", ["avl", "array", "persistent"])
+def test_inventory_ingests_stream_and_keeps_details(tmp_path, capsys, backend):
+    path = tmp_path / "items.bin"
+    write_binary_keys((key * 7 % 1000 for key in range(1000)), path)
+    manager = InventoryManager(backend=backend)
+    manager.add_item(14, details="shelf 3")
+    assert manager.ingest_file(path, chunk_size=64) == 1000
+    assert list(manager.avl_tree) == list(range(1000))
+    assert manager.get_item(14) == "shelf 3"
+    if backend == "avl":
+        assert_avl_invariants(manager.avl_tree)
+
+@pytest.mark.parametrize("manager_class", [FlightManager, ConcurrentFlightManager])
+def test_flight_managers_ingest_ndjson(tmp_path, capsys, manager_class):
+    path = tmp_path / "flights.ndjson"
+    flights = generate_flight_numbers(300)
+    write_ndjson(flights, path)
+    manager = manager_class()
+    manager.schedule_flight(flights[0], {"gate": "B7"})
+    assert manager.ingest_file(path, chunk_size=32) == 300
+    assert list(manager.tree) == sorted(flights)
+    assert manager.get_flight(flights[0]) == {"gate": "B7"}
+    assert_rb_invariants(manager.tree)
@@ -0,0 +1,94 @@
+import random
+
+import pytest
+from concurrent_flight_manager import ConcurrentFlightManager
+from interval_tree import IntervalRedBlackTree
+from rbt_flight_manager import FlightManager
+from tests.test_rbtree import assert_rb_invariants
+
+def assert_interval_invariants(tree):
+    """Checks the Red-Black invariants plus every cached subtree max_end."""
+    assert_rb_invariants(tree)
+    def check(node):
+        if node is None:
+            return None
+        ends = [node.value[1]] + [end for end in (check(node.left), check(node.right)) if end is not None]
+        assert node.max_end == max(ends)
+        return node.max_end
+    check(tree.root)
+
+def brute_overlaps(keys, lo, hi):
+    return sorted(key for key in keys if key[0] <= hi and key[1] >= lo)
+
+def random_interval(rng, tag):
+    start = rng.randrange(1000)
+    return (start, start + rng.choice([0, 1, 5, 30, 200]), tag)
+
+@pytest.mark.parametrize("order_statistics", [False, True])
+def test_random_churn_keeps_max_end(order_statistics):
+    rng = random.Random(21)
+    tree, keys = IntervalRedBlackTree(order_statistics=order_statistics), set()
+    for step in range(3000):
+        if keys and rng.random() < 0.4:
+            key = rng.choice(sorted(keys))
+            assert tree.delete(key)
+            keys.discard(key)
+        else:
+            key = random_interval(rng, step)
+            tree.insert(key)
+            keys.add(key)
+        if step % 250 == 0:
+            assert_interval_invariants(tree)
+            for _ in range(20):
+                lo = rng.randrange(-50, 1250)
+                hi = lo + rng.randrange(100)
+                assert list(tree.overlaps(lo, hi)) == brute_overlaps(keys, lo, hi)
+    assert_interval_invariants(tree)
+
+def test_bulk_build_split_and_union_keep_max_end():
+    rng = random.Random(7)
+    keys = sorted(random_interval(rng, tag) for tag in range(500))
+    tree = IntervalRedBlackTree.from_sorted(keys)
+    assert_interval_invariants(tree)
+    smaller, _, larger = tree.split(keys[250])
+    assert_interval_invariants(smaller)
+    assert_interval_invariants(larger)
+    smaller.union(larger)
+    smaller.insert_many([random_interval(rng, tag) for tag in range(500, 600)])
+    assert_interval_invariants(smaller)
+    assert list(smaller.overlaps(400, 410)) == brute_overlaps(list(smaller), 400, 410)
+
+def test_overlaps_is_lazy_closed_and_validated():
+    tree = IntervalRedBlackTree()
+    for key in [(0, 10, "a"), (10, 20, "b"), (21, 30, "c"), (5, 100, "d")]:
+        tree.insert(key)
+    assert list(tree.overlaps(10, 10)) == [(0, 10, "a"), (5, 100, "d"), (10, 20, "b")]
+    matches = tree.overlaps(0, 1000)
+    assert next(matches) == (0, 10, "a")
+    assert list(tree.overlaps(101, 200)) == []
+    with pytest.raises(ValueError):
+        list(tree.overlaps(5, 1))
+    with pytest.raises(ValueError):
+        tree.insert((5, 1))
+    with pytest.raises(ValueError):
+        tree.insert(5)
+
+@pytest.mark.parametrize("manager_class", [FlightManager, ConcurrentFlightManager])
+def test_flight_manager_gate_windows(capsys, manager_class):
+    manager = manager_class()
+    manager.schedule_flight_window("AA100", "B7", "13:30", "14:10", {"to": "JFK"})
+    manager.schedule_flight_window("UA200", "B7", "14:45", "15:50")
+    manager.schedule_flight_window("DL300", "B7", "16:00", "16:40")
+    manager.schedule_flight_window("WN400", "C2", "14:00", "15:00")
+    assert list(manager.flights_at_gate("B7", "14:00", "15:30")) == ["AA100", "UA200"]
+    assert list(manager.flights_at_gate("Z9", "00:00", "23:59")) == []
+    manager.schedule_flight_window("AA100", "C2", "17:00", "17:30")  # Moved to another gate
+    assert list(manager.flights_at_gate("B7", "14:00", "15:30")) == ["UA200"]
+    assert manager.get_window("AA100") == ("C2", "17:00", "17:30")
+    assert manager.get_flight("AA100") == {"to": "JFK"}
+    assert manager.cancel_flight("UA200") and manager.get_window("UA200") is None
+    assert list(manager.flights_at_gate("B7", "14:00", "15:30")) == []
+    with pytest.raises(ValueError):
+        manager.schedule_flight_window("XX1", "B7", "10:00", "09:00")
+    manager.load_flights(["AA100"])
+    assert manager.get_window("AA100") is None and manager.gates == {}
@@ -0,0 +1,100 @@
+import random
+
+import pytest
+from AVLTree import AVLTree
+from RedBlackTree import RedBlackTree
+from tests.test_avl_tree import assert_avl_invariants
+from tests.test_rbtree import assert_rb_invariants
+
+INVARIANTS = {AVLTree: assert_avl_invariants, RedBlackTree: assert_rb_invariants}
+
+def natural_key(flight_id):
+    return flight_id[:2], int(flight_id[2:])
+
+class CountingKey:
+    """Key function that counts its calls."""
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, flight_id):
+        self.calls += 1
+        return natural_key(flight_id)
+
+@pytest.mark.parametrize("tree_class", [AVLTree, RedBlackTree])
+def test_keys_ordered_by_key_and_reported_unchanged(tree_class):
+    tree = tree_class(key=natural_key)
+    for flight_id in ["AA100", "AA99", "BA7", "AA1000", "AA9"]:
+        tree.insert(flight_id, flight_id.lower())
+    tree.insert("AA99", "dup")  # Ignored
+    assert list(tree) == ["AA9", "AA99", "AA100", "AA1000", "BA7"]
+    assert list(reversed(tree))[0] == "BA7"
+    assert tree["AA99"] == "aa99" and "AA98" not in tree
+    assert (tree.min(), tree.max()) == ("AA9", "BA7")
+    assert (tree.floor("AA500"), tree.ceiling("AA500")) == ("AA100", "AA1000")
+    assert list(tree.irange("AA50", "AA1000", inclusive=(True, False))) == ["AA99", "AA100"]
+    assert list(tree.items())[0] == ("AA9", "aa9")
+    assert tree.delete("AA100") and not tree.delete("AA100")
+    assert list(tree) == ["AA9", "AA99", "AA1000", "BA7"]
+    INVARIANTS[tree_class](tree)
+
+def test_inorder_traversal_reports_original_keys():
+    tree = RedBlackTree(key=str.lower)
+    for name in ["b", "A", "c"]:
+        tree.insert(name)
+    assert [value for value, _ in tree.inorder_traversal()] == list(tree) == ["A", "b", "c"]
+    assert tree.inorder_traversal()[1] == ("b", "B") and tree.floor("a") == "A"
+
+@pytest.mark.parametrize("tree_class", [AVLTree, RedBlackTree])
+def test_key_computed_once_per_inserted_key(tree_class):
+    key = CountingKey()
+    tree = tree_class(key=key)
+    for number in random.Random(23).sample(range(1, 10_000), 500):
+        tree.insert(f"UA{number}")
+    assert key.calls == 500  # Comparisons inside the tree use the cached keys
+    key.calls = 0
+    tree.get("UA1")
+    tree.get("UA2")
+    list(tree.irange("UA10", "UA500"))
+    assert key.calls == 4  # One per lookup and one per bound
+
+@pytest.mark.parametrize("tree_class", [AVLTree, RedBlackTree])
+def test_keyed_bulk_paths_and_order_statistics(tree_class):
+    flights = [f"DL{number}" for number in range(1, 300)]
+    shuffled = random.Random(5).sample(flights, len(flights))
+    tree = tree_class.from_unsorted(shuffled, order_statistics=True, key=natural_key)
+    assert list(tree) == flights and tree.key is natural_key
+    assert tree.rank("DL10") == 9 and tree.select(9) == "DL10"
+    assert tree.count_range("DL50", "DL99") == 50
+    assert tree.insert_many([f"DL{number}" for number in range(250, 400)]) == 100
+    assert tree.insert_many([("AA5", "five")], items=True) == 1
+    assert list(tree)[:3] == ["AA5", "DL1", "DL2"] and tree["AA5"] == "five"
+    left, entry, right = tree.split("DL200")
+    assert entry == ("DL200", None) and left.max() == "DL199" and right.min() == "DL201"
+    joined = left.join("DL200", right)
+    assert len(joined) == 400 and list(joined.irange("DL199", "DL201")) == ["DL199", "DL200", "DL201"]
+    INVARIANTS[tree_class](joined)
+    with pytest.raises(ValueError):
+        tree_class.from_sorted(["AA100", "AA99"], key=natural_key)
+
+def test_trees_with_different_keys_are_incompatible():
+    with pytest.raises(TypeError):
+        AVLTree(key=natural_key).union(AVLTree())
+    with pytest.raises(TypeError):
+        RedBlackTree(key=natural_key).join("AA1", RedBlackTree(key=str.lower))
+
+@pytest.mark.parametrize("tree_class", [AVLTree, RedBlackTree])
+def test_one_comparison_descent_matches_membership(tree_class):
+    rng = random.Random(tree_class.__name__)
+    tree, keys = tree_class(), set()
+    for _ in range(3000):
+        key = rng.randrange(2000)
+        if rng.random() < 0.6:
+            tree.insert(key)
+            keys.add(key)
+        else:
+            assert tree.delete(key) == (key in keys)
+            keys.discard(key)
+    assert list(tree) == sorted(keys)
+    assert all((key in tree) == (key in keys) for key in range(-1, 2001))
+    assert all(tree.floor(key) == max((k for k in keys if k <= key), default=None) for key in range(0, 2000, 37))
+    INVARIANTS[tree_class](tree)
@@ -0,0 +1,127 @@
+import random
+
+import pytest
+from avl_inventory_manager import InventoryManager
+from persistent_tree import PersistentAVLTree, PersistentRedBlackTree
+
+TREES = [PersistentAVLTree, PersistentRedBlackTree]
+
+def assert_persistent_invariants(tree):
+    """Checks ordering, cached heights, size and the AVL or Red-Black balance rules."""
+    avl = isinstance(tree, PersistentAVLTree)
+    def check(node, lo, hi):
+        if node is None:
+            return -1, 1, 0
+        assert (lo is None or node.value > lo) and (hi is None or node.value < hi)
+        left_height, left_black, left_count = check(node.left, lo, node.value)
+        right_height, right_black, right_count = check(node.right, node.value, hi)
+        assert node.height == 1 + max(left_height, right_height)
+        if avl:
+            assert abs(left_height - right_height) <= 1
+        else:
+            assert left_black == right_black
+            if node.red:
+                assert not (node.left and node.left.red) and not (node.right and node.right.red)
+        black = left_black + (0 if not avl and node.red else 1)
+        return node.height, black, left_count + right_count + 1
+    assert check(tree.root, None, None)[2] == len(tree)
+    if not avl and tree.root:
+        assert not tree.root.red
+
+def nodes(tree):
+    found, stack = set(), [tree.root] if tree.root else []
+    while stack:
+        node = stack.pop()
+        found.add(id(node))
+        stack.extend(child for child in (node.left, node.right) if child)
+    return found
+
+@pytest.mark.parametrize("cls", TREES)
+def test_updates_leave_old_versions_unchanged(cls):
+    empty = cls()
+    one = empty.insert(5, "five")
+    two = one.insert(3)
+    three = two.set(5, "FIVE")
+    fewer = three.delete(3)
+    assert list(empty) == [] and len(empty) == 0
+    assert list(one.items()) == [(5, "five")]
+    assert list(two) == [3, 5] and two[5] == "five"
+    assert three[5] == "FIVE" and len(three) == 2
+    assert list(fewer) == [5]
+    assert one.insert(5) is one      # Duplicate: same version
+    assert one.delete(99) is one     # Missing: same version
+    assert fewer.snapshot() is fewer
+
+@pytest.mark.parametrize("cls", TREES)
+def test_random_churn_keeps_invariants_and_history(cls):
+    rng = random.Random(15)
+    tree, expected, history = cls(), set(), []
+    for step in range(3000):
+        key = rng.randrange(400)
+        if rng.random() < 0.55:
+            tree = tree.insert(key, -key)
+            expected.add(key)
+        else:
+            tree = tree.delete(key)
+            expected.discard(key)
+        if step % 100 == 0:
+            assert_persistent_invariants(tree)
+            history.append((tree, sorted(expected)))
+    assert_persistent_invariants(tree)
+    for version, keys in history:
+        assert list(version) == keys
+        assert list(reversed(version)) == keys[::-1]
+
+@pytest.mark.parametrize("cls", TREES)
+def test_update_copies_only_a_path(cls):
+    tree = cls.from_sorted(range(0, 2048, 2))
+    assert_persistent_invariants(tree)
+    before = nodes(tree)
+    inserted = tree.insert(1001)
+    deleted = tree.delete(1000)
+    for version in (inserted, deleted):
+        assert_persistent_invariants(version)
+        assert len(nodes(version) - before) <= 3 * (tree.height + 2)
+
+@pytest.mark.parametrize("cls", TREES)
+def test_insert_checks_membership_once(cls, monkeypatch):
+    tree = cls.from_sorted(range(0, 100, 2))
+    lookups = []
+    find = cls._find_node
+    monkeypatch.setattr(cls, "_find_node", lambda self, key: lookups.append(key) or find(self, key))
+    assert len(tree.insert(51)) == 51 and lookups == [51]
+    lookups.clear()
+    assert len(tree.set(50, "x")) == 50 and len(tree.set(53, "y")) == 51 and lookups == [50, 53]
+
+@pytest.mark.parametrize("cls", TREES)
+def test_lookups_and_ranges(cls):
+    tree = cls.from_unsorted([(key, str(key)) for key in [8, 2, 6, 4, 10]], items=True)
+    assert tree.get(6) == "6" and tree.get(7, "-") == "-"
+    with pytest.raises(KeyError):
+        tree[7]
+    assert (tree.min(), tree.max()) == (2, 10)
+    assert (tree.floor(7), tree.ceiling(7)) == (6, 8)
+    assert list(tree.irange(4, 8)) == [4, 6, 8]
+    assert list(tree.irange(4, 8, inclusive=(False, False))) == [6]
+    assert list(tree.irange(3, 9, reverse=True)) == [8, 6, 4]
+    assert list(tree.values()) == ["2", "4", "6", "8", "10"]
+
+def test_shared_log_and_rotation_history():
+    tree = PersistentAVLTree(log_capacity=10)
+    for key in (1, 2, 3):
+        tree = tree.insert(key)
+    tree.insert(2)
+    assert tree.rotation_count == 1 and tree.height == 1
+    assert list(tree.log.messages())[-1] == "Duplicated key 2 ignored."
+
+def test_inventory_snapshot_is_isolated_from_later_updates(capsys):
+    manager = InventoryManager(backend="persistent")
+    manager.load_items(range(10))
+    report = manager.snapshot()
+    manager.add_item(42)
+    assert manager.remove_item(3) is True
+    assert manager.remove_item(3) is False
+    assert list(report) == list(range(10))
+    assert 42 in manager.avl_tree and 3 not in manager.avl_tree
+    with pytest.raises(TypeError):
+        InventoryManager(backend="avl").snapshot()
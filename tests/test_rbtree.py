@@ -13,7 +13,7 @@ def insert_values(tree, values):
 def test_empty_tree_initialization(rbtree):
     assert rbtree.root is None
     assert rbtree.rotation_count == 0
-    assert rbtree.log == []
+    assert rbtree.log is None
 
 def test_single_insertion_sets_root_black(rbtree):
     rbtree.insert(10)
@@ -21,10 +21,11 @@ def test_single_insertion_sets_root_black(rbtree):
     assert rbtree.root.value == 10
     assert rbtree.root.color == "B"
 
-def test_duplicate_insertion_prints_message(rbtree):
+def test_duplicate_insertion_prints_message():
+    rbtree = RedBlackTree(log_capacity=10)
     rbtree.insert(10)
     rbtree.insert(10)  # duplicate
-    assert any("value 10 already exists" in msg.lower() for msg in rbtree.log)
+    assert any("value 10 already exists" in msg.lower() for msg in rbtree.log.messages())
 
 def test_inorder_traversal_values_only(rbtree):
     values = [20, 10, 30]
@@ -37,9 +38,15 @@ def test_color_property_preserved(rbtree):
     for val, color in rbtree.inorder_traversal():
         assert color in ("R", "B")
 
-def test_rotation_logging(rbtree):
+def test_rotation_logging():
+    rbtree = RedBlackTree(log_capacity=10)
     insert_values(rbtree, [10, 20, 30])
-    assert any("rotation" in msg.lower() for msg in rbtree.log)
+    assert any("rotation" in msg.lower() for msg in rbtree.log.messages())
+
+def test_print_log_with_logging_disabled(rbtree, capsys):
+    insert_values(rbtree, [10, 20, 30])
+    rbtree.print_log()
+    assert "(logging disabled)" in capsys.readouterr().out
 
 def test_get_red_black_tree_height(rbtree):
     insert_values(rbtree, [10, 20, 30, 5])
@@ -113,4 +120,265 @@ def test_get_height_with_children():
     root.left = RedBlackTreeNode(2, parent=root)
     root.right = RedBlackTreeNode(3, parent=root)
     root.left.left = RedBlackTreeNode(4, parent=root.left)
-    assert root.get_height() == 2
\ No newline at end of file
+    assert root.get_height() == 2
+def test_get_and_contains(rbtree):
+    rbtree.insert(10, "ten")
+    rbtree.insert(5)
+    assert 10 in rbtree
+    assert 7 not in rbtree
+    assert rbtree.get(10) == "ten"
+    assert rbtree.get(7, "missing") == "missing"
+
+def test_getitem_setitem(rbtree):
+    rbtree["UA100"] = {"gate": "B1"}
+    rbtree["AA200"] = {"gate": "A4"}
+    rbtree["UA100"] = {"gate": "B2"}
+    assert rbtree["UA100"] == {"gate": "B2"}
+    assert len(rbtree) == 2
+    with pytest.raises(KeyError):
+        rbtree["DL300"]
+
+def test_floor_ceiling_min_max(rbtree):
+    insert_values(rbtree, [10, 20, 30, 15, 25, 5, 1, 8, 18, 28])
+    assert rbtree.floor(17) == 15
+    assert rbtree.floor(0) is None
+    assert rbtree.ceiling(17) == 18
+    assert rbtree.ceiling(31) is None
+    assert rbtree.min() == 1
+    assert rbtree.max() == 30
+
+def assert_rb_invariants(tree):
+    """Checks ordering, parent links, red-red violations, black heights, cached heights and sizes."""
+    def check(node, lo, hi):
+        if node is None:
+            return 0, 0, -1
+        assert (lo is None or node.value > lo) and (hi is None or node.value < hi)
+        for child in (node.left, node.right):
+            if child:
+                assert child.parent is node
+                assert not (node.is_red() and child.is_red())
+        left_black, left_count, left_height = check(node.left, lo, node.value)
+        right_black, right_count, right_height = check(node.right, node.value, hi)
+        assert left_black == right_black
+        assert node.height == 1 + max(left_height, right_height)
+        if tree.order_statistics:
+            assert node.size == left_count + right_count + 1
+        return left_black + (1 if node.is_black() else 0), left_count + right_count + 1, node.height
+    if tree.root:
+        assert tree.root.is_black()
+        assert tree.root.parent is None
+    black, count, height = check(tree.root, None, None)
+    assert count == len(tree)
+    assert tree.black_height == black
+    assert tree.height == height
+
+def test_delete_cases(rbtree):
+    insert_values(rbtree, [10, 20, 30, 15, 25, 5, 1, 8, 18, 28])
+    for value in [1, 20, 10, 28]:
+        assert rbtree.delete(value)
+        assert value not in rbtree
+        assert_rb_invariants(rbtree)
+    assert not rbtree.delete(99)
+    assert [val for val, _ in rbtree.inorder_traversal()] == [5, 8, 15, 18, 25, 30]
+
+def test_delete_all_empties_tree(rbtree):
+    values = list(range(50))
+    insert_values(rbtree, values)
+    for value in values[::-1]:
+        rbtree.delete(value)
+        assert_rb_invariants(rbtree)
+    assert rbtree.root is None
+    assert len(rbtree) == 0
+
+def test_random_insert_delete_churn(rbtree):
+    import random
+    rng = random.Random(11)
+    present = set()
+    for _ in range(2000):
+        key = rng.randrange(300)
+        if rng.random() < 0.5:
+            rbtree.insert(key)
+            present.add(key)
+        else:
+            assert rbtree.delete(key) == (key in present)
+            present.discard(key)
+    assert_rb_invariants(rbtree)
+    assert sorted(present) == [val for val, _ in rbtree.inorder_traversal()]
+
+def test_node_color_stored_as_bool():
+    node = RedBlackTreeNode(10)
+    assert node.red is True
+    node.color = "B"
+    assert node.red is False
+    assert not hasattr(node, "__dict__")
+
+def test_from_sorted_builds_valid_tree():
+    for count in range(0, 70):
+        tree = RedBlackTree.from_sorted(range(count))
+        assert len(tree) == count
+        assert_rb_invariants(tree)
+    assert RedBlackTree.from_sorted(range(1000)).rotation_count == 0
+
+def test_from_unsorted_then_update():
+    tree = RedBlackTree.from_unsorted(["UA100", "AA200", "DL300", "AA200"])
+    assert [val for val, _ in tree.inorder_traversal()] == ["AA200", "DL300", "UA100"]
+    insert_values(tree, ["BA150", "EK900"])
+    tree.delete("DL300")
+    assert_rb_invariants(tree)
+
+def test_from_sorted_rejects_unsorted_input():
+    with pytest.raises(ValueError):
+        RedBlackTree.from_sorted([2, 1])
+
+def test_flight_manager_load_flights():
+    from rbt_flight_manager import FlightManager
+    manager = FlightManager()
+    manager.load_flights([300, 100, 200], presorted=False)
+    assert manager.is_scheduled(200)
+    assert manager.cancel_flight(100)
+    assert_rb_invariants(manager.tree)
+
+def test_join_and_split():
+    left = RedBlackTree.from_sorted(range(0, 200))
+    right = RedBlackTree.from_sorted(range(201, 203))
+    left.join(200, right)
+    assert len(left) == 203
+    assert_rb_invariants(left)
+    smaller, entry, larger = left.split(77.5)
+    assert entry is None
+    assert len(smaller) == 78 and len(larger) == 125
+    assert_rb_invariants(smaller)
+    assert_rb_invariants(larger)
+
+def test_split_and_set_algebra_results_have_black_roots():
+    smaller, entry, larger = RedBlackTree.from_sorted(range(2)).split(0)
+    assert entry == (0, None) and list(larger) == [1]
+    assert_rb_invariants(smaller)
+    assert_rb_invariants(larger)
+    for size in range(1, 12):
+        for key in range(size):  # Split on every present key
+            parts = RedBlackTree.from_sorted(range(size)).split(key)
+            assert_rb_invariants(parts[0])
+            assert_rb_invariants(parts[2])
+        for operation in ("intersection", "difference"):
+            for step in (1, 2, 3):
+                tree = RedBlackTree.from_sorted(range(size))
+                getattr(tree, operation)(RedBlackTree.from_sorted(range(0, size, step)))
+                assert_rb_invariants(tree)
+
+def test_set_algebra_matches_python_sets():
+    import random
+    rng = random.Random(9)
+    for _ in range(30):
+        a = set(rng.sample(range(500), rng.randrange(0, 200)))
+        b = set(rng.sample(range(500), rng.randrange(0, 200)))
+        for operation, expected in (("union", a | b), ("intersection", a & b), ("difference", a - b)):
+            tree = RedBlackTree()
+            insert_values(tree, a)
+            other = RedBlackTree.from_unsorted(b)
+            getattr(tree, operation)(other)
+            assert_rb_invariants(tree)
+            assert [val for val, _ in tree.inorder_traversal()] == sorted(expected)
+
+def test_order_statistics_through_churn_and_joins():
+    import bisect
+    import random
+    rng = random.Random(13)
+    tree = RedBlackTree(order_statistics=True)
+    present = set()
+    for _ in range(2000):
+        key = rng.randrange(300)
+        if rng.random() < 0.6:
+            tree.insert(key)
+            present.add(key)
+        else:
+            tree.delete(key)
+            present.discard(key)
+    assert_rb_invariants(tree)
+    tree.difference(RedBlackTree.from_sorted(range(0, 300, 5), order_statistics=True))
+    ordered = sorted(present - set(range(0, 300, 5)))
+    assert_rb_invariants(tree)
+    for probe in range(-1, 302, 3):
+        assert tree.rank(probe) == bisect.bisect_left(ordered, probe)
+        assert tree.count_range(probe, probe + 25) == (
+            bisect.bisect_right(ordered, probe + 25) - bisect.bisect_left(ordered, probe))
+    assert [tree.select(i) for i in range(len(tree))] == ordered
+    assert tree.select(-1) == ordered[-1]
+
+def test_order_statistics_disabled_by_default(rbtree):
+    insert_values(rbtree, [1, 2, 3])
+    with pytest.raises(ValueError):
+        rbtree.select(0)
+
+def test_iterators_and_flights_between():
+    from rbt_flight_manager import FlightManager
+    manager = FlightManager(log_capacity=0)
+    manager.load_flights(range(1000, 1100), presorted=True)
+    assert list(manager.flights_between(1010, 1013)) == [1010, 1011, 1012, 1013]
+    assert list(manager.flights_between(1098, 2000, reverse=True)) == [1099, 1098]
+    assert list(reversed(manager.tree))[:2] == [1099, 1098]
+    assert list(manager.tree.irange(1000, 1003, inclusive=(False, False))) == [1001, 1002]
+    assert [val for val, _ in manager.tree.inorder_traversal()] == list(manager.tree)
+
+def test_cached_height_and_black_height_are_constant_time_reads(rbtree, capsys):
+    insert_values(rbtree, range(1000))
+    assert rbtree.height == rbtree.root.get_height()
+    assert rbtree.get_red_black_tree_height(rbtree.root) == rbtree.height
+    assert rbtree.black_height >= (rbtree.height + 1) // 2
+    for value in range(0, 1000, 2):
+        rbtree.delete(value)
+    assert_rb_invariants(rbtree)
+    rbtree.print_log()
+    out = capsys.readouterr().out
+    assert f"Final Tree Height: {rbtree.height}" in out
+    assert f"Black Height: {rbtree.black_height}" in out
+    for value in range(1, 1000, 2):
+        rbtree.delete(value)
+    assert rbtree.height == -1 and rbtree.black_height == 0
+
+def test_recolors_logged_and_counted_on_both_sides():
+    tree = RedBlackTree(log_capacity=50, stats=True)
+    insert_values(tree, [10, 5, 20, 30])   # Parent 20 is a right child, uncle 5 is red
+    assert any("grandparent 10" in msg for msg in tree.log.messages())
+    insert_values(tree, [1, 3])            # Left side, uncle None: double rotation at 5
+    snapshot = tree.stats.snapshot()
+    assert snapshot["recolorings"] == 1
+    assert snapshot["rotations"]["double"] == 1
+    assert tree.rotation_count == 2
+    assert snapshot["operations"]["insert"]["count"] == 6
+    assert_rb_invariants(tree)
+
+def test_stats_through_deletes():
+    tree = RedBlackTree(stats=True)
+    insert_values(tree, range(100))
+    for value in range(0, 100, 3):
+        tree.delete(value)
+    snapshot = tree.stats.snapshot()
+    delete = snapshot["operations"]["delete"]
+    assert delete["count"] == 34
+    assert delete["nodes_visited"] >= delete["count"]
+    assert tree.rotation_count == snapshot["rotations"]["single"] + 2 * snapshot["rotations"]["double"]
+    assert_rb_invariants(tree)
+
+@pytest.mark.parametrize("rebuild_cost", [1e-9, float("inf"), RedBlackTree.REBUILD_COST])
+def test_insert_many_strategies_agree(rebuild_cost):
+    import random
+    rng = random.Random(18)
+    tree = RedBlackTree.from_sorted(range(0, 2000, 2))
+    tree.REBUILD_COST = rebuild_cost  # Force merge, force sorted inserts, or choose automatically
+    expected = set(tree)
+    for batch in (rng.sample(range(3000), 500), list(range(-100, 0)), [1999]):
+        assert tree.insert_many(batch) == len(set(batch) - expected)
+        expected.update(batch)
+        assert list(tree) == sorted(expected)
+        assert_rb_invariants(tree)
+
+def test_flight_manager_schedule_flights(capsys):
+    from rbt_flight_manager import FlightManager
+    manager = FlightManager()
+    manager.schedule_flight("DL300", {"gate": "A1"})
+    assert manager.schedule_flights([("DL300", None), ("AA100", {"gate": "C2"})], items=True) == 1
+    assert manager.schedule_flights(["UA200", "BA150", "UA200"]) == 2
+    assert list(manager.tree) == ["AA100", "BA150", "DL300", "UA200"]
+    assert manager.get_flight("DL300") == {"gate": "A1"}
+    assert_rb_invariants(manager.tree)
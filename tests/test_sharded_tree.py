@@ -0,0 +1,107 @@
+import random
+
+import pytest
+import sharded_tree
+from sharded_tree import ShardedTree
+
+@pytest.fixture
+def tree():
+    with ShardedTree(shards=3) as sharded:
+        yield sharded
+
+def assert_shard_invariants(tree):
+    """Every key lies in its shard's range, the shard sizes add up and the scan is sorted."""
+    keys = list(tree)
+    assert keys == sorted(set(keys)) and len(keys) == len(tree)
+    assert tree.boundaries == sorted(tree.boundaries) and len(tree.boundaries) < tree.shards
+    for shard, size in enumerate(tree.sizes):
+        lo = tree.boundaries[shard - 1] if shard else None
+        hi = tree.boundaries[shard] if shard < len(tree.boundaries) else None
+        assert sum(1 for key in keys if (lo is None or key >= lo) and (hi is None or key < hi)) == size
+
+def test_load_routes_and_reads(tree):
+    tree.load([(key, str(key)) for key in random.Random(1).sample(range(300), 300)], items=True)
+    assert tree.sizes == [100, 100, 100] and tree.boundaries == [100, 200]
+    assert tree.shard_of(99) == 0 and tree.shard_of(100) == 1
+    assert tree[150] == "150" and tree.get(400, "-") == "-" and 299 in tree
+    assert (tree.min(), tree.max()) == (0, 299)
+    assert list(tree.irange(95, 205, inclusive=(False, True))) == list(range(96, 206))
+    assert list(tree.irange(195, 105, reverse=True)) == []
+    assert list(tree.irange(105, 195, reverse=True)) == list(range(195, 104, -1))
+    assert tree.delete(100) and not tree.delete(100)
+    with pytest.raises(KeyError):
+        del tree[100]
+    assert (tree.floor(100), tree.ceiling(100)) == (99, 101)
+    assert_shard_invariants(tree)
+
+def test_insert_many_and_growth_rebalance(tree):
+    assert tree.insert_many(range(0, 6000, 2)) == 3000  # All into shard 0, then spread out
+    assert tree.boundaries and max(tree.sizes) <= 1000
+    assert tree.insert_many([(1, "one"), (2, "dup")], items=True) == 1
+    assert tree[1] == "one" and tree[2] is None
+    assert_shard_invariants(tree)
+
+def test_rebalance_moves_keys_both_ways():
+    with ShardedTree(shards=4, max_skew=None) as tree:
+        tree.load(range(400))
+        for key in range(100, 300):  # Empty the middle shards
+            tree.delete(key)
+        tree.insert_many(range(400, 1000))  # And overfill the last
+        assert tree.sizes == [100, 0, 0, 700]
+        assert tree.rebalance() > 0
+        assert max(tree.sizes) - min(tree.sizes) <= 1
+        assert_shard_invariants(tree)
+        assert list(tree) == list(range(100)) + list(range(300, 1000))
+
+def test_random_churn_then_rebalance():
+    rng = random.Random(24)
+    with ShardedTree(shards=4, max_skew=None) as tree:
+        expected = set(range(0, 2000, 3))
+        tree.load(expected)
+        for _ in range(6):
+            lo = rng.randrange(2000)
+            doomed = [key for key in expected if lo <= key < lo + rng.randrange(800)]
+            for key in doomed:
+                tree.delete(key)
+            expected.difference_update(doomed)
+            batch = [rng.randrange(3000) for _ in range(rng.randrange(400))]
+            tree.insert_many(batch)
+            expected.update(batch)
+            tree.rebalance()
+            assert_shard_invariants(tree)
+            assert list(tree) == sorted(expected)
+            assert max(tree.sizes) <= -(-len(expected) // 4)
+
+def test_empty_shards_and_bounds(monkeypatch):
+    monkeypatch.setattr(sharded_tree, "MIN_REBALANCE_SIZE", 4)
+    with ShardedTree(shards=4, backend="rbt") as tree:
+        assert tree.min() is None and tree.floor(5) is None and list(tree) == []
+        for key in [5, 1, 9, 3, 7, 11, 13]:
+            assert tree.insert(key)
+        assert not tree.insert(5)
+        assert len(tree.boundaries) > 0
+        assert (tree.floor(0), tree.floor(6), tree.ceiling(12), tree.ceiling(14)) == (None, 5, 13, None)
+        assert_shard_invariants(tree)
+
+@pytest.mark.parametrize("backend", ["avl", "array", "bplus", "persistent"])
+def test_worker_scans_do_not_look_keys_up_again(monkeypatch, backend):
+    tree_class = sharded_tree.get_backend(backend)
+    tree = tree_class.from_sorted([(key, str(key)) for key in range(20)], True)
+    monkeypatch.setattr(tree_class, "get", lambda *args: pytest.fail("payload looked up per key"))
+    tree, entries = sharded_tree._range(tree, 5, 8, (True, False), True)
+    assert entries == [(7, "7"), (6, "6"), (5, "5")]
+    tree, (entries, low) = sharded_tree._take(tree, 3, True)
+    assert entries == [(17, "17"), (18, "18"), (19, "19")] and low == 0 and len(tree) == 17
+
+def test_worker_errors_reach_the_caller(tree):
+    tree.insert(1)
+    with pytest.raises(TypeError):
+        tree.insert("one")
+    assert 1 in tree  # The workers keep serving after an error
+    tree.close()
+    with pytest.raises(ValueError):
+        tree.get(1)
+    with pytest.raises(ValueError):
+        ShardedTree(shards=0)
+    with pytest.raises(ValueError):
+        ShardedTree(backend="missing")
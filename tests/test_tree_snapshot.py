@@ -0,0 +1,106 @@
+import random
+
+import pytest
+from AVLTree import AVLTree
+from RedBlackTree import RedBlackTree
+from avl_array_tree import ArrayAVLTree
+from avl_inventory_manager import InventoryManager
+from rbt_flight_manager import FlightManager
+from tests.test_avl_tree import assert_avl_invariants
+from tests.test_rbtree import assert_rb_invariants
+from tree_snapshot import MappedIndex, load_snapshot, save_snapshot
+
+def shape(node):
+    if node is None:
+        return None
+    return (node.value, getattr(node, "red", None), node.height, shape(node.left), shape(node.right))
+
+def churned(tree_class, count=2000):
+    tree = tree_class()
+    rng = random.Random(16)
+    for key in rng.sample(range(100000), count):
+        tree.insert(key)
+    for key in rng.sample(list(tree), count // 3):
+        tree.delete(key)
+    return tree
+
+@pytest.mark.parametrize("tree_class, check", [(AVLTree, assert_avl_invariants),
+                                               (RedBlackTree, assert_rb_invariants)])
+def test_round_trip_restores_exact_shape(tmp_path, tree_class, check):
+    tree = churned(tree_class)
+    path = tmp_path / "tree.bin"
+    assert save_snapshot(tree, path) == len(tree)
+    loaded = load_snapshot(path, order_statistics=True)
+    assert type(loaded) is tree_class
+    assert shape(loaded.root) == shape(tree.root)
+    assert loaded.rotation_count == 0
+    check(loaded)
+    assert loaded.select(-1) == tree.max()
+
+def test_other_tree_types_get_a_balanced_build(tmp_path):
+    path = tmp_path / "tree.bin"
+    save_snapshot(churned(RedBlackTree), path)
+    avl = load_snapshot(path, AVLTree)
+    assert_avl_invariants(avl)
+    save_snapshot(ArrayAVLTree.from_sorted(range(100)), path)  # Keys only
+    assert_rb_invariants(load_snapshot(path, RedBlackTree))
+    assert list(load_snapshot(path, ArrayAVLTree)) == list(range(100))
+
+@pytest.mark.parametrize("tree_class, check", [(AVLTree, assert_avl_invariants),
+                                               (RedBlackTree, assert_rb_invariants)])
+def test_load_with_key_function(tmp_path, tree_class, check):
+    path = tmp_path / "flights.bin"
+    save_snapshot(tree_class.from_unsorted(["aa2", "BA1", "Aa1", "ba3"]), path)
+    loaded = load_snapshot(path, tree_class, key=str.lower, order_statistics=True)
+    assert list(loaded) == ["Aa1", "aa2", "BA1", "ba3"] and "AA2" in loaded
+    assert loaded.select(1) == "aa2"
+    check(loaded)
+    with pytest.raises(TypeError):
+        save_snapshot(loaded, path)
+
+def test_string_keys_and_mapped_index(tmp_path):
+    flights = ["UA120", "AA100", "LH300", "DL250", "ÉZ999"]
+    path = tmp_path / "flights.bin"
+    save_snapshot(RedBlackTree.from_unsorted(flights), path)
+    with MappedIndex(path) as index:
+        assert list(index) == sorted(flights)
+        assert "LH300" in index and "LH301" not in index
+        assert (index.floor("C"), index.ceiling("C")) == ("AA100", "DL250")
+        assert list(index.irange("B", "M", reverse=True)) == ["LH300", "DL250"]
+        assert index.rank("LH300") == 2 and index.select(-1) == "ÉZ999"
+
+def test_mapped_index_int_queries(tmp_path):
+    path = tmp_path / "ids.bin"
+    save_snapshot(AVLTree.from_sorted(range(0, 100, 5)), path)
+    index = MappedIndex(path)
+    assert len(index) == 20 and (index.min(), index.max()) == (0, 95)
+    assert list(index.irange(10, 30, inclusive=(False, True))) == [15, 20, 25, 30]
+    with pytest.raises(IndexError):
+        index.select(20)
+    index.close()
+
+def test_corrupt_and_foreign_files_are_rejected(tmp_path):
+    path = tmp_path / "tree.bin"
+    save_snapshot(AVLTree.from_sorted(range(50)), path)
+    data = bytearray(path.read_bytes())
+    data[40] ^= 1
+    path.write_bytes(bytes(data))
+    with pytest.raises(ValueError, match="checksum"):
+        load_snapshot(path)
+    path.write_bytes(b'{"not": "a snapshot"} padding padding')
+    with pytest.raises(ValueError):
+        MappedIndex(path)
+    with pytest.raises(TypeError):
+        save_snapshot(AVLTree.from_sorted([1.5, 2.5]), tmp_path / "floats.bin")
+
+def test_managers_round_trip(tmp_path, capsys):
+    inventory = InventoryManager()
+    inventory.load_items(range(30))
+    inventory.save_snapshot(tmp_path / "inventory.bin")
+    for backend in ("avl", "array", "persistent"):
+        restored = InventoryManager.from_snapshot(tmp_path / "inventory.bin", backend=backend)
+        assert list(restored.avl_tree) == list(range(30))
+    flights = FlightManager()
+    flights.load_flights(["AA100", "BA200", "DL300"])
+    flights.save_snapshot(tmp_path / "flights.bin")
+    assert list(FlightManager.from_snapshot(tmp_path / "flights.bin").tree) == ["AA100", "BA200", "DL300"]
@@ -0,0 +1,360 @@
+# Created by: Michael Jung (ID:10680322), Timothy Sanders (ID: 01002147), Megan Ng (ID: 00756276)
+
+# Date: 10/18/26
+
+# Course: Spr25_CS_034 CRN 39575
+
+#--------------------------------------------------------------------------------------------
+"""Compact binary snapshots of a tree's keys, loaded through `mmap`.
+
+File layout (little-endian):
+
+    header   32 bytes: magic b"BSTS", format version, key kind, flags, key count,
+             body length and the CRC-32 of the body
+    keys     int keys: `count` int64 values in ascending order
+             str keys: `count + 1` uint64 offsets into the UTF-8 blob, then the blob
+    metadata optional, one byte per key in the same order: the node's height in the low
+             seven bits and, for Red-Black trees, the red bit in the high bit
+
+Only keys are stored (payloads are arbitrary Python objects). The heights pin down the exact
+shape of the saved tree: in in-order, every subtree root is taller than anything else in its
+subtree. `load_snapshot` uses them to relink the same tree in O(n) with no comparisons or
+rotations; without them (or for another tree type) it does an O(n) balanced `from_sorted`
+build. `MappedIndex` answers sorted-set queries straight from the mapped file.
+"""
+import gc
+import mmap
+import struct
+import sys
+import zlib
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import Any, Iterator, Tuple
+
+from AVLTree import AVLTree
+from RedBlackTree import RedBlackTree
+from bst_tree import BinarySearchTree
+
+MAGIC = b"BSTS"
+FORMAT_VERSION = 1
+HEADER = struct.Struct("<4sBBBxQQI4x")  # magic, version, key kind, flags, count, body length, crc
+
+KEY_INT = 0  # int64 keys
+KEY_STR = 1  # UTF-8 string keys with an offset table
+
+FLAG_HEIGHTS = 1  # Metadata column present
+FLAG_COLORS = 2   # Metadata column carries Red-Black colors
+
+HEIGHT_MASK = 0x7F
+RED_BIT = 0x80
+
+
+def _little_endian(column: array) -> array:
+    if sys.byteorder == "big":
+        column.byteswap()
+    return column
+
+
+def _node_entries(tree) -> Iterator[Tuple[Any, Any]]:
+    """Yields `(key, node)` in order; node is None when the tree has no node objects."""
+    if hasattr(tree, "_iter_nodes"):
+        return ((node.value, node) for node in tree._iter_nodes())
+    return ((key, None) for key in tree)
+
+
+def save_snapshot(tree, filename: str, metadata: bool=True) -> int:
+    """Writes the tree's keys (and node heights/colors) to a binary snapshot file.
+
+    The tree is walked once, in order, and the file is written sequentially.
+
+    Args:
+        tree: Any tree of this package (AVL, Red-Black, array-backed or persistent).
+        filename: Path of the snapshot file.
+        metadata: Store per-node heights (and colors) so the exact shape can be restored.
+            Trees without node objects (ArrayAVLTree) are always saved without them.
+
+    Returns:
+        int: The number of keys written.
+
+    Raises:
+        TypeError: If the keys are not all ints or all strings, or the tree orders them with `key=`.
+    """
+    if getattr(tree, "key", None) is not None:
+        raise TypeError("trees with a key function cannot be snapshotted; the key function is not stored")
+    ints, offsets, blob, heights = array("q"), array("Q", [0]), bytearray(), bytearray()
+    kind, colors = None, False
+    for key, node in _node_entries(tree):
+        if kind is None:
+            kind = KEY_STR if isinstance(key, str) else KEY_INT
+            colors = hasattr(node, "red")
+        if kind == KEY_STR:
+            if not isinstance(key, str):
+                raise TypeError("snapshot keys must be all ints or all strings")
+            blob += key.encode("utf-8")
+            offsets.append(len(blob))
+        else:
+            if not isinstance(key, int):
+                raise TypeError("snapshot keys must be all ints or all strings")
+            ints.append(key)
+        if metadata and node is not None:
+            heights.append(node.height | (RED_BIT if colors and node.red else 0))
+    kind = KEY_INT if kind is None else kind
+    count = len(ints) if kind == KEY_INT else len(offsets) - 1
+    body = [_little_endian(ints)] if kind == KEY_INT else [_little_endian(offsets), blob]
+    flags = 0
+    if count and len(heights) == count:
+        flags = FLAG_HEIGHTS | (FLAG_COLORS if colors else 0)
+        body.append(heights)
+    crc = 0
+    for part in body:
+        crc = zlib.crc32(part, crc)
+    length = sum(memoryview(part).nbytes for part in body)
+    with open(filename, "wb") as f:
+        f.write(HEADER.pack(MAGIC, FORMAT_VERSION, kind, flags, count, length, crc))
+        for part in body:
+            f.write(part)
+    return count
+
+
+class _MappedStrings:
+    """Read-only sequence of the string keys in a mapped snapshot (decoded on access)."""
+    def __init__(self, offsets, blob):
+        self._offsets = offsets
+        self._blob = blob
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def __getitem__(self, index: int) -> str:
+        if index < 0:
+            index += len(self)
+        return str(self._blob[self._offsets[index]:self._offsets[index + 1]], "utf-8")
+
+    def release(self) -> None:
+        self._offsets.release()
+        self._blob.release()
+
+
+def _int_view(buffer: memoryview):
+    """int64 view of little-endian data (a byteswapped copy on big-endian hosts)."""
+    if sys.byteorder == "little":
+        return buffer.cast("q")
+    column = array("q", bytes(buffer))
+    column.byteswap()
+    return memoryview(column)
+
+
+def _uint_view(buffer: memoryview):
+    if sys.byteorder == "little":
+        return buffer.cast("Q")
+    column = array("Q", bytes(buffer))
+    column.byteswap()
+    return memoryview(column)
+
+
+class _Snapshot:
+    """A mapped snapshot file with its header checked and its columns exposed as views."""
+    def __init__(self, filename: str, verify: bool=True):
+        with open(filename, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            self._parse(filename, verify)
+        except Exception:
+            self._map.close()
+            raise
+
+    def _parse(self, filename: str, verify: bool) -> None:
+        data = memoryview(self._map)
+        if len(data) < HEADER.size:
+            data.release()
+            raise ValueError(f"{filename} is too short to be a tree snapshot")
+        magic, version, kind, flags, count, length, crc = HEADER.unpack_from(data)
+        body = data[HEADER.size:]
+        data.release()
+        if magic != MAGIC or version != FORMAT_VERSION or kind not in (KEY_INT, KEY_STR):
+            body.release()
+            raise ValueError(f"{filename} is not a version {FORMAT_VERSION} tree snapshot")
+        if len(body) != length or (verify and zlib.crc32(body) != crc):
+            body.release()
+            raise ValueError(f"{filename} is truncated or corrupt (checksum mismatch)")
+        self.count, self.flags = count, flags
+        if kind == KEY_INT:
+            end = 8 * count
+            self.keys = _int_view(body[:end])
+        else:
+            end = 8 * (count + 1)
+            offsets = _uint_view(body[:end])
+            blob_end = end + offsets[-1]
+            self.keys = _MappedStrings(offsets, body[end:blob_end])
+            end = blob_end
+        self.heights = body[end:end + count] if flags & FLAG_HEIGHTS else None
+        self._body = body
+
+    def close(self) -> None:
+        self.keys.release()
+        if self.heights is not None:
+            self.heights.release()
+        self._body.release()
+        self._map.close()
+
+
+def _relink(tree: BinarySearchTree, keys, heights, colors: bool):
+    """Rebuilds the saved shape from in-order keys and node heights in O(n).
+
+    A stack holds the right spine of the tree built so far. Each new key takes the last
+    spine node shorter than it as its left child and hangs under the remaining top.
+    """
+    spine, built = [], []
+    for index, key in enumerate(keys):
+        meta = heights[index]
+        node = tree._new_node(key, None)
+        node.height = meta & HEIGHT_MASK
+        if colors:
+            node.red = bool(meta & RED_BIT)
+        child = None
+        while spine and spine[-1].height < node.height:
+            child = spine.pop()
+        node.left = child
+        if child:
+            child.parent = node
+        if spine:
+            spine[-1].right = node
+            node.parent = spine[-1]
+        spine.append(node)
+        built.append(node)
+    if tree.order_statistics and spine:  # Children are always lower: pull sizes level by level
+        levels = [[] for _ in range(spine[0].height + 1)]
+        for node in built:
+            levels[node.height].append(node)
+        for level in levels:
+            for node in level:
+                tree._pull_size(node)
+    return spine[0] if spine else None
+
+
+def load_snapshot(filename: str, tree_class=None, verify: bool=True, **kwargs):
+    """Loads a snapshot file into a new tree.
+
+    The saved shape (heights and colors) is restored exactly when `tree_class` matches the kind
+    of tree that was saved (AVLTree for heights only, RedBlackTree for heights and colors);
+    otherwise the keys go through the class's O(n) `from_sorted` build. No rotations run.
+    With `key=`, the saved order and shape do not apply, so the keys are re-sorted by the
+    key function and built with `from_unsorted`.
+
+    Args:
+        filename: Path of a file written by `save_snapshot`.
+        tree_class: The tree type to build. Defaults to the type that was saved
+            (RedBlackTree if colors were stored, AVLTree otherwise).
+        verify: Check the body's CRC-32 before using it.
+        **kwargs: Passed to the tree constructor (e.g. `log_capacity`, `order_statistics`, `key`).
+
+    Raises:
+        ValueError: If the file is not a snapshot, or is truncated or corrupt.
+    """
+    snapshot = _Snapshot(filename, verify)
+    try:
+        colors = bool(snapshot.flags & FLAG_COLORS)
+        if tree_class is None:
+            tree_class = RedBlackTree if colors else AVLTree
+        keys = snapshot.keys.tolist() if isinstance(snapshot.keys, memoryview) else list(snapshot.keys)
+        saved_class = RedBlackTree if colors else AVLTree
+        if kwargs.get("key") is not None:  # Keys were saved in their own order, not key order
+            return tree_class.from_unsorted(keys, **kwargs)
+        if snapshot.heights is None or not issubclass(tree_class, saved_class):
+            return tree_class.from_sorted(keys, **kwargs)
+        tree = tree_class(**kwargs)
+        collecting = gc.isenabled()  # As in from_sorted: every new node stays reachable
+        gc.disable()
+        try:
+            tree._adopt(_relink(tree, keys, snapshot.heights, colors), len(keys))
+        finally:
+            if collecting:
+                gc.enable()
+        return tree
+    finally:
+        snapshot.close()
+
+
+class MappedIndex:
+    """Read-only sorted set served directly from a memory-mapped snapshot file.
+
+    Keys are read from the mapping on demand (binary search over the key column), so opening an
+    index costs O(1) memory beyond the mapping itself, plus one checksum pass when `verify` is on.
+    Close the index (or use it as a context manager) to release the mapping.
+
+    Args:
+        filename: Path of a file written by `save_snapshot`.
+        verify: Check the body's CRC-32 when opening.
+    """
+    def __init__(self, filename: str, verify: bool=True):
+        self._snapshot = _Snapshot(filename, verify)
+        self._keys = self._snapshot.keys
+
+    def close(self) -> None:
+        """Releases the mapping; the index cannot be used afterwards."""
+        if self._snapshot is not None:
+            self._snapshot.close()
+            self._snapshot = self._keys = None
+
+    def __enter__(self) -> 'MappedIndex':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __contains__(self, key: Any) -> bool:
+        keys = self._keys
+        index = bisect_left(keys, key)
+        return index < len(keys) and keys[index] == key
+
+    def __iter__(self) -> Iterator[Any]:
+        keys = self._keys
+        return (keys[index] for index in range(len(keys)))
+
+    def __reversed__(self) -> Iterator[Any]:
+        keys = self._keys
+        return (keys[index] for index in range(len(keys) - 1, -1, -1))
+
+    def min(self) -> Any:
+        """Returns the smallest key, or None if the index is empty."""
+        return self._keys[0] if len(self._keys) else None
+
+    def max(self) -> Any:
+        """Returns the largest key, or None if the index is empty."""
+        return self._keys[-1] if len(self._keys) else None
+
+    def floor(self, key: Any) -> Any:
+        """Returns the largest key less than or equal to `key`, or None if there is none."""
+        index = bisect_right(self._keys, key)
+        return self._keys[index - 1] if index else None
+
+    def ceiling(self, key: Any) -> Any:
+        """Returns the smallest key greater than or equal to `key`, or None if there is none."""
+        index = bisect_left(self._keys, key)
+        return self._keys[index] if index < len(self._keys) else None
+
+    def rank(self, key: Any) -> int:
+        """Returns the number of keys strictly less than `key`."""
+        return bisect_left(self._keys, key)
+
+    def select(self, index: int) -> Any:
+        """Returns the key at position `index` in sorted order (negative indexes count from the end).
+
+        Raises:
+            IndexError: If `index` is out of range.
+        """
+        if not -len(self._keys) <= index < len(self._keys):
+            raise IndexError("select index out of range")
+        return self._keys[index]
+
+    def irange(self, lo: Any=None, hi: Any=None, inclusive: Tuple[bool, bool]=(True, True),
+               reverse: bool=False) -> Iterator[Any]:
+        """Lazily yields the keys between `lo` and `hi` (see BinarySearchTree.irange)."""
+        keys = self._keys
+        start = 0 if lo is None else (bisect_left if inclusive[0] else bisect_right)(keys, lo)
+        stop = len(keys) if hi is None else (bisect_right if inclusive[1] else bisect_left)(keys, hi)
+        positions = range(stop - 1, start - 1, -1) if reverse else range(start, stop)
+        return (keys[index] for index in positions)
@@ -0,0 +1,144 @@
+# Created by: Michael Jung (ID:10680322), Timothy Sanders (ID: 01002147), Megan Ng (ID: 00756276)
+
+# Date: 10/18/26
+
+# Course: Spr25_CS_034 CRN 39575
+
+#--------------------------------------------------------------------------------------------
+from collections import Counter
+from functools import wraps
+from time import perf_counter_ns
+from typing import Any, Callable, Dict
+
+# Operations with their own counters and latency histogram
+OPERATIONS = ("insert", "delete", "lookup")
+
+
+class TreeStats:
+    """Opt-in counters for the tree hot paths, exported as a plain dict by `snapshot()`.
+
+    Trees created with `stats=True` route insert, delete and lookups through this object.
+    Per operation it counts calls, nodes visited, key comparisons and latency (in a
+    power-of-two nanosecond histogram). Across operations it counts single and double
+    rotations, recolorings and the depth of every rebalancing retrace.
+
+    Attributes:
+        operations (dict): Per-operation counters, keyed by "insert", "delete" and "lookup"
+        rotations (dict): Counts of "single" and "double" rotations
+        recolorings (int): Red-Black recolor steps (insert uncle flips, delete sibling flips)
+        retrace_depths (Counter): How many retraces climbed each number of levels
+    """
+    def __init__(self):
+        self.reset()
+
+    def reset(self) -> None:
+        """Zeroes every counter."""
+        self.operations = {op: {"count": 0, "nodes_visited": 0, "comparisons": 0, "total_ns": 0,
+                                "latency_ns": Counter()} for op in OPERATIONS}
+        self.rotations = {"single": 0, "double": 0}
+        self.recolorings = 0
+        self.retrace_depths = Counter()
+        self._active = None  # Operation currently being timed
+        self._visited = self._comparisons = 0  # Scratch counters of the current operation
+
+    # --- Operation timing ---
+    def _finish(self, op: str, elapsed_ns: int) -> None:
+        counters = self.operations[op]
+        counters["count"] += 1
+        counters["nodes_visited"] += self._visited
+        counters["comparisons"] += self._comparisons
+        counters["total_ns"] += elapsed_ns
+        counters["latency_ns"][1 << elapsed_ns.bit_length()] += 1  # Bucket: next power of two
+
+    def wrap(self, op: str, method: Callable) -> Callable:
+        """Returns `method` wrapped to time it and attribute its descents to `op`."""
+        @wraps(method)
+        def timed(*args, **kwargs):
+            if self._active is not None:  # Nested call: the outer operation owns the counts
+                return method(*args, **kwargs)
+            self._active, self._visited, self._comparisons = op, 0, 0
+            started = perf_counter_ns()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                self._finish(op, perf_counter_ns() - started)
+                self._active = None
+        return timed
+
+    # --- Descents ---
+    def find(self, root: Any, key: Any) -> Any:
+        """Counted version of BinarySearchTree._find_node.
+
+        Called on its own (get, `in`, `[]`) it is timed as a lookup; inside an insert or
+        delete its counts go to that operation.
+        """
+        standalone = self._active is None
+        if standalone:
+            self._visited = self._comparisons = 0
+            started = perf_counter_ns()
+        visited = 0
+        current, candidate = root, None
+        while current:
+            visited += 1
+            if key < current.value:
+                current = current.left
+            else:
+                candidate, current = current, current.right
+        found = candidate is not None and not candidate.value < key
+        self._visited += visited
+        self._comparisons += visited + (candidate is not None)  # One per level, one equality check
+        if standalone:
+            self._finish("lookup", perf_counter_ns() - started)
+        return candidate if found else None
+
+    def descent(self, node: Any, checked: bool) -> None:
+        """Counts an insertion descent after the fact from the path ending at `node`.
+
+        Before any rebalancing, `node` and its ancestors are exactly the nodes the descent
+        compared against, with one `<` each; the duplicate check at the bottom costs one more.
+
+        Args:
+            node: The last node the descent visited (the new leaf's parent, or a duplicate's
+                leaf-level neighbour).
+            checked: Whether the descent ended with an equality check (it turned right at least once).
+        """
+        visited = 0
+        while node:
+            visited += 1
+            node = node.parent
+        self._visited += visited
+        self._comparisons += visited + checked
+
+    # --- Rebalancing events ---
+    def rotation(self, double: bool) -> None:
+        """Records a single rotation or a double (two-step) rotation."""
+        self.rotations["double" if double else "single"] += 1
+
+    def recolor(self) -> None:
+        self.recolorings += 1
+
+    def retrace(self, depth: int) -> None:
+        """Records how many levels one rebalancing walk climbed."""
+        self.retrace_depths[depth] += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Returns a JSON-friendly copy of all counters.
+
+        Returns:
+            dict: `operations` (per-op count, nodes_visited, comparisons, total_ns and
+            latency_ns histogram mapping bucket upper bounds to counts), `rotations`,
+            `recolorings` and `retrace` (count, total_depth, max_depth and a depth histogram).
+        """
+        depths = self.retrace_depths
+        return {
+            "operations": {op: {**counters, "latency_ns": dict(sorted(counters["latency_ns"].items()))}
+                           for op, counters in self.operations.items()},
+            "rotations": dict(self.rotations),
+            "recolorings": self.recolorings,
+            "retrace": {
+                "count": sum(depths.values()),
+                "total_depth": sum(depth * count for depth, count in depths.items()),
+                "max_depth": max(depths, default=0),
+                "depths": dict(sorted(depths.items())),
+            },
+        }